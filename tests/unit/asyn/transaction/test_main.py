@@ -6,14 +6,32 @@ submit sinks stubbed. Fee arithmetic and the sponsor/signer count threading are
 covered separately in ``test_sponsor_fee.py``.
 """
 
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, Mock, patch
 
-from xrpl.asyncio.transaction.main import autofill_and_sign, sign_and_submit
+from xrpl.asyncio.transaction.main import (
+    asign_many,
+    autofill_and_sign,
+    sign,
+    sign_and_submit,
+    sign_many,
+)
+from xrpl.models.transactions import Payment
+from xrpl.wallet import Wallet
 
 _MODULE = "xrpl.asyncio.transaction.main"
 
 
+def _sign_slowly(transactions, multisign):
+    time.sleep(2)
+    return transactions
+
+
 class TestSignAndSubmit(IsolatedAsyncioTestCase):
     async def test_autofill_path_delegates_then_submits(self):
         """autofill=True routes through autofill_and_sign, then submits."""
@@ -122,3 +140,66 @@ class TestAutofillAndSign(IsolatedAsyncioTestCase):
 
         self.assertEqual(check_fee.await_args.kwargs["sponsor_signers_count"], 3)
         self.assertEqual(autofill.await_args.kwargs["sponsor_signers_count"], 3)
+
+
+class TestSignMany(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.wallet = Wallet.from_seed("sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r")
+        self.transactions = [
+            Payment(
+                account=self.wallet.address,
+                amount=str(drops),
+                destination="rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+                fee="10",
+                sequence=drops,
+            )
+            for drops in range(1, 8)
+        ]
+        self.expected = [sign(tx, self.wallet) for tx in self.transactions]
+
+    def test_sign_many_matches_sign(self):
+        self.assertEqual(sign_many(self.transactions, self.wallet), self.expected)
+        self.assertEqual(sign_many([], self.wallet, workers=2), [])
+
+    def test_sign_many_in_processes(self):
+        self.assertEqual(
+            sign_many(iter(self.transactions), self.wallet, workers=3), self.expected
+        )
+        self.assertEqual(
+            sign_many(self.transactions, self.wallet, multisign=True, workers=2),
+            [sign(tx, self.wallet, multisign=True) for tx in self.transactions],
+        )
+
+    def test_sign_many_in_spawned_processes(self):
+        # spawned workers get their arguments pickled, and the wallet has already
+        # signed, so its signer holds backend key objects
+        self.wallet.get_signer()
+        spawn = partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+        with patch(f"{_MODULE}.ProcessPoolExecutor", new=spawn):
+            self.assertEqual(
+                sign_many(self.transactions, self.wallet, workers=2), self.expected
+            )
+
+    async def test_asign_many(self):
+        self.assertEqual(
+            await asign_many(self.transactions, self.wallet), self.expected
+        )
+        self.assertEqual(
+            await asign_many(self.transactions, self.wallet, workers=2),
+            self.expected,
+        )
+
+    async def test_asign_many_cancelled(self):
+        with patch(f"{_MODULE}._sign_in_worker", new=_sign_slowly):
+            task = asyncio.create_task(
+                asign_many(self.transactions, self.wallet, workers=2)
+            )
+            await asyncio.sleep(0.5)  # the workers are signing
+            start = time.perf_counter()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # the event loop did not wait for the workers
+            self.assertLess(time.perf_counter() - start, 1)
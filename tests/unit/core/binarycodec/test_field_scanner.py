@@ -0,0 +1,145 @@
+import json
+import os
+from unittest import TestCase
+
+from xrpl.core.binarycodec import (
+    XRPLBinaryCodecException,
+    decode,
+    encode,
+    read_field,
+    scan_fields,
+    scan_fields_many,
+)
+from xrpl.core.binarycodec.field_scanner import get_field_ordinal
+
+ACCOUNT = "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ"
+DESTINATION = "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh"
+ISSUER = "rPEPPER7kfTD9w2To4CQk6UCfuHM9c6GDY"
+
+PAYMENT = {
+    "Account": ACCOUNT,
+    "Amount": {"currency": "USD", "issuer": ISSUER, "value": "1.5"},
+    "Destination": DESTINATION,
+    "Fee": "10",
+    "Flags": 0,
+    "Memos": [{"Memo": {"MemoData": "AB" * 200}}],
+    "Paths": [
+        [{"account": ISSUER}, {"currency": "EUR", "issuer": ISSUER}],
+        [{"currency": "XRP"}],
+    ],
+    "SendMax": "1000000",
+    "Sequence": 1,
+    "TransactionType": "Payment",
+}
+
+BRIDGE = {
+    "Account": ACCOUNT,
+    "Amount": "1000000",
+    "Destination": DESTINATION,
+    "Fee": "10",
+    "Sequence": 1,
+    "SignatureReward": "100",
+    "TransactionType": "XChainAccountCreateCommit",
+    "XChainBridge": {
+        "IssuingChainDoor": DESTINATION,
+        "IssuingChainIssue": {"currency": "USD", "issuer": ISSUER},
+        "LockingChainDoor": ACCOUNT,
+        "LockingChainIssue": {"currency": "XRP"},
+    },
+}
+
+AMM = {
+    "Account": ACCOUNT,
+    "Amount": {"mpt_issuance_id": "00000001" + "AB" * 20, "value": "100"},
+    "Asset": {"mpt_issuance_id": "00000001" + "AB" * 20},
+    "Asset2": {"currency": "XRP"},
+    "Fee": "10",
+    "Flags": 0,
+    "Sequence": 1,
+    "TransactionType": "AMMDeposit",
+}
+
+VAULT = {
+    "Account": ACCOUNT,
+    "AssetsTotal": "1234.5",
+    "Flags": 0,
+    "LedgerEntryType": "Vault",
+    "MaximumAmount": "1000",
+    "ShareMPTID": "00000001" + "AB" * 20,
+}
+
+FIXTURES_PATH = os.path.join(
+    os.path.dirname(__file__), "fixtures", "data", "codec-fixtures.json"
+)
+
+
+class TestFieldScanner(TestCase):
+    def _assert_scan_matches_decode(self, blob):
+        decoded = decode(blob)
+        triples = scan_fields(blob)
+        self.assertEqual(
+            [ordinal for ordinal, _, _ in triples],
+            [get_field_ordinal(name) for name in decoded],
+        )
+        for (_, offset, length), (name, value) in zip(triples, decoded.items()):
+            self.assertEqual(read_field(blob, offset, length, name), value)
+
+    def test_field_types(self):
+        for tx_json in [PAYMENT, BRIDGE, AMM, VAULT]:
+            with self.subTest(tx_json["Account"]):
+                self._assert_scan_matches_decode(encode(tx_json))
+
+    def test_codec_fixtures(self):
+        with open(FIXTURES_PATH) as fixtures_file:
+            fixtures = json.load(fixtures_file)
+        for fixture in fixtures["accountState"] + fixtures["transactions"]:
+            self._assert_scan_matches_decode(fixture["binary"])
+
+    def test_offsets(self):
+        blob = bytes.fromhex(encode(PAYMENT))
+        triples = scan_fields(blob)
+        ordinals = [ordinal for ordinal, _, _ in triples]
+
+        _, offset, length = triples[ordinals.index(get_field_ordinal("Sequence"))]
+        self.assertEqual(blob[offset : offset + length], (1).to_bytes(4, "big"))
+
+        # variable-length values exclude the length prefix
+        _, offset, length = triples[ordinals.index(get_field_ordinal("Account"))]
+        self.assertEqual(length, 20)
+        self.assertEqual(blob[offset - 1], 20)
+
+        # arrays include their end marker
+        _, offset, length = triples[ordinals.index(get_field_ordinal("Memos"))]
+        self.assertEqual(blob[offset + length - 1], 0xF1)
+
+    def test_scan_fields_many(self):
+        blobs = [encode(PAYMENT), bytes.fromhex(encode(BRIDGE)), encode(VAULT)]
+        index = scan_fields_many(blobs)
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.ordinals.typecode, "I")
+        for blob_number, blob in enumerate(blobs):
+            self.assertEqual(index.fields(blob_number), scan_fields(blob))
+
+        self.assertEqual(list(index.with_field("Destination")), [0, 1])
+        self.assertEqual(list(index.with_field("Account")), [0, 1, 2])
+        self.assertEqual(list(index.with_field("Paths")), [0])
+        self.assertIsNone(index.find(2, "Destination"))
+
+        offset, length = index.find(1, "SignatureReward")
+        self.assertEqual(read_field(blobs[1], offset, length, "SignatureReward"), "100")
+
+    def test_scan_fields_many_empty(self):
+        index = scan_fields_many([])
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index.with_field("Account")), [])
+
+    def test_truncated_blob(self):
+        blob = encode(PAYMENT)
+        with self.assertRaises(XRPLBinaryCodecException):
+            scan_fields(blob[:-10])
+
+    def test_unknown_field(self):
+        # STArray field with nth 255
+        with self.assertRaises(XRPLBinaryCodecException):
+            scan_fields("F0FF")
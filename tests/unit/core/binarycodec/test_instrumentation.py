@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from xrpl.core.binarycodec import decode, encode, instrumentation
+from xrpl.core.binarycodec.types import AccountID, STObject
+
+TX_JSON = {
+    "Account": "r9LqNeG6qHxjeUocjvVki2XR35weJ9mZgQ",
+    "Amount": "1000",
+    "Destination": "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+    "Fee": "10",
+    "Flags": 2147483648,
+    "Sequence": 1,
+    "TransactionType": "Payment",
+}
+
+
+class TestInstrumentation(TestCase):
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(instrumentation.is_enabled())
+        original = STObject.__dict__["from_value"]
+        encode(TX_JSON)
+        self.assertIs(STObject.__dict__["from_value"], original)
+        self.assertEqual(instrumentation.snapshot()["types"], {})
+
+    def test_instrument_context_manager(self):
+        original = AccountID.__dict__["to_json"]
+        with instrumentation.instrument() as stats:
+            self.assertTrue(instrumentation.is_enabled())
+            decode(encode(TX_JSON))
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertIs(AccountID.__dict__["to_json"], original)
+
+        st_object = stats["types"]["STObject"]
+        self.assertEqual(st_object["from_value"]["calls"], 1)
+        self.assertEqual(st_object["from_parser"]["calls"], 1)
+        self.assertEqual(st_object["to_json"]["calls"], 1)
+        self.assertEqual(
+            st_object["from_value"]["bytes"], len(bytes.fromhex(encode(TX_JSON)))
+        )
+        self.assertGreaterEqual(st_object["from_value"]["seconds"], 0)
+        self.assertEqual(stats["types"]["AccountID"]["from_value"]["calls"], 2)
+        self.assertEqual(stats["types"]["AccountID"]["to_json"]["calls"], 2)
+
+        cache = stats["caches"]["field_instance"]
+        self.assertGreater(cache["hits"], 0)
+        self.assertLessEqual(cache["hit_rate"], 1)
+
+    def test_enable_disable_and_reset(self):
+        instrumentation.enable()
+        instrumentation.enable()
+        encode(TX_JSON)
+        instrumentation.disable()
+        encode(TX_JSON)
+        snapshot = instrumentation.snapshot()
+        self.assertEqual(snapshot["types"]["STObject"]["from_value"]["calls"], 1)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot()["types"], {})
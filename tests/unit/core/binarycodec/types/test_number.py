@@ -135,3 +135,84 @@ class TestNumber(unittest.TestCase):
             Number.from_value(str(_MAX_REP) + "5").to_json(),
             "922337203685477581e2",
         )
+
+    def test_addition_and_subtraction(self):
+        self.assertEqual(
+            (Number.from_value("1.5") + Number.from_value("2.25")).to_json(), "3.75"
+        )
+        self.assertEqual(
+            (Number.from_value("1") - Number.from_value("0.0001")).to_json(), "0.9999"
+        )
+        self.assertEqual((Number.from_value("-4e34") + 1).to_json(), "-4e34")
+        self.assertEqual((1 - Number.from_value("0.5")).to_json(), "0.5")
+        self.assertEqual(
+            (Number.from_value("123.456") - Number.from_value("123.456")).to_json(),
+            "0",
+        )
+        self.assertEqual(
+            (Number.from_value("1e30000") + Number.from_value("1e-30000")).to_json(),
+            "1e30000",
+        )
+
+    def test_multiplication_and_division(self):
+        self.assertEqual(
+            (Number.from_value("-7") * Number.from_value("1e-5")).to_json(),
+            "-0.00007",
+        )
+        self.assertEqual((Number.from_value("0") * 5).to_json(), "0")
+        self.assertEqual(
+            (Number.from_value("1") / Number.from_value("3")).to_json(),
+            "0.3333333333333333333",
+        )
+        self.assertEqual(
+            (Number.from_value("2") / 3).to_json(), "0.6666666666666666667"
+        )
+        self.assertEqual((10 / Number.from_value("4")).to_json(), "2.5")
+
+        with self.assertRaises(XRPLBinaryCodecException):
+            Number.from_value("1") / Number.from_value("0")
+
+        with self.assertRaises(XRPLBinaryCodecException):
+            Number.from_value("1e32000") * Number.from_value("1e32000")
+
+        self.assertEqual(
+            (Number.from_value("1e-32000") * Number.from_value("1e-32000")).to_json(),
+            "0",
+        )
+
+    def test_arithmetic_rounding(self):
+        # ties are rounded to an even mantissa
+        self.assertEqual(
+            (
+                Number.from_value("1000000000000000000") + Number.from_value("0.5")
+            ).to_json(),
+            "1000000000000000000",
+        )
+        self.assertEqual(
+            (
+                Number.from_value("1000000000000000001") + Number.from_value("0.5")
+            ).to_json(),
+            "1000000000000000002",
+        )
+        # results that do not fit in an int64 mantissa lose one more digit
+        self.assertEqual(
+            (Number.from_value(str(_MAX_REP)) + 1).to_json(), "9223372036854775810"
+        )
+
+    def test_comparison(self):
+        self.assertEqual(Number.from_value("10"), 10)
+        self.assertEqual(hash(Number.from_value("10")), hash(10))
+        self.assertEqual(
+            Number.from_value("0.1") + Number.from_value("0.2"),
+            Number.from_value("0.3"),
+        )
+        self.assertEqual(
+            hash(Number.from_value("1.50")),
+            hash(Number.from_mantissa_exponent(15, -1)),
+        )
+        self.assertLess(Number.from_value("-1e40"), Number.from_value("1e-40"))
+        self.assertGreater(Number.from_value("1.5"), 1)
+        self.assertLessEqual(Number.from_value("0"), Number.from_value("0"))
+        self.assertEqual(-Number.from_value("2.5"), Number.from_value("-2.5"))
+        self.assertEqual(abs(Number.from_value("-2.5")), Number.from_value("2.5"))
+        self.assertNotEqual(Number.from_value("1"), "1")
@@ -0,0 +1,102 @@
+from unittest import TestCase
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core import keypairs
+from xrpl.core.keypairs import backends
+from xrpl.core.keypairs.ed25519 import ED25519
+from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+from xrpl.core.keypairs.secp256k1 import SECP256K1
+
+_SEEDS = {
+    CryptoAlgorithm.ED25519: "sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r",
+    CryptoAlgorithm.SECP256K1: "sp5fghtJtpUorTwvof1NpDXAzNwf5",
+}
+_MESSAGE = b"a message of some length " * 10
+
+
+class _BrokenED25519(ED25519):
+    @classmethod
+    def sign(cls, message, private_key):
+        return bytes(64)
+
+
+class TestBackends(TestCase):
+    def tearDown(self):
+        for algorithm in CryptoAlgorithm:
+            backends.set_backend(algorithm, None)
+
+    def test_ecpy_always_available(self):
+        self.assertIn("ecpy", backends.available_backends(CryptoAlgorithm.ED25519))
+        self.assertIn("ecpy", backends.available_backends(CryptoAlgorithm.SECP256K1))
+        self.assertIs(
+            backends.load_backend(CryptoAlgorithm.SECP256K1, "ecpy"), SECP256K1
+        )
+
+    def test_backends_are_byte_identical(self):
+        for algorithm, seed in _SEEDS.items():
+            reference_keys = None
+            reference_signature = None
+            for name in backends.available_backends(algorithm):
+                with self.subTest(algorithm=algorithm, backend=name):
+                    backends.set_backend(algorithm, name)
+                    public, private = keypairs.derive_keypair(seed)
+                    signature = keypairs.sign(_MESSAGE, private)
+                    if reference_keys is None:
+                        reference_keys = (public, private)
+                        reference_signature = signature
+                    self.assertEqual((public, private), reference_keys)
+                    self.assertEqual(signature, reference_signature)
+                    self.assertTrue(
+                        keypairs.is_valid_message(
+                            _MESSAGE, bytes.fromhex(signature), public
+                        )
+                    )
+                    self.assertFalse(
+                        keypairs.is_valid_message(
+                            _MESSAGE[1:], bytes.fromhex(signature), public
+                        )
+                    )
+
+    def test_set_backend(self):
+        backends.set_backend(CryptoAlgorithm.ED25519, "ecpy")
+        self.assertIs(backends.get_backend(CryptoAlgorithm.ED25519), ED25519)
+        backends.set_backend(CryptoAlgorithm.ED25519, None)
+        self.assertEqual(
+            backends.get_backend(CryptoAlgorithm.ED25519),
+            backends.load_backend(
+                CryptoAlgorithm.ED25519,
+                backends.available_backends(CryptoAlgorithm.ED25519)[0],
+            ),
+        )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(XRPLKeypairsException):
+            backends.set_backend(CryptoAlgorithm.SECP256K1, "pycryptodome")
+
+    def test_register_backend(self):
+        def _load_missing():
+            raise ImportError("not installed")
+
+        registry = list(backends._REGISTRY[CryptoAlgorithm.ED25519])
+        try:
+            backends.register_backend(
+                CryptoAlgorithm.ED25519, "missing", _load_missing, preferred=True
+            )
+            backends.register_backend(
+                CryptoAlgorithm.ED25519, "broken", lambda: _BrokenED25519, True
+            )
+            available = backends.available_backends(CryptoAlgorithm.ED25519)
+            self.assertNotIn("missing", available)
+            # backends that do not reproduce the known signatures are never used
+            self.assertNotIn("broken", available)
+            self.assertIsNot(
+                backends.get_backend(CryptoAlgorithm.ED25519), _BrokenED25519
+            )
+
+            backends.register_backend(CryptoAlgorithm.ED25519, "ecpy2", lambda: ED25519)
+            self.assertEqual(
+                backends.available_backends(CryptoAlgorithm.ED25519)[-1], "ecpy2"
+            )
+        finally:
+            backends._REGISTRY[CryptoAlgorithm.ED25519][:] = registry
+            backends.set_backend(CryptoAlgorithm.ED25519, None)
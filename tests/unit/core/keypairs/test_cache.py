@@ -0,0 +1,71 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core import keypairs
+from xrpl.core.keypairs import cache
+
+_SEED = "sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r"
+
+
+class TestCache(TestCase):
+    def tearDown(self):
+        cache.disable()
+
+    def test_disabled_by_default(self):
+        self.assertFalse(cache.is_enabled())
+        keypairs.derive_keypair(_SEED)
+        self.assertIsNone(cache._keypairs)
+
+    def test_derive_keypair_cached(self):
+        expected = keypairs.derive_keypair(_SEED)
+        cache.enable()
+        with patch(
+            "xrpl.core.keypairs.main.addresscodec.decode_seed",
+            wraps=keypairs.main.addresscodec.decode_seed,
+        ) as decode_seed:
+            self.assertEqual(keypairs.derive_keypair(_SEED), expected)
+            self.assertEqual(keypairs.derive_keypair(_SEED), expected)
+        decode_seed.assert_called_once()
+        # the validator flag and algorithm are part of the key
+        self.assertEqual(
+            keypairs.derive_keypair(_SEED, algorithm=CryptoAlgorithm.ED25519),
+            expected,
+        )
+        self.assertEqual(len(cache._keypairs), 2)
+
+    def test_derive_classic_address_cached(self):
+        public_key, _ = keypairs.derive_keypair(_SEED)
+        expected = keypairs.derive_classic_address(public_key)
+        cache.enable()
+        with patch(
+            "xrpl.core.keypairs.main.get_account_id",
+            wraps=keypairs.main.get_account_id,
+        ) as get_account_id:
+            self.assertEqual(keypairs.derive_classic_address(public_key), expected)
+            self.assertEqual(keypairs.derive_classic_address(public_key), expected)
+        get_account_id.assert_called_once()
+
+    def test_bounded(self):
+        cache.enable(maxsize=2)
+        seeds = [keypairs.generate_seed() for _ in range(3)]
+        for seed in seeds:
+            keypairs.derive_keypair(seed)
+        self.assertEqual(len(cache._keypairs), 2)
+        self.assertIsNone(cache._get_keypair(seeds[0], False, None))
+        self.assertIsNotNone(cache._get_keypair(seeds[2], False, None))
+
+    def test_clear_and_repr(self):
+        cache.enable()
+        _, private_key = keypairs.derive_keypair(_SEED)
+        self.assertNotIn(private_key, repr(cache._keypairs))
+        self.assertNotIn(_SEED, repr(cache._keypairs))
+        cache.clear()
+        self.assertTrue(cache.is_enabled())
+        self.assertEqual(len(cache._keypairs), 0)
+        cache.disable()
+        self.assertFalse(cache.is_enabled())
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            cache.enable(maxsize=0)
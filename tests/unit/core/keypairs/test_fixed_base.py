@@ -0,0 +1,33 @@
+from random import Random
+from unittest import TestCase
+
+from xrpl.core.keypairs import fixed_base
+
+_RANDOM = Random(20251019)
+
+
+class TestFixedBase(TestCase):
+    def test_secp256k1_matches_ecpy(self):
+        curve = fixed_base._SECP256K1
+        scalars = [1, 2, 3, 255, 256, 257, curve.order - 1] + [
+            _RANDOM.randrange(1, curve.order) for _ in range(50)
+        ]
+        for scalar in scalars:
+            with self.subTest(scalar=scalar):
+                self.assertEqual(
+                    fixed_base.secp256k1_mul_generator(scalar),
+                    scalar * curve.generator,
+                )
+
+    def test_ed25519_matches_ecpy(self):
+        curve = fixed_base._ED25519
+        # clamped Ed25519 scalars are larger than the order of the base point
+        scalars = [1, 2, 255, 256, curve.order - 1, curve.order + 1, 2**255 - 1] + [
+            _RANDOM.randrange(1, 2**255) for _ in range(50)
+        ]
+        for scalar in scalars:
+            with self.subTest(scalar=scalar):
+                self.assertEqual(
+                    fixed_base.ed25519_mul_generator(scalar),
+                    scalar * curve.generator,
+                )
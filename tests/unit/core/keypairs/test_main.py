@@ -4,6 +4,7 @@ from unittest.mock import patch
 from xrpl.constants import CryptoAlgorithm
 from xrpl.core import keypairs
 from xrpl.core.addresscodec.exceptions import XRPLAddressCodecException
+from xrpl.core.keypairs import backends
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
 
 _DUMMY_HEX = "0102030405060708090a0b0c0d0e0f10"
@@ -223,3 +224,32 @@ class TestMain(TestCase):
             "030D58EB48B4420B1F7B9DF55087E0E29FEF0E8468F9A6825B01CA2C361042D435",
         )
         self.assertFalse(output)
+
+    def test_verify_many(self):
+        items = []
+        expected = []
+        for seed in (
+            "sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r",
+            "sp5fghtJtpUorTwvof1NpDXAzNwf5",
+        ):
+            public, private = keypairs.derive_keypair(seed)
+            for message in (b"", b"test message", b"another message"):
+                signature = bytes.fromhex(keypairs.sign(message, private))
+                items.append((message, signature, public))
+                expected.append(True)
+                items.append((message + b"!", signature, public))
+                expected.append(False)
+            items.append((b"test message", b"\x30\x00", public))
+            expected.append(False)
+        # a public key that is not a point on the curve
+        items.append((b"test message", items[0][1], "ED" + "FF" * 32))
+        expected.append(False)
+
+        for algorithm in CryptoAlgorithm:
+            for name in backends.available_backends(algorithm):
+                with self.subTest(algorithm=algorithm, backend=name):
+                    backends.set_backend(algorithm, name)
+                    self.assertEqual(keypairs.verify_many(items), expected)
+            backends.set_backend(algorithm, None)
+        self.assertEqual(keypairs.verify_many(iter(items), workers=2), expected)
+        self.assertEqual(keypairs.verify_many([]), [])
@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core import keypairs
+from xrpl.core.keypairs import Signer, backends
+
+_SEEDS = {
+    CryptoAlgorithm.ED25519: "sEdSKaCy2JT7JaM7v95H9SxkhP9wS2r",
+    CryptoAlgorithm.SECP256K1: "sp5fghtJtpUorTwvof1NpDXAzNwf5",
+}
+_MESSAGES = [b"", b"test message", bytes(range(256)) * 4]
+
+
+class TestSigner(TestCase):
+    def tearDown(self):
+        for algorithm in CryptoAlgorithm:
+            backends.set_backend(algorithm, None)
+
+    def test_matches_sign(self):
+        for algorithm, seed in _SEEDS.items():
+            public, private = keypairs.derive_keypair(seed)
+            for name in backends.available_backends(algorithm):
+                with self.subTest(algorithm=algorithm, backend=name):
+                    backends.set_backend(algorithm, name)
+                    signer = Signer(private)
+                    self.assertEqual(signer.algorithm, algorithm)
+                    signatures = signer.sign_many(_MESSAGES)
+                    self.assertEqual(
+                        signatures,
+                        [keypairs.sign(message, private) for message in _MESSAGES],
+                    )
+                    for message, signature in zip(_MESSAGES, signatures):
+                        self.assertTrue(
+                            keypairs.is_valid_message(
+                                message, bytes.fromhex(signature), public
+                            )
+                        )
+
+    def test_sign_hex(self):
+        _, private = keypairs.derive_keypair(_SEEDS[CryptoAlgorithm.ED25519])
+        signer = Signer(private)
+        self.assertEqual(signer.sign("0A0B"), signer.sign(b"\x0a\x0b"))
+
+    def test_repr_hides_private_key(self):
+        _, private = keypairs.derive_keypair(_SEEDS[CryptoAlgorithm.SECP256K1])
+        self.assertNotIn(private, repr(Signer(private)))
@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from xrpl.models.exceptions import XRPLModelException
-from xrpl.models.requests import Fee, GenericRequest, Request
+from xrpl.models.requests import AccountTx, Fee, GenericRequest, Request
 from xrpl.models.requests.request import _DEFAULT_API_VERSION
 
 
@@ -17,6 +17,12 @@ class TestRequest(TestCase):
         expected = {**req, "api_version": _DEFAULT_API_VERSION}
         self.assertDictEqual(req, expected)
 
+    def test_get_method(self):
+        for _ in range(2):
+            self.assertIs(Request.get_method("account_tx"), AccountTx)
+            self.assertIs(Request.get_method("fee"), Fee)
+            self.assertIs(Request.get_method("validator_list_sites"), GenericRequest)
+
     def test_from_dict(self):
         req = {"method": "account_tx", "account": "rN6zcSynkRnf8zcgTVrRL8K7r4ovE7J4Zj"}
         obj = Request.from_dict(req)
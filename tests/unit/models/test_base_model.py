@@ -1,18 +1,32 @@
 import json
 import os
-from dataclasses import dataclass
+import weakref
+from dataclasses import FrozenInstanceError, dataclass
+from typing import get_type_hints
 from unittest import TestCase
+from unittest.mock import patch
 
 from typing_extensions import Self
 
-from xrpl.models import XRPLModelException
-from xrpl.models.amounts import IssuedCurrencyAmount
-from xrpl.models.base_model import BaseModel
+from xrpl.core.binarycodec.definitions import definitions
+from xrpl.models import XRPLModelException, trusted_construction
+from xrpl.models.amounts import IssuedCurrencyAmount, MPTAmount
+from xrpl.models.base_model import (
+    _KEY_CACHE_SIZE,
+    BaseModel,
+    _cached_convert_key_to_json,
+    _convert_key_to_json,
+    _convert_key_to_tx_json,
+    _get_type_check,
+    _key_to_json,
+    _key_to_tx_json,
+)
 from xrpl.models.currencies import XRP, IssuedCurrency
 from xrpl.models.requests import (
     AccountChannels,
     BookOffers,
     ChannelAuthorize,
+    GenericRequest,
     PathFind,
     PathFindSubcommand,
     PathStep,
@@ -23,7 +37,7 @@ from xrpl.models.requests import (
     SubmitMultisigned,
     SubmitOnly,
 )
-from xrpl.models.requests.request import _DEFAULT_API_VERSION
+from xrpl.models.requests.request import _DEFAULT_API_VERSION, RequestMethod
 from xrpl.models.transactions import (
     AccountSet,
     AccountSetAsfFlag,
@@ -41,6 +55,7 @@ from xrpl.models.transactions import (
     XChainClaim,
 )
 from xrpl.models.transactions.transaction import Transaction
+from xrpl.models.transactions.types import TransactionType
 from xrpl.models.xchain_bridge import XChainBridge
 
 currency = "BTC"
@@ -138,6 +153,183 @@ class TestBaseModel(TestCase):
             ),
         )
 
+    def test_type_hints_resolved_once_per_class(self):
+        payment_dict = {
+            "account": "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1",
+            "amount": amount_dict,
+            "destination": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+            "memos": [{"memo_data": "ABCD"}],
+        }
+        Payment.from_dict(payment_dict)  # warm up
+        with patch("xrpl.models.base_model.get_type_hints", side_effect=AssertionError):
+            payment = Payment.from_dict(payment_dict)
+            self.assertTrue(payment.is_valid())
+            self.assertTrue(
+                IssuedCurrencyAmount.is_dict_of_model(payment.amount.to_dict())
+            )
+
+    def test_compiled_type_checks_match_check_type(self):
+        model_instance = IssuedCurrencyAmount.from_dict(amount_dict)
+        values = [
+            None,
+            1,
+            True,
+            "Payment",
+            "blah",
+            "subscribe",
+            TransactionType.PAYMENT,
+            PathFindSubcommand.CREATE,
+            ["1"],
+            [[], [{}]],
+            {"flag": True},
+            [1, 2],
+            amount_dict,
+            IssuedCurrencyAmount.from_dict(amount_dict),
+            [Memo(memo_data="ABCD")],
+            [{"memo": {"memo_data": "ABCD"}}],
+        ]
+        for model in (Payment, PathFind, XChainAddAccountCreateAttestation):
+            for attr, expected_type in get_type_hints(model).items():
+                for field_value in values:
+                    with self.subTest(model=model, attr=attr, value=field_value):
+                        self.assertEqual(
+                            _get_type_check(expected_type)(field_value),
+                            not model_instance._check_type(
+                                attr, field_value, expected_type
+                            ),
+                        )
+
+    def test_trusted_construction(self):
+        tx_json = {
+            "Account": account,
+            "Amount": value,
+            "Destination": account,  # invalid: same sender and destination
+            "Memos": [{"Memo": {}}],  # invalid: an empty memo
+            "TransactionType": "Payment",
+        }
+        with self.assertRaises(XRPLModelException):
+            Transaction.from_xrpl(tx_json)
+
+        with trusted_construction():
+            payment = Transaction.from_xrpl(tx_json)
+            self.assertIsInstance(payment, Payment)
+            self.assertIsInstance(payment.memos[0], Memo)
+            self.assertFalse(payment.is_valid())
+            with self.assertRaises(XRPLModelException):
+                payment.validate()
+            # structural errors are still raised
+            with self.assertRaises(XRPLModelException):
+                Payment.from_dict({"unknown_field": 1})
+
+        with self.assertRaises(XRPLModelException):
+            Transaction.from_xrpl(tx_json)
+
+    def test_key_conversion(self):
+        keys = [*definitions._FIELD_INFO_MAP, "UnknownKey", "mpt_issuance_id"]
+        for key in keys:
+            with self.subTest(key=key):
+                try:
+                    expected = _convert_key_to_json(key)
+                except XRPLModelException:
+                    self.assertRaises(XRPLModelException, _key_to_json, key)
+                    continue
+                self.assertEqual(_key_to_json(key), expected)
+                self.assertEqual(
+                    _key_to_tx_json(expected), _convert_key_to_tx_json(expected)
+                )
+        for key in get_type_hints(XChainAddAccountCreateAttestation):
+            self.assertEqual(_key_to_tx_json(key), _convert_key_to_tx_json(key))
+
+        # other keys are cached, up to a bound
+        for i in range(_KEY_CACHE_SIZE + 10):
+            self.assertEqual(_key_to_json(f"Key{i}X"), f"key{i}_x")
+        self.assertEqual(
+            _cached_convert_key_to_json.cache_info().currsize, _KEY_CACHE_SIZE
+        )
+
+    def test_slots(self):
+        payment = Payment.from_dict(
+            {
+                "account": account,
+                "amount": amount_dict,
+                "destination": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+                "memos": [{"memo_data": "ABCD"}],
+            }
+        )
+        for model in (
+            payment,
+            payment.amount,
+            payment.memos[0],
+            AccountChannels(account=account),
+        ):
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, "__dict__"))
+                self.assertIs(weakref.ref(model)(), model)
+                # methods calling super() and the frozen __setattr__ work on the
+                # slotted copy of the class made by @dataclass
+                self.assertEqual(type(model).from_dict(model.to_dict()), model)
+                with self.assertRaises(FrozenInstanceError):
+                    model.unknown_field = 1
+
+    def test_subclass_without_slots(self):
+        # a model defined outside the library, with a plain @dataclass
+        @dataclass(frozen=True, kw_only=True)
+        class NotedPayment(Payment):
+            note: str = "note"
+
+        @dataclass(frozen=True, kw_only=True)
+        class NotedAccountChannels(AccountChannels):
+            note: str = "note"
+
+        payment = NotedPayment(
+            account=account,
+            amount=value,
+            destination="rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+        )
+        self.assertTrue(payment.is_valid())
+        self.assertEqual(payment.transaction_type, TransactionType.PAYMENT)
+        self.assertEqual(payment.to_dict()["transaction_type"], "Payment")
+        self.assertEqual(payment.note, "note")
+        self.assertEqual(
+            NotedAccountChannels(account=account).method,
+            RequestMethod.ACCOUNT_CHANNELS,
+        )
+        # the defaults are not left on the slotted classes
+        self.assertNotIn("transaction_type", Payment.__dict__)
+
+    def test_eq_and_hash(self):
+        def payment(**kwargs):
+            return Payment(
+                **{
+                    "account": account,
+                    "amount": IssuedCurrencyAmount.from_dict(amount_dict),
+                    "destination": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+                    "memos": [Memo(memo_data="ABCD"), Memo(memo_type="AB")],
+                    "flags": {"TF_NO_RIPPLE_DIRECT": True},
+                    **kwargs,
+                }
+            )
+
+        first, second = payment(), payment()
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, payment(sequence=1))
+        self.assertNotEqual(first, payment(memos=[Memo(memo_data="ABCD")]))
+        self.assertNotEqual(first, payment(flags=0))
+        self.assertEqual({first: "payment"}[second], "payment")
+        self.assertNotEqual(first, first.to_dict())
+        self.assertNotEqual(
+            Transaction.from_dict(first.to_dict()),
+            Transaction(account=account, transaction_type=TransactionType.PAYMENT),
+        )
+
+        first = GenericRequest(method="ledger_data", limit=5, marker=[1, 2])
+        second = GenericRequest(method="ledger_data", limit=5, marker=[1, 2])
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, GenericRequest(method="ledger_data", limit=6))
+
     def test_bad_type(self):
         transaction_dict = {
             "account": 1,
@@ -589,6 +781,37 @@ class TestFromDict(TestCase):
         }
         self.assertEqual(PathFind.from_dict(path_find_dict), PathFind(**path_find_dict))
 
+    def test_union_of_models(self):
+        mpt_amount_dict = {"mpt_issuance_id": "0" * 48, "value": "10"}
+        cases = [
+            (amount_dict, IssuedCurrencyAmount),
+            (mpt_amount_dict, MPTAmount),
+            (value, str),
+        ]
+        for amount, expected_type in cases:
+            with self.subTest(amount=amount):
+                payment = Payment.from_dict(
+                    {
+                        "account": account,
+                        "amount": amount,
+                        "destination": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+                    }
+                )
+                self.assertIsInstance(payment.amount, expected_type)
+                self.assertEqual(payment.to_dict()["amount"], amount)
+
+    def test_union_error(self):
+        with self.assertRaises(XRPLModelException) as e:
+            Payment.from_dict(
+                {"account": account, "amount": 100, "destination": destination}
+            )
+        self.assertEqual(
+            e.exception.args[0],
+            "amount expected a typing.Union[xrpl.models.amounts.issued_currency_amount"
+            ".IssuedCurrencyAmount, xrpl.models.amounts.mpt_amount.MPTAmount, str], "
+            "received a <class 'int'>",
+        )
+
 
 class TestFromXrpl(TestCase):
     def test_from_xrpl(self):
@@ -1,11 +1,27 @@
+import pickle
 from unittest import TestCase
+from unittest.mock import patch
 
 from xrpl.asyncio.transaction.main import sign
 from xrpl.core.addresscodec.main import classic_address_to_xaddress
+from xrpl.core.binarycodec import encode
+from xrpl.core.binarycodec.definitions import get_field_instance
+from xrpl.models.amounts import IssuedCurrencyAmount
 from xrpl.models.exceptions import XRPLModelException
-from xrpl.models.transactions import AccountSet, DepositPreauth, OfferCreate, Payment
-from xrpl.models.transactions.transaction import Transaction
-from xrpl.models.transactions.types.transaction_type import TransactionType
+from xrpl.models.transactions import (
+    AccountSet,
+    Batch,
+    DepositPreauth,
+    Memo,
+    OfferCreate,
+    Payment,
+)
+from xrpl.models.transactions.pseudo_transactions import EnableAmendment
+from xrpl.models.transactions.transaction import (
+    Transaction,
+    transaction_json_to_binary_codec_form,
+)
+from xrpl.models.transactions.types import PseudoTransactionType, TransactionType
 from xrpl.transaction.multisign import multisign
 from xrpl.utils.str_conversions import str_to_hex
 from xrpl.wallet import Wallet
@@ -91,6 +107,150 @@ class TestTransaction(TestCase):
         value = tx.to_dict()["flags"]
         self.assertEqual(value, expected_flags)
 
+    def test_to_xrpl_canonical_order(self):
+        tx = Payment(
+            account=_ACCOUNT,
+            fee="10",
+            sequence=_SEQUENCE,
+            amount=IssuedCurrencyAmount(currency="USD", issuer=_ACCOUNT, value="1"),
+            destination="rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+            memos=[Memo(memo_data=EXAMPLE_DOMAIN)],
+            flags=[0b1, 0b10],
+        )
+        tx_json = tx.to_xrpl()
+        expected = transaction_json_to_binary_codec_form(tx.to_dict())
+        self.assertEqual(tx_json, expected)
+        self.assertEqual(
+            list(tx_json),
+            sorted(tx_json, key=lambda key: get_field_instance(key).ordinal),
+        )
+        self.assertEqual(tx_json["Flags"], 0b11)
+        self.assertEqual(tx.blob(), encode(expected))
+
+    def test_cached_values(self):
+        tx = sign(
+            Payment(
+                account=_WALLET.address,
+                fee="10",
+                sequence=_SEQUENCE,
+                amount=IssuedCurrencyAmount(currency="USD", issuer=_ACCOUNT, value="1"),
+                destination=_ACCOUNT,
+                memos=[Memo(memo_data=EXAMPLE_DOMAIN)],
+                flags={"TF_NO_RIPPLE_DIRECT": True},
+            ),
+            _WALLET,
+        )
+        blob = tx.blob()
+        self.assertEqual(blob, encode(tx.to_xrpl()))
+        self.assertIs(tx.blob(), blob)
+        self.assertIs(tx.get_hash(), tx.get_hash())
+
+        # to_xrpl returns a new copy that the caller may change
+        tx_json = tx.to_xrpl()
+        self.assertIsNot(tx.to_xrpl(), tx_json)
+        tx_json["Memos"][0]["Memo"]["MemoData"] = "00"
+        tx_json["Fee"] = "20"
+        self.assertEqual(tx.to_xrpl()["Memos"][0]["Memo"]["MemoData"], EXAMPLE_DOMAIN)
+        self.assertEqual(tx.to_xrpl()["Fee"], "10")
+
+        # the cache is not part of the model
+        self.assertEqual(tx, Payment.from_xrpl(tx.to_xrpl()))
+        self.assertEqual(hash(tx), hash(Payment.from_xrpl(tx.to_xrpl())))
+        copy = pickle.loads(pickle.dumps(tx))
+        self.assertEqual(copy, tx)
+        self.assertEqual(copy.blob(), blob)
+
+        with patch(
+            "xrpl.models.transactions.transaction.check_false_flag_definition"
+        ) as check_flags:
+            unsigned = Payment(
+                account=_ACCOUNT,
+                amount="1000000",
+                destination=_WALLET.address,
+                flags={"TF_NO_RIPPLE_DIRECT": True},
+            )
+            for _ in range(3):
+                self.assertEqual(unsigned.to_dict()["flags"], 0x00010000)
+            check_flags.assert_called_once()
+
+    def test_cached_values_after_in_place_change(self):
+        tx = Payment(
+            account=_WALLET.address,
+            fee="10",
+            sequence=_SEQUENCE,
+            amount="1000000",
+            destination=_ACCOUNT,
+            memos=[Memo(memo_data=EXAMPLE_DOMAIN)],
+            flags={"TF_NO_RIPPLE_DIRECT": True},
+            txn_signature="ABCD",
+        )
+        blob = tx.blob()
+        tx_hash = tx.get_hash()
+
+        # the models are frozen, but the lists and dictionaries in them are not
+        tx.memos.append(Memo(memo_data="ABCD"))
+        self.assertEqual(len(tx.to_xrpl()["Memos"]), 2)
+        self.assertEqual(tx.blob(), encode(tx.to_xrpl()))
+        self.assertNotEqual(tx.blob(), blob)
+        self.assertNotEqual(tx.get_hash(), tx_hash)
+
+        blob = tx.blob()
+        tx.flags["TF_LIMIT_QUALITY"] = True
+        self.assertEqual(tx.to_xrpl()["Flags"], 0x00050000)
+        self.assertEqual(tx.blob(), encode(tx.to_xrpl()))
+        self.assertNotEqual(tx.blob(), blob)
+
+        # and the values are kept again until the next change
+        self.assertIs(tx.blob(), tx.blob())
+
+    def test_cached_values_after_in_place_change_of_nested_transaction(self):
+        inner = Payment(
+            account=_ACCOUNT,
+            amount="1000000",
+            destination=_WALLET.address,
+            fee="0",
+            sequence=_SEQUENCE,
+            flags=0x40000000,  # tfInnerBatchTxn
+            signing_pub_key="",
+            memos=[],
+        )
+        batch = sign(
+            Batch(
+                account=_ACCOUNT,
+                fee="10",
+                sequence=_SEQUENCE,
+                raw_transactions=[inner, inner],
+                flags=0x00010000,  # tfAllOrNothing
+            ),
+            _WALLET,
+        )
+        blob = batch.blob()
+        batch.raw_transactions[1].memos.append(Memo(memo_data=EXAMPLE_DOMAIN))
+        self.assertNotEqual(batch.blob(), blob)
+        self.assertEqual(batch.blob(), encode(batch.to_xrpl()))
+
+    def test_get_transaction_type(self):
+        for transaction_type in [*TransactionType, *PseudoTransactionType]:
+            with self.subTest(transaction_type=transaction_type):
+                transaction_class = Transaction.get_transaction_type(
+                    transaction_type.value
+                )
+                self.assertEqual(transaction_class.__name__, transaction_type.value)
+                self.assertIs(
+                    Transaction.get_transaction_type(transaction_type),
+                    transaction_class,
+                )
+        self.assertIs(Transaction.get_transaction_type("Payment"), Payment)
+        self.assertIs(
+            Transaction.get_transaction_type("EnableAmendment"), EnableAmendment
+        )
+        for _ in range(2):
+            with self.assertRaises(XRPLModelException) as err:
+                Transaction.get_transaction_type("NotATransaction")
+            self.assertEqual(
+                err.exception.args[0], "NotATransaction is not a valid Transaction type"
+            )
+
     def test_to_dict_ticket_sequence(self):
         tx = Transaction(
             account=_ACCOUNT,
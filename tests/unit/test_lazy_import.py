@@ -0,0 +1,97 @@
+import subprocess
+import sys
+from importlib import import_module
+from typing import Dict
+from unittest import TestCase
+
+import xrpl
+import xrpl.asyncio
+import xrpl.wallet
+from xrpl.models import requests, transactions
+from xrpl.models.transactions import pseudo_transactions
+
+_LAZY_PACKAGES = [
+    xrpl,
+    xrpl.asyncio,
+    xrpl.models,
+    requests,
+    transactions,
+    pseudo_transactions,
+    xrpl.wallet,
+]
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Imports ``module`` in a new interpreter and returns the cumulative import
+    time of each module it loaded, in microseconds, from ``python -X importtime``.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    times = {}
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImport(TestCase):
+    def test_exports(self):
+        for package in _LAZY_PACKAGES:
+            for name in package.__all__:
+                with self.subTest(package=package.__name__, name=name):
+                    self.assertIsNotNone(getattr(package, name))
+                    self.assertIn(name, dir(package))
+            with self.assertRaises(AttributeError):
+                package.NotAModel
+
+    def test_exports_match_modules(self):
+        self.assertIs(
+            xrpl.models.Payment,
+            import_module("xrpl.models.transactions.payment").Payment,
+        )
+        self.assertIs(
+            transactions.AuthAccount,
+            import_module("xrpl.models.transactions.amm_bid").AuthAccount,
+        )
+        self.assertIs(
+            xrpl.wallet.XRPLFaucetException, xrpl.asyncio.wallet.XRPLFaucetException
+        )
+
+    def test_submodules(self):
+        # in a new interpreter, so that no submodule is imported yet
+        script = "\n".join(
+            [
+                "import importlib, pkgutil",
+                "import xrpl",
+                "xrpl.models.transactions.payment.Payment",
+                "import xrpl.models",
+                "xrpl.models.transactions.types.TransactionType",
+                "import xrpl.models.requests as requests",
+                "requests.account_info.AccountInfo",
+                f"for name in {[package.__name__ for package in _LAZY_PACKAGES]}:",
+                "    package = importlib.import_module(name)",
+                "    for submodule in pkgutil.iter_modules(package.__path__):",
+                "        module = getattr(package, submodule.name)",
+                "        assert module.__name__ == f'{name}.{submodule.name}', module",
+            ]
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_import_time(self):
+        times = _import_times("xrpl.models")
+        # the transaction and request models, and the binary codec they use, are
+        # only imported when a model is used
+        for module in (
+            "xrpl.core.binarycodec",
+            "xrpl.models.transactions.payment",
+            "xrpl.models.requests.account_tx",
+        ):
+            self.assertNotIn(module, times.keys(), f"{times['xrpl.models']} us")
+
+        times = _import_times("xrpl.wallet")
+        for module in ("httpx", "xrpl.asyncio.clients", "xrpl.models.requests.sign"):
+            self.assertNotIn(module, times.keys(), f"{times['xrpl.wallet']} us")
@@ -0,0 +1,152 @@
+from unittest import TestCase
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core.binarycodec import decode, encode, encode_for_signing, scan_fields
+from xrpl.models.transactions import Batch, Memo, Payment
+from xrpl.transaction import (
+    combine_batch_signers,
+    multisign,
+    sign,
+    sign_multiaccount_batch,
+    verify_transaction_signatures,
+)
+from xrpl.transaction.verify_signatures import _get_signing_body
+from xrpl.wallet import Wallet
+
+ed_wallet = Wallet.from_seed(
+    "spkcsko6Ag3RbCSVXV2FJ8Pd4Zac1", algorithm=CryptoAlgorithm.ED25519
+)
+secp_wallet = Wallet.from_seed(
+    "spkcsko6Ag3RbCSVXV2FJ8Pd4Zac1", algorithm=CryptoAlgorithm.SECP256K1
+)
+submit_wallet = Wallet.from_seed(
+    "sEd7HmQFsoyj5TAm6d98gytM9LJA1MF", algorithm=CryptoAlgorithm.ED25519
+)
+regkey_wallet = Wallet.from_seed(
+    "sEdStM1pngFcLQqVfH3RQcg2Qr6ov9e", algorithm=CryptoAlgorithm.ED25519
+)
+
+payment = Payment(
+    account=submit_wallet.address,
+    amount="1000000",
+    destination=regkey_wallet.address,
+    fee="12",
+    sequence=16,
+    last_ledger_sequence=100,
+    memos=[Memo(memo_data="ABCD")],
+)
+batch = Batch.from_xrpl(
+    {
+        "Account": submit_wallet.address,
+        "Fee": "40",
+        "Flags": 1,
+        "RawTransactions": [
+            {
+                "RawTransaction": {
+                    "Account": ed_wallet.address,
+                    "Amount": "5000000",
+                    "Flags": 1073741824,
+                    "Destination": secp_wallet.address,
+                    "Fee": "0",
+                    "Sequence": 215,
+                    "SigningPubKey": "",
+                    "TransactionType": "Payment",
+                },
+            },
+            {
+                "RawTransaction": {
+                    "Account": secp_wallet.address,
+                    "Amount": "1000000",
+                    "Flags": 1073741824,
+                    "Destination": submit_wallet.address,
+                    "Fee": "0",
+                    "Sequence": 470,
+                    "SigningPubKey": "",
+                    "TransactionType": "Payment",
+                },
+            },
+        ],
+        "Sequence": 0,
+        "TicketSequence": 12,
+        "TransactionType": "Batch",
+    }
+)
+
+
+def _tamper(tx_blob: str) -> str:
+    tx_json = decode(tx_blob)
+    tx_json["Sequence"] += 1
+    return encode(tx_json)
+
+
+class TestVerifyTransactionSignatures(TestCase):
+    def test_single_signed(self):
+        for wallet in (ed_wallet, secp_wallet):
+            with self.subTest(algorithm=wallet.algorithm):
+                tx = Payment.from_dict({**payment.to_dict(), "account": wallet.address})
+                tx_blob = sign(tx, wallet).blob()
+                self.assertTrue(verify_transaction_signatures(tx_blob))
+                self.assertFalse(verify_transaction_signatures(_tamper(tx_blob)))
+
+    def test_wrong_key(self):
+        signed = sign(payment, submit_wallet).to_xrpl()
+        signed["SigningPubKey"] = ed_wallet.public_key
+        self.assertFalse(verify_transaction_signatures(encode(signed)))
+
+    def test_unsigned(self):
+        self.assertFalse(verify_transaction_signatures(payment.blob()))
+
+    def test_signing_body(self):
+        signed = sign(payment, submit_wallet)
+        tx_blob = signed.blob()
+        self.assertEqual(
+            "53545800"
+            + _get_signing_body(bytes.fromhex(tx_blob), scan_fields(tx_blob))
+            .hex()
+            .upper(),
+            encode_for_signing(signed.to_xrpl()),
+        )
+
+    def test_multisigned(self):
+        tx = Payment.from_dict({**payment.to_dict(), "signing_pub_key": ""})
+        tx_list = [
+            sign(tx, wallet, multisign=True)
+            for wallet in (ed_wallet, secp_wallet, regkey_wallet)
+        ]
+        tx_blob = multisign(tx, tx_list).blob()
+        self.assertTrue(verify_transaction_signatures(tx_blob))
+        self.assertFalse(verify_transaction_signatures(_tamper(tx_blob)))
+
+        # a signature is only valid for the account it was made for
+        signed = multisign(tx, tx_list).to_xrpl()
+        signers = signed["Signers"]
+        signers[0]["Signer"]["Account"], signers[1]["Signer"]["Account"] = (
+            signers[1]["Signer"]["Account"],
+            signers[0]["Signer"]["Account"],
+        )
+        self.assertFalse(verify_transaction_signatures(encode(signed)))
+
+    def test_batch(self):
+        tx_blob = sign(
+            Batch.from_blob(
+                combine_batch_signers(
+                    [
+                        sign_multiaccount_batch(ed_wallet, batch),
+                        sign_multiaccount_batch(
+                            regkey_wallet,
+                            batch,
+                            multisign=True,
+                            batch_account=secp_wallet.address,
+                        ),
+                    ]
+                )
+            ),
+            submit_wallet,
+        ).blob()
+        self.assertTrue(verify_transaction_signatures(tx_blob))
+
+        # changing an inner transaction invalidates every BatchSigner
+        signed = Batch.from_blob(tx_blob).to_xrpl()
+        signed["RawTransactions"][0]["RawTransaction"]["Amount"] = "5000001"
+        outer_signature = sign(Batch.from_xrpl(signed), submit_wallet).blob()
+        self.assertFalse(verify_transaction_signatures(outer_signature))
@@ -0,0 +1,124 @@
+"""Test the ledger data archive reader and writer."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from unittest import TestCase
+
+from xrpl.core.binarycodec import encode
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.utils import (
+    LedgerDataArchive,
+    LedgerDataArchiveWriter,
+    XRPLLedgerDataArchiveException,
+)
+
+_ACCOUNT_ROOT = {
+    "LedgerEntryType": "AccountRoot",
+    "Flags": 0,
+    "Account": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+    "Balance": "148446663",
+    "OwnerCount": 3,
+    "PreviousTxnID": (
+        "0D5FB50FA65C9FE1538FD7E398FFFE9D1908DFA4576D8D7A020040686F93C77D"
+    ),
+    "PreviousTxnLgrSeq": 14091160,
+    "Sequence": 336,
+}
+_OFFER = {
+    "LedgerEntryType": "Offer",
+    "Flags": 0,
+    "Account": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+    "BookDirectory": (
+        "DFA3B6DDAB58C7E8E5D944E736DA4B7046C30E4F460FD9DE4C038D7EA4C68000"
+    ),
+    "BookNode": "0000000000000000",
+    "OwnerNode": "0000000000000000",
+    "PreviousTxnID": (
+        "F0AB71E777B2DA54B86231E19B82554EF1F8211F92ECA473121C655BFC5329BF"
+    ),
+    "PreviousTxnLgrSeq": 14524914,
+    "Sequence": 866,
+    "TakerGets": "15000000",
+    "TakerPays": {
+        "currency": "USD",
+        "issuer": "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn",
+        "value": "7",
+    },
+}
+_ACCOUNT_ROOT_INDEX = "13F1A95D7AAB7108D5CE7EEAF504B2894B8C674E6D68499076441C4837282BF8"
+_OFFER_INDEX = "96F76F27D8A327FC48753167EC04A46AA0E382E6F57F32FD12274144D00F1797"
+_MISSING_INDEX = "0" * 64
+
+
+class TestLedgerDataArchive(TestCase):
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def _write(self, state) -> None:
+        with LedgerDataArchiveWriter(self.path) as writer:
+            marker = writer.add_response(
+                Response(
+                    status=ResponseStatus.SUCCESS,
+                    result={"ledger_index": 7, "state": state, "marker": "next"},
+                )
+            )
+            self.assertEqual(marker, "next")
+            self.assertIsNone(writer.add_response({"state": []}))
+
+    def test_round_trip(self) -> None:
+        # entries are deliberately out of order
+        self._write(
+            [
+                {"data": encode(_OFFER), "index": _OFFER_INDEX},
+                {"data": encode(_ACCOUNT_ROOT), "index": _ACCOUNT_ROOT_INDEX},
+            ]
+        )
+        with LedgerDataArchive(self.path) as archive:
+            self.assertEqual(archive.ledger_index, 7)
+            self.assertEqual(len(archive), 2)
+            self.assertIn(_OFFER_INDEX, archive)
+            self.assertNotIn(_MISSING_INDEX, archive)
+            self.assertEqual(archive.get(_OFFER_INDEX), _OFFER)
+            self.assertEqual(archive.get(_ACCOUNT_ROOT_INDEX.lower()), _ACCOUNT_ROOT)
+            self.assertIsNone(archive.get(_MISSING_INDEX))
+            self.assertEqual(
+                archive.get_binary(_OFFER_INDEX), bytes.fromhex(encode(_OFFER))
+            )
+            self.assertEqual(
+                list(archive.iter_entries()),
+                [(_ACCOUNT_ROOT_INDEX, _ACCOUNT_ROOT), (_OFFER_INDEX, _OFFER)],
+            )
+            self.assertEqual(
+                list(archive.iter_entries("Offer")), [(_OFFER_INDEX, _OFFER)]
+            )
+            self.assertEqual(list(archive.iter_binary("Check")), [])
+
+    def test_empty_archive(self) -> None:
+        self._write([])
+        with LedgerDataArchive(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+            self.assertIsNone(archive.get(_OFFER_INDEX))
+            self.assertEqual(list(archive.iter_entries()), [])
+
+    def test_non_binary_response(self) -> None:
+        with LedgerDataArchiveWriter(self.path) as writer:
+            with self.assertRaises(XRPLLedgerDataArchiveException):
+                writer.add_response({"state": [_OFFER]})
+
+    def test_invalid_archive(self) -> None:
+        with open(self.path, "wb") as archive_file:
+            archive_file.write(b"not an archive" * 4)
+        with self.assertRaises(XRPLLedgerDataArchiveException):
+            LedgerDataArchive(self.path)
+
+    def test_empty_file(self) -> None:
+        with open(self.path, "wb"):
+            pass
+        with self.assertRaises(XRPLLedgerDataArchiveException):
+            LedgerDataArchive(self.path)
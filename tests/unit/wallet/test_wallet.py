@@ -1,7 +1,9 @@
+import pickle
 from unittest import TestCase
 
-from xrpl import CryptoAlgorithm
+from xrpl import CryptoAlgorithm, XRPLException
 from xrpl.core.addresscodec.exceptions import XRPLAddressCodecException
+from xrpl.core.keypairs import backends
 from xrpl.wallet import Wallet
 
 SEED = "ssQgsaM2ujhyWoDw3Yb1TNjkZTVT2"
@@ -11,6 +13,8 @@ ED_ADDRESS = "rnbrEQ9U6TgPkBYuR4RWSWGR1XgaPWuFjh"
 SED_SEED = "sEdVRAkrcTVBt4jKfJyKzQzndPFARgs"
 SED_ADDRESS = "rLLYAFe2iEGaQrz3rqWfpziGAR4XfQrW3e"
 
+SECRET_NUMBERS = "399150 474506 009147 088773 432160 282843 253738 605430"
+
 
 class TestWallet(TestCase):
     def test_create_basic(self):
@@ -85,3 +89,88 @@ class TestWallet(TestCase):
         # full-traceback log sinks.
         self.assertIsNone(exc.__cause__)
         self.assertTrue(exc.__suppress_context__)
+
+    def test_get_signer(self):
+        wallet = Wallet.from_seed(SED_SEED)
+        signer = wallet.get_signer()
+        self.assertIs(wallet.get_signer(), signer)
+        self.assertEqual(signer.private_key, wallet.private_key)
+
+        wallet.private_key = Wallet.from_seed(SEED).private_key
+        self.assertIsNot(wallet.get_signer(), signer)
+        self.assertEqual(wallet.get_signer().private_key, wallet.private_key)
+
+    def test_pickle_after_signing(self):
+        for seed, algorithm in (
+            (SED_SEED, CryptoAlgorithm.ED25519),
+            (SEED, CryptoAlgorithm.SECP256K1),
+        ):
+            for name in backends.available_backends(algorithm):
+                with self.subTest(algorithm=algorithm, backend=name):
+                    backends.set_backend(algorithm, name)
+                    try:
+                        wallet = Wallet.from_seed(seed, algorithm=algorithm)
+                        signature = wallet.get_signer().sign(b"message")
+                        copy = pickle.loads(pickle.dumps(wallet))
+                    finally:
+                        backends.set_backend(algorithm, None)
+                    self.assertEqual(copy.private_key, wallet.private_key)
+                    self.assertEqual(copy.address, wallet.address)
+                    self.assertEqual(copy.get_signer().sign(b"message"), signature)
+
+    def test_create_many(self):
+        for algorithm in CryptoAlgorithm:
+            for workers in (None, 2):
+                with self.subTest(algorithm=algorithm, workers=workers):
+                    wallets = list(
+                        Wallet.create_many(5, algorithm, workers=workers, batch_size=2)
+                    )
+                    self.assertEqual(len(wallets), 5)
+                    self.assertEqual(len({wallet.seed for wallet in wallets}), 5)
+                    for wallet in wallets:
+                        self.assertIsInstance(wallet, Wallet)
+                        self.assertEqual(wallet.algorithm, algorithm)
+                        self.assertEqual(
+                            wallet.address,
+                            Wallet.from_seed(wallet.seed, algorithm=algorithm).address,
+                        )
+
+    def test_create_many_is_lazy(self):
+        wallets = Wallet.create_many(10**9, workers=2, batch_size=1)
+        self.assertIsInstance(next(wallets), Wallet)
+        wallets.close()
+        self.assertEqual(list(Wallet.create_many(0)), [])
+
+    def test_from_seeds_many(self):
+        seeds = [SEED, "sInvalid", SED_SEED, SEED[:-1] + "3"]
+        for workers in (None, 2):
+            with self.subTest(workers=workers):
+                results = Wallet.from_seeds_many(seeds, workers=workers)
+                self.assertEqual(len(results), 4)
+                self.assertEqual(results[0].address, SECP_ADDRESS)
+                self.assertIsInstance(results[1], XRPLAddressCodecException)
+                self.assertEqual(results[2].address, SED_ADDRESS)
+                self.assertIsInstance(results[3], XRPLAddressCodecException)
+
+        results = Wallet.from_seeds_many([SEED], algorithm=CryptoAlgorithm.ED25519)
+        self.assertEqual(results[0].address, ED_ADDRESS)
+        self.assertEqual(Wallet.from_seeds_many([]), [])
+
+    def test_from_secret_numbers_many(self):
+        expected = Wallet.from_secret_numbers(SECRET_NUMBERS)
+        sheets = [
+            SECRET_NUMBERS,
+            SECRET_NUMBERS.split()[:7],
+            SECRET_NUMBERS.replace("605430", "605431"),
+            SECRET_NUMBERS.replace("605430", "60543x"),
+            SECRET_NUMBERS.split(),
+        ]
+        for workers in (None, 2):
+            with self.subTest(workers=workers):
+                results = Wallet.from_secret_numbers_many(sheets, workers=workers)
+                self.assertEqual(len(results), 5)
+                for index in (0, 4):
+                    self.assertEqual(results[index].seed, expected.seed)
+                    self.assertEqual(results[index].address, expected.address)
+                for index in (1, 2, 3):
+                    self.assertIsInstance(results[index], XRPLException)
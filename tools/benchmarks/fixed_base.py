@@ -0,0 +1,77 @@
+"""
+Script to measure the fixed-base generator tables used by the ECPy backends.
+
+Usage: python tools/benchmarks/fixed_base.py [iterations]
+
+Prints the one-time cost of building each table, the speed of multiplying the
+generator with ECPy's generic double-and-add and with the table, and the speed of
+``derive_keypair``, ``sign`` and ``Wallet.create`` with the ECPy backends.
+"""
+
+import os
+import secrets
+import sys
+import time
+import timeit
+from typing import Callable
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core.keypairs import backends, fixed_base
+from xrpl.wallet import Wallet
+
+_MESSAGE = os.urandom(250)  # about the size of a signed Payment
+
+
+def _ops_per_second(operation: Callable[[], object], iterations: int) -> float:
+    operation()  # warm up
+    return iterations / timeit.timeit(operation, number=iterations)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    curves = {
+        CryptoAlgorithm.ED25519: (
+            fixed_base._ED25519,
+            fixed_base._ed25519_table,
+            fixed_base.ed25519_mul_generator,
+        ),
+        CryptoAlgorithm.SECP256K1: (
+            fixed_base._SECP256K1,
+            fixed_base._secp256k1_table,
+            fixed_base.secp256k1_mul_generator,
+        ),
+    }
+    print(
+        f"{'algorithm':<10} {'build ms':>9} {'k*G/s':>9} {'table/s':>9} "
+        f"{'derive/s':>9} {'sign/s':>9} {'create/s':>9}"
+    )
+    for algorithm, (curve, build_table, mul_generator) in curves.items():
+        build_table.cache_clear()
+        start = time.perf_counter()
+        build_table()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scalar = secrets.randbelow(curve.order - 1) + 1
+        generic = _ops_per_second(lambda: scalar * curve.generator, iterations)
+        table = _ops_per_second(lambda: mul_generator(scalar), iterations)
+
+        backends.set_backend(algorithm, "ecpy")
+        backend = backends.get_backend(algorithm)
+        seed = os.urandom(16)
+        _, private_key = backend.derive_keypair(seed, False)
+        derive = _ops_per_second(
+            lambda: backend.derive_keypair(seed, False), iterations
+        )
+        sign = _ops_per_second(lambda: backend.sign(_MESSAGE, private_key), iterations)
+        create = _ops_per_second(lambda: Wallet.create(algorithm), iterations)
+        backends.set_backend(algorithm, None)
+
+        print(
+            f"{algorithm.value:<10} {build_ms:>9.1f} {generic:>9.0f} {table:>9.0f} "
+            f"{derive:>9.0f} {sign:>9.0f} {create:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
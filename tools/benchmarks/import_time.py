@@ -0,0 +1,61 @@
+"""
+Script to measure how long it takes to import xrpl-py.
+
+Usage: python tools/benchmarks/import_time.py [runs]
+
+Imports each entry point in ``runs`` new interpreters with ``python -X importtime``
+and prints the median time, in milliseconds, reported for the module and all of
+its imports, and the number of xrpl modules that were loaded.
+"""
+
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+_MODULES = (
+    "xrpl",
+    "xrpl.models",
+    "xrpl.wallet",
+    "xrpl.core.binarycodec",
+    "xrpl.core.keypairs",
+    "xrpl.transaction",
+    "xrpl.clients",
+)
+
+
+def _import_time(module: str) -> Tuple[int, int]:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    cumulative_us = 0
+    xrpl_modules = 0
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name == module:
+            cumulative_us = int(cumulative)
+        if name == "xrpl" or name.startswith("xrpl."):
+            xrpl_modules += 1
+    return cumulative_us, xrpl_modules
+
+
+def main() -> None:
+    """Run the benchmark."""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'module':<24} {'median ms':>10} {'xrpl modules':>13}")
+    for module in _MODULES:
+        times: List[int] = []
+        for _ in range(runs):
+            cumulative_us, xrpl_modules = _import_time(module)
+            times.append(cumulative_us)
+        print(
+            f"{module:<24} {statistics.median(times) / 1000:>10.1f} {xrpl_modules:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Script to compare the speed of the keypair backends available here.
+
+Usage: python tools/benchmarks/keypair_backends.py [iterations]
+
+For each algorithm and each usable backend, times ``derive_keypair``, ``sign`` and
+``is_valid_message`` and prints the operations per second.
+"""
+
+import os
+import sys
+import timeit
+from typing import Callable
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core.keypairs.backends import available_backends, load_backend
+
+_MESSAGE = os.urandom(250)  # about the size of a signed Payment
+
+
+def _ops_per_second(operation: Callable[[], object], iterations: int) -> float:
+    operation()  # warm up
+    return iterations / timeit.timeit(operation, number=iterations)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(
+        f"{'algorithm':<10} {'backend':<13} {'derive/s':>10} {'sign/s':>10} "
+        f"{'verify/s':>10}"
+    )
+    for algorithm in CryptoAlgorithm:
+        seed = os.urandom(16)
+        for name in available_backends(algorithm):
+            backend = load_backend(algorithm, name)
+            public_key, private_key = backend.derive_keypair(seed, False)
+            signature = backend.sign(_MESSAGE, private_key)
+            derive = _ops_per_second(
+                lambda: backend.derive_keypair(seed, False), iterations
+            )
+            sign = _ops_per_second(
+                lambda: backend.sign(_MESSAGE, private_key), iterations
+            )
+            verify = _ops_per_second(
+                lambda: backend.is_valid_message(_MESSAGE, signature, public_key),
+                iterations,
+            )
+            print(
+                f"{algorithm.value:<10} {name:<13} {derive:>10.0f} {sign:>10.0f} "
+                f"{verify:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
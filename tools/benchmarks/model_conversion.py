@@ -0,0 +1,111 @@
+"""
+Script to measure the cost of converting models to and from dictionaries.
+
+Usage: python tools/benchmarks/model_conversion.py [iterations]
+
+For a Payment, an OfferCreate, a Batch and an AccountTx request, times
+``from_dict`` and ``to_dict`` and, for the transactions, ``from_xrpl`` and
+``to_xrpl``, and prints microseconds per call. The models are built with
+``trusted_construction`` so that only the conversions are timed, not the
+validation.
+"""
+
+import sys
+import timeit
+from typing import Callable, Dict, Type
+
+from xrpl.models import (
+    AccountTx,
+    Batch,
+    Memo,
+    OfferCreate,
+    Payment,
+    Transaction,
+    trusted_construction,
+)
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.base_model import BaseModel
+
+_ACCOUNT = "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1"
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+_AMOUNT = IssuedCurrencyAmount(currency="USD", issuer=_DESTINATION, value="10")
+
+
+def _models() -> Dict[str, BaseModel]:
+    payment = Payment(
+        account=_ACCOUNT,
+        amount=_AMOUNT,
+        destination=_DESTINATION,
+        fee="12",
+        sequence=1,
+        memos=[Memo(memo_data="ABCD")],
+    )
+    return {
+        "Payment": payment,
+        "OfferCreate": OfferCreate(
+            account=_ACCOUNT, taker_gets="1000000", taker_pays=_AMOUNT, fee="12"
+        ),
+        "Batch": Batch(
+            account=_ACCOUNT,
+            fee="40",
+            sequence=1,
+            raw_transactions=[
+                Payment(
+                    account=_ACCOUNT,
+                    amount="1000000",
+                    destination=_DESTINATION,
+                    fee="0",
+                    sequence=sequence,
+                    flags=0x40000000,  # tfInnerBatchTxn
+                    signing_pub_key="",
+                )
+                for sequence in range(2, 10)
+            ],
+            flags=0x00010000,  # tfAllOrNothing
+        ),
+        "AccountTx": AccountTx(
+            account=_ACCOUNT, ledger_index_min=-1, ledger_index_max=-1, limit=10
+        ),
+    }
+
+
+def _operations(model: BaseModel) -> Dict[str, Callable[[], object]]:
+    model_class: Type[BaseModel] = type(model)
+    value = model.to_dict()
+    operations: Dict[str, Callable[[], object]] = {
+        "from_dict": lambda: model_class.from_dict(value),
+        "to_dict": model.to_dict,
+    }
+    if isinstance(model, Transaction):
+        xrpl_value = model.to_xrpl()
+        operations["from_xrpl"] = lambda: model_class.from_xrpl(xrpl_value)
+        operations["to_xrpl"] = model.to_xrpl
+    return operations
+
+
+def _microseconds(operation: Callable[[], object], iterations: int) -> float:
+    operation()  # warm up
+    return timeit.timeit(operation, number=iterations) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    columns = ("from_dict", "to_dict", "from_xrpl", "to_xrpl")
+    print(f"{'model':<12}" + "".join(f"{column + ' us':>14}" for column in columns))
+    with trusted_construction():
+        for name, model in _models().items():
+            operations = _operations(model)
+            cells = [
+                (
+                    f"{_microseconds(operations[column], iterations):.1f}"
+                    if column in operations
+                    else "-"
+                )
+                for column in columns
+            ]
+            print(f"{name:<12}" + "".join(f"{cell:>14}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
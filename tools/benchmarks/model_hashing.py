@@ -0,0 +1,61 @@
+"""
+Script to measure the cost of comparing and hashing models.
+
+Usage: python tools/benchmarks/model_hashing.py [count]
+
+Builds ``count`` Payments with memos, each twice, and times ``==`` between equal
+and between different Payments, ``hash``, and removing the duplicates with a
+``set``, printing microseconds per Payment.
+"""
+
+import sys
+import timeit
+from typing import Callable, List
+
+from xrpl.models import IssuedCurrencyAmount, Memo, Payment, trusted_construction
+
+_ACCOUNT = "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1"
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+
+
+def _payments(count: int) -> List[Payment]:
+    return [
+        Payment(
+            account=_ACCOUNT,
+            amount=IssuedCurrencyAmount(
+                currency="USD", issuer=_DESTINATION, value=str(index)
+            ),
+            destination=_DESTINATION,
+            fee="12",
+            sequence=index,
+            memos=[Memo(memo_data="ABCD"), Memo(memo_type="74657374")],
+        )
+        for index in range(count)
+    ]
+
+
+def _microseconds(operation: Callable[[], object], count: int) -> float:
+    operation()  # warm up
+    return min(timeit.repeat(operation, number=1, repeat=5)) / count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with trusted_construction():
+        payments = _payments(count)
+        copies = _payments(count)
+    different = copies[1:] + copies[:1]
+    operations = {
+        "== (equal)": lambda: [a == b for a, b in zip(payments, copies)],
+        "== (different)": lambda: [a == b for a, b in zip(payments, different)],
+        "hash": lambda: [hash(payment) for payment in payments],
+        "set of duplicates": lambda: set(payments + copies),
+    }
+    print(f"{'operation':<20} {'us/payment':>11}")
+    for name, operation in operations.items():
+        print(f"{name:<20} {_microseconds(operation, count):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Script to measure the memory used by model instances.
+
+Usage: python tools/benchmarks/model_memory.py [count]
+
+Builds ``count`` instances each of IssuedCurrencyAmount, Memo, Signer, PathStep,
+Payment and OfferCreate, sharing their field values, and prints the bytes
+allocated per instance as measured by ``tracemalloc``: the instances themselves,
+plus their attribute dictionaries when they have them, but not the values.
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Dict
+
+from xrpl.models import (
+    IssuedCurrencyAmount,
+    Memo,
+    OfferCreate,
+    PathStep,
+    Payment,
+    Signer,
+    trusted_construction,
+)
+from xrpl.models.base_model import BaseModel
+
+_ACCOUNT = "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1"
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+_AMOUNT = IssuedCurrencyAmount(currency="USD", issuer=_DESTINATION, value="10")
+_MEMO = [Memo(memo_data="ABCD")]
+
+_FACTORIES: Dict[str, Callable[[], BaseModel]] = {
+    "IssuedCurrencyAmount": lambda: IssuedCurrencyAmount(
+        currency="USD", issuer=_DESTINATION, value="10"
+    ),
+    "Memo": lambda: Memo(memo_data="ABCD", memo_type="74657374"),
+    "Signer": lambda: Signer(
+        account=_ACCOUNT, txn_signature="00", signing_pub_key="ED00"
+    ),
+    "PathStep": lambda: PathStep(account=_ACCOUNT, currency="USD"),
+    "Payment": lambda: Payment(
+        account=_ACCOUNT,
+        amount=_AMOUNT,
+        destination=_DESTINATION,
+        fee="12",
+        sequence=1,
+        memos=_MEMO,
+    ),
+    "OfferCreate": lambda: OfferCreate(
+        account=_ACCOUNT, taker_gets="1000000", taker_pays=_AMOUNT, fee="12"
+    ),
+}
+
+
+def _bytes_per_instance(factory: Callable[[], BaseModel], count: int) -> float:
+    factory()  # warm up any caches
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # leave out the list holding the instances
+    return (after - before - sys.getsizeof(instances)) / len(instances)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    print(f"{'model':<22} {'bytes/instance':>15}")
+    # skip validation, which allocates temporary objects of its own
+    with trusted_construction():
+        for name, factory in _FACTORIES.items():
+            print(f"{name:<22} {_bytes_per_instance(factory, count):>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
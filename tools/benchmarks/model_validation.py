@@ -0,0 +1,65 @@
+"""
+Script to measure the cost of validating models.
+
+Usage: python tools/benchmarks/model_validation.py [iterations]
+
+For a Payment, an OfferCreate and a Payment with 1000 memos, times ``validate``
+(the compiled type checks plus each model's own checks) and, for comparison, the
+reflective ``_check_type`` over every field, and prints microseconds per call.
+"""
+
+import sys
+import timeit
+from typing import Callable, Dict
+
+from xrpl.models import Memo, OfferCreate, Payment
+from xrpl.models.amounts import IssuedCurrencyAmount
+from xrpl.models.base_model import BaseModel, _get_model_metadata
+
+_ACCOUNT = "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1"
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+_AMOUNT = IssuedCurrencyAmount(currency="USD", issuer=_DESTINATION, value="10")
+
+
+def _reflective_check(model: BaseModel) -> Callable[[], object]:
+    type_hints = _get_model_metadata(type(model)).type_hints
+    return lambda: [
+        model._check_type(attr, value, type_hints[attr])
+        for attr, value in model.__dict__.items()
+    ]
+
+
+def _microseconds(operation: Callable[[], object], iterations: int) -> float:
+    operation()  # warm up
+    return timeit.timeit(operation, number=iterations) / iterations * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    payment = Payment(
+        account=_ACCOUNT, amount=_AMOUNT, destination=_DESTINATION, fee="12"
+    )
+    models: Dict[str, BaseModel] = {
+        "Payment": payment,
+        "OfferCreate": OfferCreate(
+            account=_ACCOUNT, taker_gets="1000000", taker_pays=_AMOUNT, fee="12"
+        ),
+        "Payment, 1000 memos": Payment.from_dict(
+            {
+                **payment.to_dict(),
+                "memos": [Memo(memo_data=f"{i:04X}") for i in range(1000)],
+            }
+        ),
+    }
+    print(f"{'model':<20} {'validate us':>12} {'_check_type us':>15}")
+    for name, model in models.items():
+        # fewer iterations for the large model
+        count = max(iterations // len(model.__dict__.get("memos") or [0]), 10)
+        validate = _microseconds(model.validate, count)
+        reflective = _microseconds(_reflective_check(model), count)
+        print(f"{name:<20} {validate:>12.1f} {reflective:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
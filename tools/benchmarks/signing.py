@@ -0,0 +1,209 @@
+"""
+Script to benchmark key derivation, signing and verification, and to compare the
+results between versions.
+
+Usage:
+    python tools/benchmarks/signing.py [--iterations N] [--output FILE]
+    python tools/benchmarks/signing.py --compare BASELINE.json CURRENT.json
+
+Times ``derive_keypair``, ``sign``, ``is_valid_message`` and
+``derive_classic_address`` from ``xrpl.core.keypairs`` for each algorithm, signing
+and verifying messages of several sizes, and ``xrpl.transaction.sign`` for a
+Payment, a multi-signature and a Batch with its BatchSigners. Every operation is
+timed separately, and the operations per second and the median (p50) and 99th
+percentile (p99) latencies are printed and, with ``--output``, written to a JSON
+file along with the versions and keypair backends used. ``--compare`` prints the
+change in operations per second between two such files.
+"""
+
+import argparse
+import json
+import os
+import platform
+import time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core import keypairs
+from xrpl.core.keypairs.backends import get_backend
+from xrpl.models.transactions import Batch, Memo, Payment
+from xrpl.transaction import sign, sign_multiaccount_batch
+from xrpl.wallet import Wallet
+
+# a transaction hash, a signed Payment and a large multi-signed transaction
+_MESSAGE_SIZES = (32, 250, 4096)
+
+
+def _measure(operation: Callable[[], object], iterations: int) -> Dict[str, float]:
+    operation()  # warm up
+    latencies: List[int] = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        operation()
+        latencies.append(time.perf_counter_ns() - start)
+    latencies.sort()
+    return {
+        "ops_per_second": iterations * 1e9 / sum(latencies),
+        "p50_us": latencies[len(latencies) // 2] / 1000,
+        "p99_us": latencies[min(len(latencies) * 99 // 100, len(latencies) - 1)] / 1000,
+    }
+
+
+def _keypair_operations(
+    algorithm: CryptoAlgorithm,
+) -> Dict[str, Callable[[], object]]:
+    seed = keypairs.generate_seed(algorithm=algorithm)
+    public_key, private_key = keypairs.derive_keypair(seed)
+    operations: Dict[str, Callable[[], object]] = {
+        "derive_keypair": lambda: keypairs.derive_keypair(seed),
+        "derive_classic_address": lambda: keypairs.derive_classic_address(public_key),
+    }
+    for size in _MESSAGE_SIZES:
+        message = os.urandom(size)
+        signature = bytes.fromhex(keypairs.sign(message, private_key))
+        operations[f"sign/{size}B"] = _sign(message, private_key)
+        operations[f"is_valid_message/{size}B"] = _is_valid_message(
+            message, signature, public_key
+        )
+    return operations
+
+
+def _sign(message: bytes, private_key: str) -> Callable[[], object]:
+    return lambda: keypairs.sign(message, private_key)
+
+
+def _is_valid_message(
+    message: bytes, signature: bytes, public_key: str
+) -> Callable[[], object]:
+    return lambda: keypairs.is_valid_message(message, signature, public_key)
+
+
+def _transaction_operations(
+    algorithm: CryptoAlgorithm,
+) -> Dict[str, Callable[[], object]]:
+    wallet, other, submitter = (Wallet.create(algorithm) for _ in range(3))
+    payment = Payment(
+        account=wallet.address,
+        amount="1000000",
+        destination=other.address,
+        fee="12",
+        sequence=1,
+        last_ledger_sequence=1000,
+        memos=[Memo(memo_data="00" * 64)],
+    )
+    multisigned = Payment.from_dict({**payment.to_dict(), "signing_pub_key": ""})
+    batch = Batch(
+        account=submitter.address,
+        fee="40",
+        sequence=1,
+        raw_transactions=[
+            Payment(
+                account=account.address,
+                amount="1000000",
+                destination=submitter.address,
+                fee="0",
+                sequence=1,
+                flags=0x40000000,  # tfInnerBatchTxn
+                signing_pub_key="",
+            )
+            for account in (wallet, other)
+        ],
+        flags=0x00010000,  # tfAllOrNothing
+    )
+    return {
+        "transaction.sign/Payment": lambda: sign(payment, wallet),
+        "transaction.sign/multisign": lambda: sign(multisigned, other, multisign=True),
+        "transaction.sign/Batch": lambda: sign(
+            sign_multiaccount_batch(wallet, batch), submitter
+        ),
+    }
+
+
+def _package_version() -> str:
+    try:
+        return version("xrpl-py")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run(iterations: int) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        iterations: The number of times each operation is timed.
+
+    Returns:
+        The environment and the result of each operation, ready to be dumped as
+        JSON.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'operation':<44} {'ops/s':>10} {'p50 us':>10} {'p99 us':>10}")
+    for algorithm in CryptoAlgorithm:
+        operations = _keypair_operations(algorithm)
+        operations.update(_transaction_operations(algorithm))
+        for name, operation in operations.items():
+            key = f"{algorithm.value}/{name}"
+            results[key] = _measure(operation, iterations)
+            print(
+                f"{key:<44} {results[key]['ops_per_second']:>10.0f} "
+                f"{results[key]['p50_us']:>10.1f} {results[key]['p99_us']:>10.1f}"
+            )
+    return {
+        "xrpl_py": _package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backends": {
+            algorithm.value: get_backend(algorithm).__name__
+            for algorithm in CryptoAlgorithm
+        },
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def compare(baseline_path: str, current_path: str) -> None:
+    """
+    Print the change in operations per second between two result files.
+
+    Args:
+        baseline_path: The file with the results to compare against.
+        current_path: The file with the new results.
+    """
+    with open(baseline_path) as file:
+        baseline = json.load(file)["results"]
+    with open(current_path) as file:
+        current = json.load(file)["results"]
+    print(f"{'operation':<44} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key in sorted(baseline.keys() & current.keys()):
+        before = baseline[key]["ops_per_second"]
+        after = current[key]["ops_per_second"]
+        print(
+            f"{key:<44} {before:>10.0f} {after:>10.0f} "
+            f"{(after / before - 1) * 100:>+7.1f}%"
+        )
+
+
+def main() -> None:
+    """Run the benchmark, or compare two result files."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--output", help="the JSON file to write the results to")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="compare files"
+    )
+    arguments = parser.parse_args()
+    if arguments.compare:
+        compare(*arguments.compare)
+        return
+
+    report = run(arguments.iterations)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Script to measure the cost of encoding and hashing the same transaction repeatedly.
+
+Usage: python tools/benchmarks/transaction_caching.py [count]
+
+For a signed Payment with memos and a Batch of eight Payments, times the first
+and the later calls of ``to_xrpl``, ``blob`` and ``get_hash`` on ``count`` copies
+of the transaction, and prints microseconds per call.
+"""
+
+import sys
+import time
+from typing import Callable, Dict, List
+
+from xrpl.models import Batch, Memo, Payment, Transaction, trusted_construction
+from xrpl.transaction import sign
+from xrpl.wallet import Wallet
+
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+_WALLET = Wallet.create()
+
+
+def _transactions() -> Dict[str, Transaction]:
+    payment = Payment(
+        account=_WALLET.address,
+        amount="1000000",
+        destination=_DESTINATION,
+        fee="12",
+        sequence=1,
+        memos=[Memo(memo_data="ABCD"), Memo(memo_type="74657374")],
+    )
+    batch = Batch(
+        account=_WALLET.address,
+        fee="40",
+        sequence=1,
+        raw_transactions=[
+            Payment(
+                account=_WALLET.address,
+                amount="1000000",
+                destination=_DESTINATION,
+                fee="0",
+                sequence=sequence,
+                flags=0x40000000,  # tfInnerBatchTxn
+                signing_pub_key="",
+            )
+            for sequence in range(2, 10)
+        ],
+        flags=0x00010000,  # tfAllOrNothing
+    )
+    return {"Payment": sign(payment, _WALLET), "Batch": sign(batch, _WALLET)}
+
+
+def _microseconds(
+    transactions: List[Transaction], call: Callable[[Transaction], object]
+) -> float:
+    start = time.perf_counter()
+    for transaction in transactions:
+        call(transaction)
+    return (time.perf_counter() - start) / len(transactions) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    calls: Dict[str, Callable[[Transaction], object]] = {
+        "to_xrpl": lambda transaction: transaction.to_xrpl(),
+        "blob": lambda transaction: transaction.blob(),
+        "get_hash": lambda transaction: transaction.get_hash(),
+    }
+    print(f"{'transaction':<12} {'method':<10} {'first us':>10} {'later us':>10}")
+    for name, transaction in _transactions().items():
+        value = transaction.to_dict()
+        for method, call in calls.items():
+            # new copies, so that the first call computes the value
+            with trusted_construction():
+                copies = [type(transaction).from_dict(value) for _ in range(count)]
+            first = _microseconds(copies, call)
+            later = _microseconds(copies, call)
+            print(f"{name:<12} {method:<10} {first:>10.1f} {later:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Script to measure the cost of decoding transaction blobs of mixed types.
+
+Usage: python tools/benchmarks/transaction_decoding.py [iterations]
+
+Encodes a corpus of transactions of different types, then times
+``Transaction.from_blob`` over the whole corpus and ``Transaction.get_transaction_type``
+for each of its types, and prints microseconds per transaction.
+"""
+
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+from xrpl.models import (
+    AccountSet,
+    CheckCreate,
+    EscrowCreate,
+    IssuedCurrencyAmount,
+    NFTokenMint,
+    OfferCancel,
+    OfferCreate,
+    Payment,
+    Transaction,
+    TrustSet,
+)
+from xrpl.models.transactions.pseudo_transactions import EnableAmendment
+
+_ACCOUNT = "rU6K7V3Po4snVhBBaU29sesqs2qTQJWDw1"
+_DESTINATION = "rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn"
+_AMOUNT = IssuedCurrencyAmount(currency="USD", issuer=_DESTINATION, value="10")
+_AMENDMENT = "42426C4D4F1009EE67080A9B7965B44656D7714D104A72F9B4369F97ABF044EE"
+
+
+def _corpus() -> List[Transaction]:
+    common: Dict[str, Any] = {"account": _ACCOUNT, "fee": "12", "sequence": 1}
+    return [
+        Payment(**common, amount=_AMOUNT, destination=_DESTINATION),
+        Payment(**common, amount="1000000", destination=_DESTINATION),
+        OfferCreate(**common, taker_gets="1000000", taker_pays=_AMOUNT),
+        OfferCancel(**common, offer_sequence=7),
+        TrustSet(**common, limit_amount=_AMOUNT),
+        AccountSet(**common, transfer_rate=1005000000),
+        EscrowCreate(
+            **common, amount="1000000", destination=_DESTINATION, finish_after=1
+        ),
+        NFTokenMint(**common, nftoken_taxon=0),
+        CheckCreate(**common, destination=_DESTINATION, send_max="1000000"),
+        EnableAmendment(
+            amendment=_AMENDMENT,
+            ledger_sequence=21225473,
+        ),
+    ]
+
+
+def _microseconds(
+    operation: Callable[[], object], iterations: int, count: int
+) -> float:
+    operation()  # warm up
+    return timeit.timeit(operation, number=iterations) / iterations / count * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    corpus = _corpus()
+    blobs = [transaction.blob() for transaction in corpus]
+    transaction_types = [transaction.transaction_type.value for transaction in corpus]
+
+    def from_blob() -> None:
+        for blob in blobs:
+            Transaction.from_blob(blob)
+
+    def get_transaction_type() -> None:
+        for transaction_type in transaction_types:
+            Transaction.get_transaction_type(transaction_type)
+
+    print(f"{len(corpus)} transactions of {len(set(transaction_types))} types")
+    print(f"{'operation':<22} {'us/transaction':>15}")
+    for name, operation in (
+        ("from_blob", from_blob),
+        ("get_transaction_type", get_transaction_type),
+    ):
+        microseconds = _microseconds(operation, iterations, len(corpus))
+        print(f"{name:<22} {microseconds:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
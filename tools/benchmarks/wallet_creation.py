@@ -0,0 +1,49 @@
+"""
+Script to measure how many wallets per second can be generated.
+
+Usage: python tools/benchmarks/wallet_creation.py [count] [workers]
+
+For each algorithm, times ``count`` calls to ``Wallet.create`` and then
+``Wallet.create_many`` with ``count`` wallets, in this process and in a pool of
+``workers`` processes (by default, one per CPU), and prints the keys per second.
+"""
+
+import os
+import sys
+import time
+from typing import Callable
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.wallet import Wallet
+
+
+def _keys_per_second(create: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    create()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    print(
+        f"{'algorithm':<10} {'create/s':>10} {'many/s':>10} "
+        f"{f'many x{workers}/s':>14}"
+    )
+    for algorithm in CryptoAlgorithm:
+        Wallet.create(algorithm)  # warm up
+        create = _keys_per_second(
+            lambda: [Wallet.create(algorithm) for _ in range(count)], count
+        )
+        many = _keys_per_second(
+            lambda: list(Wallet.create_many(count, algorithm)), count
+        )
+        parallel = _keys_per_second(
+            lambda: list(Wallet.create_many(count, algorithm, workers=workers)), count
+        )
+        print(f"{algorithm.value:<10} {create:>10.0f} {many:>10.0f} {parallel:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -144,7 +144,7 @@ def _main(
         ]
         param_lines.sort(key=lambda x: "REQUIRED" not in x)
         params = "\n".join(param_lines)
-        model = f"""@dataclass(frozen=True, kw_only=True)
+        model = f"""@dataclass(frozen=True, kw_only=True, slots=True)
 class {tx}(Transaction):
     \"\"\"Represents a {tx} transaction.\"\"\"
 
@@ -1,8 +1,29 @@
 """High-level XRPL exports."""
 
-from xrpl import account, clients, core, ledger, models, transaction, utils, wallet
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
 from xrpl.constants import CryptoAlgorithm, XRPLException
 
+if TYPE_CHECKING:
+    from xrpl import account, clients, core, ledger, models, transaction, utils, wallet
+else:
+    # the subpackages are imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodules=[
+            "account",
+            "asyncio",
+            "clients",
+            "core",
+            "ledger",
+            "models",
+            "transaction",
+            "utils",
+            "wallet",
+        ],
+    )
+
 __all__ = [
     "CryptoAlgorithm",
     "XRPLException",
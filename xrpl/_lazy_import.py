@@ -0,0 +1,65 @@
+"""Lazy loading of the contents of a package, with PEP 562 ``__getattr__``."""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
+
+
+def attach(
+    package_name: str,
+    submodules: Iterable[str] = (),
+    submodule_attributes: Optional[Mapping[str, Iterable[str]]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns the ``__getattr__`` and ``__dir__`` functions of a package whose
+    submodules, and the names exported from them, are only imported when they are
+    first used.
+
+    Example::
+
+        __getattr__, __dir__ = attach(
+            __name__, submodule_attributes={"payment": ["Payment", "PaymentFlag"]}
+        )
+
+    Args:
+        package_name: The name of the package, ``__name__``.
+        submodules: The submodules to import when they are used as attributes of
+            the package, besides those in ``submodule_attributes``.
+        submodule_attributes: The names to import from each submodule, by the
+            name of the submodule relative to the package, or by a relative module
+            name such as ``"..asyncio.wallet"``. The submodules of the package
+            named here are also imported when they are used as attributes of it.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions for the package.
+    """
+    lazy_submodules = frozenset(
+        {
+            *submodules,
+            *(name for name in submodule_attributes or {} if "." not in name),
+        }
+    )
+    attribute_submodules = {
+        attribute: submodule
+        for submodule, attributes in (submodule_attributes or {}).items()
+        for attribute in attributes
+    }
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        if name in lazy_submodules:
+            return import_module(f"{package_name}.{name}")
+        submodule = attribute_submodules.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module_name = submodule if submodule.startswith(".") else f".{submodule}"
+        value = getattr(import_module(module_name, package_name), name)
+        # later lookups find the value without calling __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(
+            {*vars(sys.modules[package_name]), *lazy_submodules, *attribute_submodules}
+        )
+
+    return __getattr__, __dir__
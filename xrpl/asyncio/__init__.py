@@ -1,5 +1,16 @@
 """High-level XRPL exports for async support."""
 
-from xrpl.asyncio import account, clients, ledger, transaction, wallet
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
+
+if TYPE_CHECKING:
+    from xrpl.asyncio import account, clients, ledger, transaction, wallet
+else:
+    # the subpackages are imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodules=["account", "clients", "ledger", "transaction", "wallet"],
+    )
 
 __all__ = ["account", "clients", "ledger", "transaction", "wallet"]
@@ -2,10 +2,12 @@
 
 from xrpl.asyncio.transaction.main import (
     _calculate_fee_per_transaction_type,
+    asign_many,
     autofill,
     autofill_and_sign,
     sign,
     sign_and_submit,
+    sign_many,
     simulate,
     submit,
     transaction_json_to_binary_codec_form,
@@ -16,10 +18,12 @@ from xrpl.asyncio.transaction.reliable_submission import (
 )
 
 __all__ = [
+    "asign_many",
     "autofill",
     "autofill_and_sign",
     "sign",
     "sign_and_submit",
+    "sign_many",
     "simulate",
     "submit",
     "submit_and_wait",
@@ -1,7 +1,9 @@
 """High-level transaction methods with XRPL transactions."""
 
+import asyncio
 import math
-from typing import Any, Dict, List, Optional, Union, cast
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 from typing_extensions import Final, TypeVar
 
@@ -9,10 +11,9 @@ from xrpl.asyncio.account import get_next_valid_seq_number
 from xrpl.asyncio.clients import Client, XRPLRequestFailureException
 from xrpl.asyncio.clients.client import get_network_id_and_build_version
 from xrpl.asyncio.ledger import get_fee, get_latest_validated_ledger_sequence
-from xrpl.constants import XRPLException
+from xrpl.constants import CryptoAlgorithm, XRPLException
 from xrpl.core.addresscodec import is_valid_xaddress, xaddress_to_classic_address
-from xrpl.core.binarycodec import encode, encode_for_multisigning, encode_for_signing
-from xrpl.core.keypairs.main import sign as keypairs_sign
+from xrpl.core.binarycodec import encode_for_multisigning, encode_for_signing
 from xrpl.models import (
     Batch,
     EscrowFinish,
@@ -122,14 +123,11 @@ def sign(
     """
     transaction_json = _prepare_transaction(transaction)
     if multisign:
-        signature = keypairs_sign(
-            bytes.fromhex(
-                encode_for_multisigning(
-                    transaction_json,
-                    wallet.address,
-                )
-            ),
-            wallet.private_key,
+        signature = wallet.get_signer().sign(
+            encode_for_multisigning(
+                transaction_json,
+                wallet.address,
+            )
         )
         transaction_json["Signers"] = [
             {
@@ -145,11 +143,131 @@ def sign(
     transaction_json["SigningPubKey"] = wallet.public_key
     serialized_for_signing = encode_for_signing(transaction_json)
     serialized_bytes = bytes.fromhex(serialized_for_signing)
-    signature = keypairs_sign(serialized_bytes, wallet.private_key)
+    signature = wallet.get_signer().sign(serialized_bytes)
     transaction_json["TxnSignature"] = signature
     return cast(T, Transaction.from_xrpl(transaction_json))
 
 
+def sign_many(
+    transactions: Iterable[T],
+    wallet: Wallet,
+    multisign: bool = False,
+    workers: Optional[int] = None,
+) -> List[T]:
+    """
+    Signs many transactions locally with the same wallet.
+
+    The wallet's private key is parsed only once. With ``workers``, the
+    transactions are signed in a pool of that many processes, each of which
+    receives the wallet's keys once when it starts rather than with every
+    transaction.
+
+    Args:
+        transactions: the transactions to be signed.
+        wallet: the wallet with which to sign the transactions.
+        multisign: whether to sign the transactions for multisignature transactions.
+        workers: the number of processes to sign in. By default, or if it is 1, the
+            transactions are signed in this process.
+
+    Returns:
+        The signed transactions, in the same order.
+    """
+    transactions = list(transactions)
+    if workers is None or workers <= 1:
+        return [sign(transaction, wallet, multisign) for transaction in transactions]
+
+    with ProcessPoolExecutor(
+        workers, initializer=_init_signing_worker, initargs=_worker_keys(wallet)
+    ) as executor:
+        chunks = executor.map(
+            _sign_in_worker,
+            _split(transactions, workers),
+            [multisign] * workers,
+        )
+        return [signed for chunk in chunks for signed in chunk]
+
+
+async def asign_many(
+    transactions: Iterable[T],
+    wallet: Wallet,
+    multisign: bool = False,
+    workers: Optional[int] = None,
+) -> List[T]:
+    """
+    Signs many transactions locally with the same wallet, without blocking the
+    event loop.
+
+    Signing is CPU-bound, so it runs in a pool of ``workers`` processes (or, by
+    default, in a single worker thread) while the event loop keeps running.
+
+    Args:
+        transactions: the transactions to be signed.
+        wallet: the wallet with which to sign the transactions.
+        multisign: whether to sign the transactions for multisignature transactions.
+        workers: the number of processes to sign in. By default, or if it is 1, the
+            transactions are signed in a thread of this process.
+
+    Returns:
+        The signed transactions, in the same order.
+    """
+    transactions = list(transactions)
+    loop = asyncio.get_running_loop()
+    if workers is None or workers <= 1:
+        return await loop.run_in_executor(
+            None, sign_many, transactions, wallet, multisign
+        )
+
+    executor = ProcessPoolExecutor(
+        workers, initializer=_init_signing_worker, initargs=_worker_keys(wallet)
+    )
+    try:
+        chunks = await asyncio.gather(
+            *[
+                loop.run_in_executor(executor, _sign_in_worker, chunk, multisign)
+                for chunk in _split(transactions, workers)
+            ]
+        )
+    finally:
+        # not waiting for the workers to exit, which would block the event loop
+        # until the chunks in progress are signed if the task was cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [signed for chunk in chunks for signed in chunk]
+
+
+# The wallet of a sign_many worker process, set once when the process starts.
+_worker_wallet: Optional[Wallet] = None
+
+
+def _worker_keys(wallet: Wallet) -> Tuple[str, str, str, CryptoAlgorithm]:
+    # plain values, rather than the wallet and the backend key objects of its
+    # signer, which cannot always be pickled for spawned worker processes
+    return wallet.public_key, wallet.private_key, wallet.address, wallet.algorithm
+
+
+def _init_signing_worker(
+    public_key: str, private_key: str, address: str, algorithm: CryptoAlgorithm
+) -> None:
+    global _worker_wallet
+    _worker_wallet = Wallet(
+        public_key, private_key, master_address=address, algorithm=algorithm
+    )
+    _worker_wallet.get_signer()
+
+
+def _sign_in_worker(transactions: List[T], multisign: bool) -> List[T]:
+    wallet = cast(Wallet, _worker_wallet)
+    return [sign(transaction, wallet, multisign) for transaction in transactions]
+
+
+def _split(transactions: Sequence[T], count: int) -> List[List[T]]:
+    # contiguous chunks, so that concatenating the results keeps the order
+    size = -(-len(transactions) // count)
+    return [
+        list(transactions[start : start + size])
+        for start in range(0, len(transactions), max(size, 1))
+    ]
+
+
 async def autofill_and_sign(
     transaction: T,
     client: Client,
@@ -213,7 +331,7 @@ async def submit(
     Raises:
         XRPLRequestFailureException: if the rippled API call fails.
     """
-    transaction_blob = encode(transaction.to_xrpl())
+    transaction_blob = transaction.blob()
     response = await client._request_impl(
         SubmitOnly(tx_blob=transaction_blob, fail_hard=fail_hard)
     )
@@ -4,6 +4,12 @@ binary format and decoding them.
 """
 
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.core.binarycodec.field_scanner import (
+    FieldIndex,
+    read_field,
+    scan_fields,
+    scan_fields_many,
+)
 from xrpl.core.binarycodec.main import (
     decode,
     encode,
@@ -21,4 +27,8 @@ __all__ = [
     "encode_for_signing",
     "encode_for_signing_claim",
     "XRPLBinaryCodecException",
+    "FieldIndex",
+    "read_field",
+    "scan_fields",
+    "scan_fields_many",
 ]
@@ -2,6 +2,7 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, cast
 
 from xrpl.core.binarycodec.definitions.field_header import FieldHeader
@@ -188,6 +189,9 @@ def get_field_name_from_header(field_header: FieldHeader) -> str:
     return _FIELD_HEADER_NAME_MAP[field_header]
 
 
+# The set of field names is finite and FieldInstances are never modified, so they
+# are built once per field and shared.
+@lru_cache(maxsize=None)
 def get_field_instance(field_name: str) -> FieldInstance:
     """
     Return a FieldInstance object for the given field name.
@@ -0,0 +1,358 @@
+"""
+Scans serialized objects for their top-level fields without decoding them.
+
+The scanner reads each field header and skips over the value using only the
+fixed-width and variable-length rules from the definitions, so no
+:class:`SerializedType` objects are created. The result is an index of
+``(field_ordinal, value_offset, value_length)`` triples, which answers questions
+like "does this object contain field X" or "where is field Y" at scan speed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from typing_extensions import Final, Self
+
+from xrpl.core.binarycodec.definitions import definitions
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+
+_TYPE_CODES: Final[Dict[str, int]] = definitions._TYPE_ORDINAL_MAP
+
+# Serialized byte widths of the fixed-size types.
+_FIXED_WIDTHS: Final[Dict[int, int]] = {
+    _TYPE_CODES[name]: width
+    for name, width in [
+        ("UInt8", 1),
+        ("UInt16", 2),
+        ("UInt32", 4),
+        ("UInt64", 8),
+        ("UInt96", 12),
+        ("Int32", 4),
+        ("Int64", 8),
+        ("Hash128", 16),
+        ("Hash160", 20),
+        ("Hash192", 24),
+        ("Hash256", 32),
+        ("Hash384", 48),
+        ("Hash512", 64),
+        ("Currency", 20),
+        ("Number", 12),
+    ]
+}
+
+_AMOUNT: Final[int] = _TYPE_CODES["Amount"]
+_ISSUE: Final[int] = _TYPE_CODES["Issue"]
+_PATH_SET: Final[int] = _TYPE_CODES["PathSet"]
+_ST_OBJECT: Final[int] = _TYPE_CODES["STObject"]
+_ST_ARRAY: Final[int] = _TYPE_CODES["STArray"]
+_XCHAIN_BRIDGE: Final[int] = _TYPE_CODES["XChainBridge"]
+
+# Ordinal of every field mapped to whether the field is variable-length encoded.
+_IS_VL_ENCODED: Final[Dict[int, bool]] = {
+    _TYPE_CODES[info.type] << 16 | info.nth: info.is_variable_length_encoded
+    for info in definitions._FIELD_INFO_MAP.values()
+    if info.type in _TYPE_CODES and info.nth > 0
+}
+
+_OBJECT_END_MARKER: Final[int] = _ST_OBJECT << 16 | 1
+_ARRAY_END_MARKER: Final[int] = _ST_ARRAY << 16 | 1
+
+_ACCOUNT_ID_LENGTH: Final[int] = 20
+_XRP_CURRENCY: Final[bytes] = bytes(20)
+_BLACK_HOLED_ACCOUNT_ID: Final[bytes] = bytes(19) + b"\x01"
+
+_PATHSET_END_BYTE: Final[int] = 0x00
+_PATH_SEPARATOR_BYTE: Final[int] = 0xFF
+_PATH_STEP_WIDTHS: Final[Tuple[Tuple[int, int], ...]] = (
+    (0x01, 20),  # account
+    (0x10, 20),  # currency
+    (0x20, 20),  # issuer
+)
+
+
+def _read_header(blob: bytes, position: int) -> Tuple[int, int]:
+    """Return the ordinal of the field header at ``position`` and the position of
+    the byte that follows it.
+    """
+    byte = blob[position]
+    position += 1
+    type_code = byte >> 4
+    field_code = byte & 15
+    if type_code == 0:
+        type_code = blob[position]
+        position += 1
+    if field_code == 0:
+        field_code = blob[position]
+        position += 1
+    return type_code << 16 | field_code, position
+
+
+def _read_length_prefix(blob: bytes, position: int) -> Tuple[int, int]:
+    """Return the variable length encoded at ``position`` and the position of the
+    first byte of the value.
+    """
+    byte1 = blob[position]
+    if byte1 <= 192:
+        return byte1, position + 1
+    if byte1 <= 240:
+        return 193 + (byte1 - 193) * 256 + blob[position + 1], position + 2
+    if byte1 <= 254:
+        return (
+            12481
+            + (byte1 - 241) * 65536
+            + blob[position + 1] * 256
+            + blob[position + 2],
+            position + 3,
+        )
+    raise XRPLBinaryCodecException("Length prefix must contain between 1 and 3 bytes.")
+
+
+def _skip_issue(blob: bytes, position: int) -> int:
+    if blob[position : position + 20] == _XRP_CURRENCY:
+        return position + 20
+    position += 20 + _ACCOUNT_ID_LENGTH
+    if blob[position - _ACCOUNT_ID_LENGTH : position] == _BLACK_HOLED_ACCOUNT_ID:
+        position += 4
+    return position
+
+
+def _skip_path_set(blob: bytes, position: int) -> int:
+    while True:
+        byte = blob[position]
+        position += 1
+        if byte == _PATHSET_END_BYTE:
+            return position
+        if byte != _PATH_SEPARATOR_BYTE:
+            for mask, width in _PATH_STEP_WIDTHS:
+                if byte & mask:
+                    position += width
+
+
+def _skip_fields(blob: bytes, position: int, end_marker: int) -> int:
+    """Skip fields until ``end_marker`` and return the position after it."""
+    while True:
+        ordinal, position = _read_header(blob, position)
+        if ordinal == end_marker:
+            return position
+        position = _skip_value(blob, position, ordinal)
+
+
+def _skip_value(blob: bytes, position: int, ordinal: int) -> int:
+    """Return the position after the value of the field with ``ordinal``."""
+    is_vl_encoded = _IS_VL_ENCODED.get(ordinal)
+    if is_vl_encoded is None:
+        raise XRPLBinaryCodecException(f"Unknown field with ordinal {ordinal:#x}.")
+    if is_vl_encoded:
+        length, position = _read_length_prefix(blob, position)
+        return position + length
+
+    type_code = ordinal >> 16
+    width = _FIXED_WIDTHS.get(type_code)
+    if width is not None:
+        return position + width
+    if type_code == _AMOUNT:
+        first_byte = blob[position]
+        if first_byte & 0x80:
+            return position + 48
+        return position + (33 if first_byte & 0x20 else 8)
+    if type_code == _ST_OBJECT:
+        return _skip_fields(blob, position, _OBJECT_END_MARKER)
+    if type_code == _ST_ARRAY:
+        return _skip_fields(blob, position, _ARRAY_END_MARKER)
+    if type_code == _ISSUE:
+        return _skip_issue(blob, position)
+    if type_code == _PATH_SET:
+        return _skip_path_set(blob, position)
+    if type_code == _XCHAIN_BRIDGE:
+        # door account (length-prefixed), issue, door account, issue
+        position = _skip_issue(blob, position + 1 + _ACCOUNT_ID_LENGTH)
+        return _skip_issue(blob, position + 1 + _ACCOUNT_ID_LENGTH)
+    raise XRPLBinaryCodecException(f"Cannot scan a field of type code {type_code}.")
+
+
+def _scan_into(
+    blob: bytes, ordinals: array[int], offsets: array[int], lengths: array[int]
+) -> None:
+    position = 0
+    end = len(blob)
+    try:
+        while position < end:
+            ordinal, position = _read_header(blob, position)
+            if _IS_VL_ENCODED.get(ordinal):
+                length, position = _read_length_prefix(blob, position)
+                value_end = position + length
+            else:
+                value_end = _skip_value(blob, position, ordinal)
+            if value_end > end:
+                raise IndexError
+            ordinals.append(ordinal)
+            offsets.append(position)
+            lengths.append(value_end - position)
+            position = value_end
+    except IndexError:
+        raise XRPLBinaryCodecException(
+            "Unexpected end of data while scanning fields."
+        ) from None
+
+
+def _to_bytes(blob: Union[bytes, str]) -> bytes:
+    return bytes.fromhex(blob) if isinstance(blob, str) else blob
+
+
+def get_field_ordinal(field_name: str) -> int:
+    """
+    Returns the ordinal used to identify a field in a :class:`FieldIndex`.
+
+    Args:
+        field_name: The name of the field, for example ``"Account"``.
+
+    Returns:
+        The ordinal of the field.
+    """
+    return definitions.get_field_instance(field_name).ordinal
+
+
+def scan_fields(blob: Union[bytes, str]) -> List[Tuple[int, int, int]]:
+    """
+    Scan the top-level fields of a serialized object.
+
+    For variable-length encoded fields the offset and length exclude the length
+    prefix. For ``STObject`` and ``STArray`` fields they include the end marker.
+
+    Args:
+        blob: The serialized object, as bytes or hex.
+
+    Returns:
+        A ``(field_ordinal, value_offset, value_length)`` triple for each field,
+        in the order they appear.
+    """
+    index = scan_fields_many([blob])
+    return list(zip(index.ordinals, index.offsets, index.lengths))
+
+
+def scan_fields_many(blobs: Iterable[Union[bytes, str]]) -> FieldIndex:
+    """
+    Scan the top-level fields of many serialized objects into one compact index.
+
+    Args:
+        blobs: The serialized objects, as bytes or hex.
+
+    Returns:
+        The index of the fields of all objects.
+    """
+    index = FieldIndex()
+    for blob in blobs:
+        _scan_into(_to_bytes(blob), index.ordinals, index.offsets, index.lengths)
+        index.starts.append(len(index.ordinals))
+    return index
+
+
+class FieldIndex:
+    """
+    The fields of many serialized objects, stored in flat ``array`` columns.
+
+    The fields of object ``i`` are at positions ``starts[i]`` to
+    ``starts[i + 1]`` of the ``ordinals``, ``offsets`` and ``lengths`` columns.
+    Offsets are relative to the start of each object.
+    """
+
+    def __init__(self: Self) -> None:
+        """Construct an empty FieldIndex."""
+        self.starts: array[int] = array("Q", [0])
+        self.ordinals: array[int] = array("I")
+        self.offsets: array[int] = array("I")
+        self.lengths: array[int] = array("I")
+
+    def __len__(self: Self) -> int:
+        """Return the number of objects in the index."""
+        return len(self.starts) - 1
+
+    def fields(self: Self, blob_number: int) -> List[Tuple[int, int, int]]:
+        """
+        Return the fields of one object.
+
+        Args:
+            blob_number: The position of the object in the scanned input.
+
+        Returns:
+            A ``(field_ordinal, value_offset, value_length)`` triple for each field.
+        """
+        start, end = self.starts[blob_number], self.starts[blob_number + 1]
+        return list(
+            zip(
+                self.ordinals[start:end],
+                self.offsets[start:end],
+                self.lengths[start:end],
+            )
+        )
+
+    def find(
+        self: Self, blob_number: int, field_name: str
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Locate a field in one object.
+
+        Args:
+            blob_number: The position of the object in the scanned input.
+            field_name: The name of the field, for example ``"Account"``.
+
+        Returns:
+            The ``(value_offset, value_length)`` of the field, or ``None`` if the
+            object does not contain it.
+        """
+        ordinal = get_field_ordinal(field_name)
+        for position in range(self.starts[blob_number], self.starts[blob_number + 1]):
+            if self.ordinals[position] == ordinal:
+                return self.offsets[position], self.lengths[position]
+        return None
+
+    def with_field(self: Self, field_name: str) -> Iterator[int]:
+        """
+        Iterate over the objects that contain a field.
+
+        Args:
+            field_name: The name of the field, for example ``"Account"``.
+
+        Yields:
+            The position in the scanned input of each object containing the field.
+        """
+        ordinal = get_field_ordinal(field_name)
+        blob_number = 0
+        starts = self.starts
+        for position, field_ordinal in enumerate(self.ordinals):
+            if field_ordinal != ordinal:
+                continue
+            while starts[blob_number + 1] <= position:
+                blob_number += 1
+            yield blob_number
+
+
+def read_field(
+    blob: Union[bytes, str], offset: int, length: int, field_name: str
+) -> object:
+    """
+    Decode a single field value located with :func:`scan_fields`.
+
+    Args:
+        blob: The serialized object, as bytes or hex.
+        offset: The offset of the field value.
+        length: The length of the field value.
+        field_name: The name of the field.
+
+    Returns:
+        The JSON representation of the field value.
+    """
+    # Decode the field as a one-field object, so that the value is rendered exactly
+    # as :func:`decode` renders it (enum names, base 10 UInt64 fields, ...).
+    from xrpl.core.binarycodec.binary_wrappers.binary_serializer import (
+        _encode_variable_length_prefix,
+    )
+    from xrpl.core.binarycodec.types.st_object import STObject
+
+    field = definitions.get_field_instance(field_name)
+    value = _to_bytes(blob)[offset : offset + length]
+    if field.is_variable_length_encoded:
+        value = _encode_variable_length_prefix(length) + value
+    return STObject(bytes(field.header) + value).to_json()[field_name]
@@ -0,0 +1,198 @@
+"""
+Opt-in instrumentation for the binary codec.
+
+When enabled, every ``from_value``, ``from_parser`` and ``to_json`` call on the
+codec's serialized types is counted and timed per type, together with the number
+of bytes produced or consumed. Hit rates of the codec's internal caches are
+reported alongside.
+
+Instrumentation works by replacing those methods with timing wrappers while it is
+enabled and restoring the originals when it is disabled, so it costs nothing when
+it is not in use. It is meant for profiling and is not thread-safe.
+
+Example::
+
+    from xrpl.core.binarycodec import encode, instrumentation
+
+    with instrumentation.instrument() as stats:
+        encode(tx_json)
+    print(stats["types"]["STObject"]["from_value"])
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Type
+
+from typing_extensions import Final
+
+from xrpl.core.binarycodec.definitions import definitions
+from xrpl.core.binarycodec.types.serialized_type import SerializedType
+
+_INSTRUMENTED_METHODS: Final[Tuple[str, ...]] = ("from_value", "from_parser", "to_json")
+
+# The codec's caches, reported in the "caches" section of a snapshot.
+_CACHES: Final[Dict[str, Any]] = {
+    "field_instance": definitions.get_field_instance,
+}
+
+# type name -> method name -> [calls, seconds, bytes]
+_stats: Dict[str, Dict[str, List[Any]]] = {}
+# cache name -> (hits, misses) when the stats were last reset
+_cache_baseline: Dict[str, Tuple[int, int]] = {}
+# (class, method name, original class attribute) for every installed wrapper
+_originals: List[Tuple[type, str, Any]] = []
+
+
+def _record(type_name: str, method: str, seconds: float, size: int) -> None:
+    entry = _stats.setdefault(type_name, {}).setdefault(method, [0, 0.0, 0])
+    entry[0] += 1
+    entry[1] += seconds
+    entry[2] += size
+
+
+def _wrap_classmethod(method: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(
+        cls: Type[SerializedType], *args: Any, **kwargs: Any  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        start = perf_counter()
+        result = func(cls, *args, **kwargs)
+        _record(cls.__name__, method, perf_counter() - start, len(result.buffer))
+        return result
+
+    return wrapper
+
+
+def _wrap_to_json(func: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(func)
+    def wrapper(
+        self: SerializedType, *args: Any, **kwargs: Any  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        start = perf_counter()
+        result = func(self, *args, **kwargs)
+        _record(
+            type(self).__name__, "to_json", perf_counter() - start, len(self.buffer)
+        )
+        return result
+
+    return wrapper
+
+
+def _all_types() -> List[type]:
+    # Importing the types package guarantees every codec type has been defined.
+    import xrpl.core.binarycodec.types  # noqa: F401
+
+    found: List[type] = [SerializedType]
+    for cls in found:
+        subclasses: List[type] = type.__subclasses__(cls)
+        found.extend(subclass for subclass in subclasses if subclass not in found)
+    return found
+
+
+def is_enabled() -> bool:
+    """
+    Returns whether codec instrumentation is currently enabled.
+
+    Returns:
+        Whether codec instrumentation is currently enabled.
+    """
+    return len(_originals) > 0
+
+
+def enable() -> None:
+    """
+    Starts collecting codec statistics. Statistics collected before are kept; call
+    :func:`reset` to clear them. Does nothing if instrumentation is already enabled.
+    """
+    if is_enabled():
+        return
+    for cls in _all_types():
+        for method in _INSTRUMENTED_METHODS:
+            attribute = cls.__dict__.get(method)
+            if attribute is None:
+                continue
+            if isinstance(attribute, classmethod):
+                func = attribute.__func__
+                if getattr(func, "__isabstractmethod__", False):
+                    continue
+                wrapped: Any = classmethod(_wrap_classmethod(method, func))
+            else:
+                wrapped = _wrap_to_json(attribute)
+            _originals.append((cls, method, attribute))
+            setattr(cls, method, wrapped)
+
+
+def disable() -> None:
+    """
+    Stops collecting codec statistics and restores the uninstrumented methods.
+    Collected statistics are kept until :func:`reset` is called.
+    """
+    while _originals:
+        cls, method, attribute = _originals.pop()
+        setattr(cls, method, attribute)
+
+
+def reset() -> None:
+    """Clears all collected codec statistics."""
+    _stats.clear()
+    for name, cache in _CACHES.items():
+        info = cache.cache_info()
+        _cache_baseline[name] = (info.hits, info.misses)
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Returns the statistics collected since the last :func:`reset`.
+
+    Returns:
+        A dictionary with a ``types`` entry mapping each type name to per-method
+        ``calls``, cumulative ``seconds`` (including nested calls) and ``bytes``,
+        and a ``caches`` entry mapping each cache name to its ``hits``, ``misses``
+        and ``hit_rate``.
+    """
+    types = {
+        type_name: {
+            method: {"calls": calls, "seconds": seconds, "bytes": size}
+            for method, (calls, seconds, size) in methods.items()
+        }
+        for type_name, methods in _stats.items()
+    }
+    caches = {}
+    for name, cache in _CACHES.items():
+        info = cache.cache_info()
+        base_hits, base_misses = _cache_baseline.get(name, (0, 0))
+        hits = info.hits - base_hits
+        misses = info.misses - base_misses
+        lookups = hits + misses
+        caches[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups > 0 else 0.0,
+        }
+    return {"types": types, "caches": caches}
+
+
+@contextmanager
+def instrument() -> Iterator[Dict[str, Any]]:
+    """
+    Collects codec statistics for the duration of a ``with`` block.
+
+    Statistics are reset on entry. The yielded dictionary is filled with the
+    :func:`snapshot` when the block exits.
+
+    Yields:
+        A dictionary that holds the collected statistics once the block exits.
+    """
+    was_enabled = is_enabled()
+    reset()
+    enable()
+    stats: Dict[str, Any] = {}
+    try:
+        yield stats
+    finally:
+        if not was_enabled:
+            disable()
+        stats.update(snapshot())
@@ -4,11 +4,14 @@ Note: Much of the ideas and constants in this file are borrowed from the rippled
 implementation of the `Number` and `STNumber` class. Please refer to the cpp code.
 """
 
+from __future__ import annotations
+
 import math
 import re
-from typing import Optional, Pattern, Tuple, Type
+from bisect import bisect_right
+from typing import Optional, Pattern, Tuple, Type, Union
 
-from typing_extensions import Self
+from typing_extensions import Final, Self
 
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
@@ -32,6 +35,40 @@ _MAX_EXPONENT = 32768
 # the below value is used for the representation of Number zero
 _DEFAULT_VALUE_EXPONENT = -2147483648
 
+# Number of decimal digits in a normalized mantissa, i.e. len(str(_MIN_MANTISSA))
+_MANTISSA_DIGITS: Final[int] = 19
+
+# Powers of ten used to count digits and to rescale mantissas in a single step,
+# instead of multiplying or dividing by 10 in a loop.
+_POWERS_OF_TEN: Final[Tuple[int, ...]] = tuple(10**i for i in range(64))
+
+# When the exponents of two addends are further apart than this, the smaller one
+# is far below the rounding position of the result and only its sign matters. It is
+# then replaced by a minimal value of the same sign to keep the integers small.
+_MAX_EXPONENT_GAP: Final[int] = 2 * _MANTISSA_DIGITS + 2
+
+_VALID_NUMBER_REGEX: Final[Pattern[str]] = re.compile(
+    r"^"  # the beginning of the string
+    + r"([-+]?)"  # (optional) + or - character
+    + r"(0|[1-9][0-9]*)"  # mantissa: a number (no leading zeroes, unless 0)
+    + r"(\.([0-9]+))?"  # (optional) decimal point and fractional part
+    + r"([eE]([+-]?)([0-9]+))?"  # (optional) E/e, optional + or -, any number
+    + r"$"  # the end of the string
+)
+
+
+def _pow10(n: int) -> int:
+    if n < len(_POWERS_OF_TEN):
+        return _POWERS_OF_TEN[n]
+    return int(10**n)
+
+
+def _num_digits(value: int) -> int:
+    """Return the number of decimal digits of a positive integer."""
+    if value < _POWERS_OF_TEN[-1]:
+        return bisect_right(_POWERS_OF_TEN, value)
+    return len(str(value))
+
 
 def normalize(mantissa: int, exponent: int) -> Tuple[int, int]:
     """Normalize the mantissa and exponent of a number.
@@ -51,21 +88,25 @@ def normalize(mantissa: int, exponent: int) -> Tuple[int, int]:
 
     is_negative = mantissa < 0
     m = abs(mantissa)
+    digits = _num_digits(m)
 
     # Scale up mantissa while it's below minimum
-    while m < _MIN_MANTISSA and exponent > _MIN_EXPONENT:
-        m *= 10
-        exponent -= 1
+    if digits < _MANTISSA_DIGITS and exponent > _MIN_EXPONENT:
+        shift = min(_MANTISSA_DIGITS - digits, exponent - _MIN_EXPONENT)
+        m *= _pow10(shift)
+        exponent -= shift
 
     truncated_digit: int = 0
 
-    # Scale down mantissa while it's above maximum, pushing digits to guard
-    while m > _MAX_MANTISSA:
-        if exponent >= _MAX_EXPONENT:
+    # Scale down mantissa while it's above maximum, pushing digits to guard. Only
+    # the last digit that is pushed out takes part in the rounding below.
+    if digits > _MANTISSA_DIGITS:
+        shift = digits - _MANTISSA_DIGITS
+        if exponent + shift - 1 >= _MAX_EXPONENT:
             raise XRPLBinaryCodecException("Number::normalize overflow 1")
-        truncated_digit = m % 10
-        m //= 10
-        exponent += 1
+        truncated_digit = m // _pow10(shift - 1) % 10
+        m //= _pow10(shift)
+        exponent += shift
 
     # Handle underflow
     if exponent < _MIN_EXPONENT or m < _MIN_MANTISSA:
@@ -116,13 +157,7 @@ def add32(value: int) -> bytes:
     Returns:
         A bytes object containing the serialized integer
     """
-    serialized_bytes = bytes()
-    serialized_bytes += (value >> 24 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 16 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 8 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value & 0xFF).to_bytes(1, "big")
-
-    return serialized_bytes
+    return (value & 0xFFFFFFFF).to_bytes(4, "big")
 
 
 def add64(value: int) -> bytes:
@@ -134,17 +169,69 @@ def add64(value: int) -> bytes:
     Returns:
         A bytes object containing the serialized integer
     """
-    serialized_bytes = bytes()
-    serialized_bytes += (value >> 56 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 48 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 40 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 32 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 24 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 16 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value >> 8 & 0xFF).to_bytes(1, "big")
-    serialized_bytes += (value & 0xFF).to_bytes(1, "big")
+    return (value & 0xFFFFFFFFFFFFFFFF).to_bytes(8, "big")
+
 
-    return serialized_bytes
+def _round_quotient(
+    is_negative: bool, numerator: int, denominator: int, exponent: int
+) -> Tuple[int, int]:
+    """Round the exact value ``numerator / denominator * 10**exponent`` to a
+    normalized mantissa and exponent.
+
+    This mirrors the result of rippled's `Number` arithmetic in the default
+    "to_nearest" rounding mode: all discarded digits take part in the rounding (the
+    guard digits and sticky bit in rippled) and ties are rounded to an even
+    mantissa. As in `normalize`, a mantissa that does not fit in an int64 is cut
+    down by one more digit before rounding.
+
+    Args:
+        is_negative: Whether the value is negative
+        numerator: The (non-negative) numerator of the value
+        denominator: The (positive) denominator of the value
+        exponent: The power of ten the quotient is scaled by
+
+    Returns:
+        A tuple containing the normalized mantissa and exponent
+
+    Raises:
+        XRPLBinaryCodecException: If the result is too large to be represented.
+    """
+    if numerator == 0:
+        return (0, _DEFAULT_VALUE_EXPONENT)
+
+    # The quotient scaled by 10**shift has either 19 or 20 digits.
+    shift = _MANTISSA_DIGITS - (_num_digits(numerator) - _num_digits(denominator))
+    while True:
+        if shift >= 0:
+            scaled_numerator, scaled_denominator = (
+                numerator * _pow10(shift),
+                denominator,
+            )
+        else:
+            scaled_numerator, scaled_denominator = numerator, denominator * _pow10(
+                -shift
+            )
+        m, remainder = divmod(scaled_numerator, scaled_denominator)
+        if m > _MAX_MANTISSA:
+            shift -= 1
+            continue
+        twice_remainder = 2 * remainder
+        if twice_remainder > scaled_denominator or (
+            twice_remainder == scaled_denominator and m & 1
+        ):
+            m += 1
+        if m > _MAX_REP:
+            shift -= 1
+            continue
+        break
+
+    exponent -= shift
+    if exponent > _MAX_EXPONENT:
+        raise XRPLBinaryCodecException("Number overflow: exponent too large")
+    if exponent < _MIN_EXPONENT:
+        return (0, _DEFAULT_VALUE_EXPONENT)
+
+    return (-m if is_negative else m, exponent)
 
 
 class NumberParts:
@@ -172,16 +259,7 @@ def extractNumberPartsFromString(value: str) -> NumberParts:
     Returns:
         A NumberParts instance containing the mantissa, exponent and sign
     """
-    VALID_NUMBER_REGEX: Pattern[str] = re.compile(
-        r"^"  # the beginning of the string
-        + r"([-+]?)"  # (optional) + or - character
-        + r"(0|[1-9][0-9]*)"  # mantissa: a number (no leading zeroes, unless 0)
-        + r"(\.([0-9]+))?"  # (optional) decimal point and fractional part
-        + r"([eE]([+-]?)([0-9]+))?"  # (optional) E/e, optional + or -, any number
-        + r"$"  # the end of the string
-    )
-
-    matches = re.fullmatch(VALID_NUMBER_REGEX, value)
+    matches = _VALID_NUMBER_REGEX.fullmatch(value)
 
     if not matches:
         raise XRPLBinaryCodecException(
@@ -290,8 +368,7 @@ class Number(SerializedType):
 
     @classmethod
     def from_mantissa_exponent(cls: Type[Self], _mantissa: int, _exponent: int) -> Self:
-        """Construct a Number from mantissa and exponent values. Note: This method is
-        only used in unit tests.
+        """Construct a Number from mantissa and exponent values.
 
         Args:
             _mantissa: The mantissa of the number
@@ -343,32 +420,209 @@ class Number(SerializedType):
         if exponent != 0 and (
             exponent < -(_MANTISSA_LOG + 10) or exponent > -(_MANTISSA_LOG - 10)
         ):
-            while mantissa != 0 and mantissa % 10 == 0 and exponent < _MAX_EXPONENT:
-                mantissa = mantissa // 10
-                exponent += 1
+            digits = str(mantissa)
+            trailing_zeros = min(
+                len(digits) - len(digits.rstrip("0")), _MAX_EXPONENT - exponent
+            )
+            if mantissa != 0 and trailing_zeros > 0:
+                mantissa //= _pow10(trailing_zeros)
+                exponent += trailing_zeros
 
             return f"{mantissa}e{exponent}"
 
         is_negative = mantissa < 0
-        mantissa = abs(mantissa)
+        integer_part, fraction_part = divmod(abs(mantissa), _pow10(-exponent))
 
-        PAD_PREFIX = int(_MANTISSA_LOG + 12)
-        PAD_SUFFIX = int(_MANTISSA_LOG + 8)
+        generate_exponent: str = ""
+        if fraction_part != 0:
+            generate_exponent = "." + str(fraction_part).zfill(-exponent).rstrip("0")
 
-        raw_value: str = "0" * PAD_PREFIX + str(mantissa) + "0" * PAD_SUFFIX
+        return f"{'-' if is_negative else ''}{integer_part}{generate_exponent}"
 
-        # In cases where the mantissa exceeds _MAX_REP, the number of digits in the
-        # decimal representation of `mantissa` is one less than _MANTISSA_LOG
-        OFFSET = int(exponent + PAD_PREFIX + len(str(mantissa)))
-        assert OFFSET > 0, "Exponent is below acceptable limit"
+    def __repr__(self: Self) -> str:
+        """Return a string representation of the Number (for debugging)."""
+        return f"Number('{self.to_json()}')"
 
-        generate_mantissa: str = raw_value[:OFFSET].lstrip("0")
+    def _to_parts(self: Self) -> Tuple[int, int]:
+        """Return the (mantissa, exponent) pair stored in the buffer."""
+        mantissa = int.from_bytes(self.buffer[:8], byteorder="big", signed=True)
+        exponent = int.from_bytes(self.buffer[8:12], byteorder="big", signed=True)
+        return mantissa, exponent
 
-        if generate_mantissa == "":
-            generate_mantissa = "0"
+    @classmethod
+    def _from_parts(cls: Type[Self], mantissa: int, exponent: int) -> Self:
+        """Construct a Number from an already normalized mantissa and exponent."""
+        return cls(add64(mantissa) + add32(exponent))
 
-        generate_exponent: str = raw_value[OFFSET:].rstrip("0")
-        if generate_exponent != "":
-            generate_exponent = "." + generate_exponent
+    @classmethod
+    def _coerce(cls: Type[Self], value: object) -> Optional[Number]:
+        if isinstance(value, Number):
+            return value
+        if isinstance(value, int):
+            return cls.from_mantissa_exponent(value, 0)
+        return None
+
+    def _aligned_sum(self: Self, other: Number, negate_other: bool) -> Tuple[int, int]:
+        """Return the exact sum (or difference) of two Numbers as an integer
+        mantissa and a common exponent.
+        """
+        x_mantissa, x_exponent = self._to_parts()
+        y_mantissa, y_exponent = other._to_parts()
+        if negate_other:
+            y_mantissa = -y_mantissa
+        if x_mantissa == 0:
+            return y_mantissa, y_exponent
+        if y_mantissa == 0:
+            return x_mantissa, x_exponent
+
+        if x_exponent < y_exponent:
+            x_mantissa, x_exponent, y_mantissa, y_exponent = (
+                y_mantissa,
+                y_exponent,
+                x_mantissa,
+                x_exponent,
+            )
+        if x_exponent - y_exponent > _MAX_EXPONENT_GAP:
+            y_mantissa = 1 if y_mantissa > 0 else -1
+            y_exponent = x_exponent - _MAX_EXPONENT_GAP
+
+        return x_mantissa * _pow10(x_exponent - y_exponent) + y_mantissa, y_exponent
+
+    def _add(self: Self, other: Number, negate_other: bool) -> Number:
+        mantissa, exponent = self._aligned_sum(other, negate_other)
+        if mantissa == 0:
+            return self._from_parts(0, _DEFAULT_VALUE_EXPONENT)
+        return self._from_parts(
+            *_round_quotient(mantissa < 0, abs(mantissa), 1, exponent)
+        )
+
+    def _compare(self: Self, other: Number) -> int:
+        mantissa, _ = self._aligned_sum(other, True)
+        return (mantissa > 0) - (mantissa < 0)
+
+    def __add__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the sum of two Numbers, rounded as rippled does."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._add(other_number, False)
+
+    __radd__ = __add__
+
+    def __sub__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the difference of two Numbers, rounded as rippled does."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._add(other_number, True)
+
+    def __rsub__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the difference of two Numbers, rounded as rippled does."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return other_number._add(self, True)
+
+    def __mul__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the product of two Numbers, rounded as rippled does."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        x_mantissa, x_exponent = self._to_parts()
+        y_mantissa, y_exponent = other_number._to_parts()
+        product = x_mantissa * y_mantissa
+        return self._from_parts(
+            *_round_quotient(product < 0, abs(product), 1, x_exponent + y_exponent)
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the quotient of two Numbers, rounded as rippled does.
+
+        Raises:
+            XRPLBinaryCodecException: If dividing by zero.
+        """
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._divide(other_number)
+
+    def __rtruediv__(self: Self, other: Union[Number, int]) -> Number:
+        """Return the quotient of two Numbers, rounded as rippled does."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return other_number._divide(self)
+
+    def _divide(self: Self, other: Number) -> Number:
+        x_mantissa, x_exponent = self._to_parts()
+        y_mantissa, y_exponent = other._to_parts()
+        if y_mantissa == 0:
+            raise XRPLBinaryCodecException("Number: divide by 0")
+        return self._from_parts(
+            *_round_quotient(
+                (x_mantissa < 0) != (y_mantissa < 0),
+                abs(x_mantissa),
+                abs(y_mantissa),
+                x_exponent - y_exponent,
+            )
+        )
 
-        return f"{'-' if is_negative else ''}{generate_mantissa}{generate_exponent}"
+    def __neg__(self: Self) -> Number:
+        """Return the negation of the Number."""
+        mantissa, exponent = self._to_parts()
+        return self._from_parts(-mantissa, exponent)
+
+    def __abs__(self: Self) -> Number:
+        """Return the absolute value of the Number."""
+        mantissa, exponent = self._to_parts()
+        return self._from_parts(abs(mantissa), exponent)
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Two Numbers are equal if they represent the same value."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._compare(other_number) == 0
+
+    def __lt__(self: Self, other: Union[Number, int]) -> bool:
+        """Compare the values of two Numbers."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._compare(other_number) < 0
+
+    def __le__(self: Self, other: Union[Number, int]) -> bool:
+        """Compare the values of two Numbers."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._compare(other_number) <= 0
+
+    def __gt__(self: Self, other: Union[Number, int]) -> bool:
+        """Compare the values of two Numbers."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._compare(other_number) > 0
+
+    def __ge__(self: Self, other: Union[Number, int]) -> bool:
+        """Compare the values of two Numbers."""
+        other_number = self._coerce(other)
+        if other_number is None:
+            return NotImplemented
+        return self._compare(other_number) >= 0
+
+    def __hash__(self: Self) -> int:
+        """Equal Numbers (and integers equal to them) have the same hash value."""
+        mantissa, exponent = self._to_parts()
+        if mantissa == 0:
+            return hash(0)
+        digits = str(mantissa)
+        trailing_zeros = len(digits) - len(digits.rstrip("0"))
+        mantissa //= _pow10(trailing_zeros)
+        exponent += trailing_zeros
+        if exponent >= 0:
+            return hash(mantissa * _pow10(exponent))
+        return hash((mantissa, exponent))
@@ -3,6 +3,7 @@ Low-level functions for creating and using cryptographic keys with the XRP
 Ledger.
 """
 
+from xrpl.core.keypairs import cache
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
 from xrpl.core.keypairs.main import (
     derive_classic_address,
@@ -10,13 +11,18 @@ from xrpl.core.keypairs.main import (
     generate_seed,
     is_valid_message,
     sign,
+    verify_many,
 )
+from xrpl.core.keypairs.signer import Signer
 
 __all__ = [
+    "cache",
     "derive_classic_address",
     "derive_keypair",
     "generate_seed",
     "is_valid_message",
     "sign",
+    "Signer",
+    "verify_many",
     "XRPLKeypairsException",
 ]
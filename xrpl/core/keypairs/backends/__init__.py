@@ -0,0 +1,243 @@
+"""
+Registry of the implementations ("backends") of each cryptographic algorithm.
+
+Each algorithm has a list of backends in order of preference. By default the first
+one that can be loaded is used: the OpenSSL-backed implementations if the optional
+``cryptography`` package is installed, then the native Ed25519 implementation from
+``pycryptodome``, and finally the pure-Python ECPy implementations, which are
+always available.
+
+Every backend is checked against known signatures when it is loaded, and is only
+used if it produces exactly the same keys and signatures as ECPy.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from typing_extensions import Final
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core.keypairs.crypto_implementation import CryptoImplementation
+from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+
+BackendLoader = Callable[[], Type[CryptoImplementation]]
+
+_KNOWN_ANSWER_MESSAGE: Final[bytes] = b"test message"
+# (decoded seed, public key, private key, signature of _KNOWN_ANSWER_MESSAGE)
+_KNOWN_ANSWERS: Final[Dict[CryptoAlgorithm, Tuple[bytes, str, str, str]]] = {
+    CryptoAlgorithm.ED25519: (
+        bytes.fromhex("0102030405060708090a0b0c0d0e0f10"),
+        "ED01FA53FA5A7E77798F882ECE20B1ABC00BB358A9E55A202D0D0676BD0CE37A63",
+        "EDB4C4E046826BD26190D09715FC31F4E6A728204EADD112905B08B14B7F15C4F3",
+        "CB199E1BFD4E3DAA105E4832EEDFA36413E1F44205E4EFB9E27E826044C21E3E"
+        "2E848BBC8195E8959BADF887599B7310AD1B7047EF11B682E0D068F73749750E",
+    ),
+    CryptoAlgorithm.SECP256K1: (
+        bytes.fromhex("0102030405060708090a0b0c0d0e0f10"),
+        "030D58EB48B4420B1F7B9DF55087E0E29FEF0E8468F9A6825B01CA2C361042D435",
+        "00D78B9735C3F26501C7337B8A5727FD53A6EFDBC6AA55984F098488561F985E23",
+        "30440220583A91C95E54E6A651C47BEC22744E0B101E2C4060E7B08F6341657DAD9BC3EE"
+        "02207D1489C7395DB0188D3A56A977ECBA54B36FA9371B40319655B1B4429E33EF2D",
+    ),
+}
+
+
+def _load_openssl_ed25519() -> Type[CryptoImplementation]:
+    from xrpl.core.keypairs.backends.openssl import OpenSSLED25519
+
+    return OpenSSLED25519
+
+
+def _load_openssl_secp256k1() -> Type[CryptoImplementation]:
+    from xrpl.core.keypairs.backends.openssl import OpenSSLSECP256K1
+
+    return OpenSSLSECP256K1
+
+
+def _load_pycryptodome_ed25519() -> Type[CryptoImplementation]:
+    from xrpl.core.keypairs.backends.pycryptodome import PycryptodomeED25519
+
+    return PycryptodomeED25519
+
+
+def _load_ecpy_ed25519() -> Type[CryptoImplementation]:
+    from xrpl.core.keypairs.ed25519 import ED25519
+
+    return ED25519
+
+
+def _load_ecpy_secp256k1() -> Type[CryptoImplementation]:
+    from xrpl.core.keypairs.secp256k1 import SECP256K1
+
+    return SECP256K1
+
+
+# algorithm -> [(backend name, loader)], in order of preference
+_REGISTRY: Final[Dict[CryptoAlgorithm, List[Tuple[str, BackendLoader]]]] = {
+    CryptoAlgorithm.ED25519: [
+        ("openssl", _load_openssl_ed25519),
+        ("pycryptodome", _load_pycryptodome_ed25519),
+        ("ecpy", _load_ecpy_ed25519),
+    ],
+    CryptoAlgorithm.SECP256K1: [
+        ("openssl", _load_openssl_secp256k1),
+        ("ecpy", _load_ecpy_secp256k1),
+    ],
+}
+
+# (algorithm, backend name) -> the loaded backend, or None if it cannot be used
+_loaded: Dict[Tuple[CryptoAlgorithm, str], Optional[Type[CryptoImplementation]]] = {}
+# algorithm -> the backend currently in use
+_selected: Dict[CryptoAlgorithm, Type[CryptoImplementation]] = {}
+
+
+def _passes_known_answers(
+    algorithm: CryptoAlgorithm, backend: Type[CryptoImplementation]
+) -> bool:
+    decoded_seed, public_key, private_key, signature = _KNOWN_ANSWERS[algorithm]
+    return (
+        backend.derive_keypair(decoded_seed, False) == (public_key, private_key)
+        and backend.sign(_KNOWN_ANSWER_MESSAGE, private_key).hex().upper() == signature
+        and backend.is_valid_message(
+            _KNOWN_ANSWER_MESSAGE, bytes.fromhex(signature), public_key
+        )
+    )
+
+
+def _try_load(
+    algorithm: CryptoAlgorithm, name: str, loader: BackendLoader
+) -> Optional[Type[CryptoImplementation]]:
+    key = (algorithm, name)
+    if key not in _loaded:
+        backend: Optional[Type[CryptoImplementation]]
+        try:
+            backend = loader()
+            if not _passes_known_answers(algorithm, backend):
+                backend = None
+        except Exception:
+            # a missing optional dependency, or one too old to support this use
+            backend = None
+        _loaded[key] = backend
+    return _loaded[key]
+
+
+def register_backend(
+    algorithm: CryptoAlgorithm,
+    name: str,
+    loader: BackendLoader,
+    preferred: bool = False,
+) -> None:
+    """
+    Registers a backend for a cryptographic algorithm.
+
+    Args:
+        algorithm: The algorithm the backend implements.
+        name: The name of the backend. Replaces any backend with the same name.
+        loader: A function returning the backend. It may raise ``ImportError`` if
+            the backend's dependencies are not installed.
+        preferred: Whether to prefer this backend over all other registered
+            backends, instead of using it only if none of them can be loaded.
+    """
+    backends = [entry for entry in _REGISTRY[algorithm] if entry[0] != name]
+    if preferred:
+        backends.insert(0, (name, loader))
+    else:
+        backends.append((name, loader))
+    _REGISTRY[algorithm][:] = backends
+    _loaded.pop((algorithm, name), None)
+    _selected.pop(algorithm, None)
+
+
+def available_backends(algorithm: CryptoAlgorithm) -> List[str]:
+    """
+    Returns the names of the backends of an algorithm that can be used here.
+
+    Args:
+        algorithm: The cryptographic algorithm.
+
+    Returns:
+        The names of the usable backends, in order of preference.
+    """
+    return [
+        name
+        for name, loader in _REGISTRY[algorithm]
+        if _try_load(algorithm, name, loader) is not None
+    ]
+
+
+def load_backend(algorithm: CryptoAlgorithm, name: str) -> Type[CryptoImplementation]:
+    """
+    Returns a backend of an algorithm by name.
+
+    Args:
+        algorithm: The cryptographic algorithm.
+        name: The name of the backend, for example ``"ecpy"``.
+
+    Returns:
+        The backend.
+
+    Raises:
+        XRPLKeypairsException: If there is no usable backend with that name.
+    """
+    for backend_name, loader in _REGISTRY[algorithm]:
+        if backend_name == name:
+            backend = _try_load(algorithm, name, loader)
+            if backend is None:
+                raise XRPLKeypairsException(
+                    f"The {name} backend for {algorithm.value} is not available."
+                )
+            return backend
+    raise XRPLKeypairsException(f"Unknown {algorithm.value} backend: {name}.")
+
+
+def get_backend(algorithm: CryptoAlgorithm) -> Type[CryptoImplementation]:
+    """
+    Returns the backend used for an algorithm.
+
+    Args:
+        algorithm: The cryptographic algorithm.
+
+    Returns:
+        The backend selected with :func:`set_backend`, or else the most preferred
+        usable backend.
+
+    Raises:
+        XRPLKeypairsException: If no backend of the algorithm can be used.
+    """
+    backend = _selected.get(algorithm)
+    if backend is None:
+        for name, loader in _REGISTRY[algorithm]:
+            backend = _try_load(algorithm, name, loader)
+            if backend is not None:
+                break
+        else:
+            raise XRPLKeypairsException(
+                f"No backend for {algorithm.value} is available."
+            )
+        _selected[algorithm] = backend
+    return backend
+
+
+def set_backend(algorithm: CryptoAlgorithm, name: Optional[str]) -> None:
+    """
+    Selects the backend used for an algorithm.
+
+    Args:
+        algorithm: The cryptographic algorithm.
+        name: The name of the backend, or ``None`` to go back to using the most
+            preferred usable backend.
+    """
+    if name is None:
+        _selected.pop(algorithm, None)
+    else:
+        _selected[algorithm] = load_backend(algorithm, name)
+
+
+__all__ = [
+    "available_backends",
+    "get_backend",
+    "load_backend",
+    "register_backend",
+    "set_backend",
+]
@@ -0,0 +1,340 @@
+"""
+Ed25519 and secp256k1 implementations backed by OpenSSL, through the optional
+``cryptography`` package.
+
+Importing this module raises :class:`ImportError` if ``cryptography`` is not
+installed.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple, Type, cast
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, utils
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from typing_extensions import Final, Self
+
+from xrpl.core.keypairs.ed25519 import ED25519, PREFIX
+from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+from xrpl.core.keypairs.helpers import sha512_first_half
+from xrpl.core.keypairs.secp256k1 import (
+    _GROUP_ORDER,
+    _INTERMEDIATE_KEYPAIR_PADDING,
+    SECP256K1,
+)
+
+_SECP256K1_CURVE: Final[ec.EllipticCurve] = ec.SECP256K1()
+# Signatures are over the SHA-512Half of the message, with RFC 6979 nonces derived
+# with HMAC-SHA256, as ECPy's ``sign_rfc6979`` does
+_ECDSA_SIGN: Final[ec.ECDSA] = ec.ECDSA(
+    utils.Prehashed(hashes.SHA256()), deterministic_signing=True
+)
+_ECDSA_VERIFY: Final[ec.ECDSA] = ec.ECDSA(utils.Prehashed(hashes.SHA256()))
+
+
+class OpenSSLED25519(ED25519):
+    """Methods for using the Ed25519 cryptographic system, backed by OpenSSL."""
+
+    @classmethod
+    def derive_keypair(
+        cls: Type[Self], decoded_seed: bytes, is_validator: bool
+    ) -> Tuple[str, str]:
+        """
+        Derives a key pair in Ed25519 format for use with the XRP Ledger from a
+        seed value.
+
+        Args:
+            decoded_seed: The Ed25519 seed to derive a key pair from, as bytes.
+            is_validator: Whether to derive a validator keypair.
+                However, validator signing keys cannot use Ed25519.
+
+        Returns:
+            A (public key, private key) pair derived from the given seed.
+
+        Raises:
+            XRPLKeypairsException: If the keypair is a validator keypair.
+        """
+        if is_validator:
+            raise XRPLKeypairsException("Validator key pairs cannot use Ed25519")
+
+        raw_private = sha512_first_half(decoded_seed)
+        private = ed25519.Ed25519PrivateKey.from_private_bytes(raw_private)
+        raw_public = private.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+        return cls._format_key(raw_public.hex()), cls._format_key(raw_private.hex())
+
+    @classmethod
+    def sign(cls: Type[Self], message: bytes, private_key: str) -> bytes:
+        """
+        Signs a message using a given Ed25519 private key.
+
+        Args:
+            message: The message to sign, as bytes.
+            private_key: The private key to use to sign the message.
+
+        Returns:
+            The signature of the message.
+        """
+        return cls.sign_with_key(message, cls.load_private_key(private_key))
+
+    @classmethod
+    def load_private_key(
+        cls: Type[Self], private_key: str
+    ) -> ed25519.Ed25519PrivateKey:
+        """
+        Parses an Ed25519 private key, for signing many messages with
+        :meth:`sign_with_key`.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            The parsed private key.
+        """
+        raw_private = bytes.fromhex(private_key[len(PREFIX) :].zfill(64))
+        return ed25519.Ed25519PrivateKey.from_private_bytes(raw_private)
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key parsed by :meth:`load_private_key`.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The parsed private key.
+
+        Returns:
+            The signature of the message.
+        """
+        return cast(ed25519.Ed25519PrivateKey, key).sign(message)
+
+    @classmethod
+    def is_valid_message(
+        cls: Type[Self], message: bytes, signature: bytes, public_key: str
+    ) -> bool:
+        """
+        Verifies the signature on a given message.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            public_key: The public key to use to verify the message and
+                signature.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        try:
+            wrapped_public = cls.load_public_key(public_key)
+        except ValueError:
+            return False
+        return cls.is_valid_message_with_key(message, signature, wrapped_public)
+
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> ed25519.Ed25519PublicKey:
+        """
+        Parses a public key, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            The parsed public key.
+        """
+        raw_public = bytes.fromhex(public_key[len(PREFIX) :])
+        return ed25519.Ed25519PublicKey.from_public_bytes(raw_public)
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        try:
+            cast(ed25519.Ed25519PublicKey, key).verify(signature, message)
+        except (InvalidSignature, ValueError):
+            return False
+        return True
+
+
+class OpenSSLSECP256K1(SECP256K1):
+    """
+    Methods for using the ECDSA cryptographic system with the secp256k1
+    elliptic curve, backed by OpenSSL.
+    """
+
+    @classmethod
+    def derive_keypair(
+        cls: Type[Self], decoded_seed: bytes, is_validator: bool
+    ) -> Tuple[str, str]:
+        """
+        Derive the public and private secp256k1 keys from a given seed value.
+
+        Args:
+            decoded_seed: The secp256k1 seed to derive a key pair from, as bytes.
+            is_validator: Whether to derive a validator keypair.
+
+        Returns:
+            A (public key, private key) pair derived from the given seed.
+        """
+        root_private = int.from_bytes(
+            cls._get_secret(lambda candidate: decoded_seed + candidate), "big"
+        )
+        root_public = cls._public_key_bytes(root_private)
+        # validator keys just stop at the first pass
+        if is_validator:
+            return cls._format_private_and_public(root_private, root_public)
+
+        mid_private = int.from_bytes(
+            cls._get_secret(
+                lambda candidate: root_public
+                + _INTERMEDIATE_KEYPAIR_PADDING
+                + candidate
+            ),
+            "big",
+        )
+        # the public key of a sum of private keys is the sum of their public keys
+        final_private = (root_private + mid_private) % _GROUP_ORDER
+        return cls._format_private_and_public(
+            final_private, cls._public_key_bytes(final_private)
+        )
+
+    @classmethod
+    def sign(cls: Type[Self], message: bytes, private_key: str) -> bytes:
+        """
+        Signs a message using a given secp256k1 private key.
+
+        Args:
+            message: The message to sign, as bytes.
+            private_key: The private key to use to sign the message.
+
+        Returns:
+            The signature of the message, as bytes.
+        """
+        return cls.sign_with_key(message, cls.load_private_key(private_key))
+
+    @classmethod
+    def load_private_key(
+        cls: Type[Self], private_key: str
+    ) -> ec.EllipticCurvePrivateKey:
+        """
+        Parses a secp256k1 private key, for signing many messages with
+        :meth:`sign_with_key`.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            The parsed private key.
+        """
+        return ec.derive_private_key(int(private_key, 16), _SECP256K1_CURVE)
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key parsed by :meth:`load_private_key`.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The parsed private key.
+
+        Returns:
+            The signature of the message, as bytes.
+        """
+        wrapped_private = cast(ec.EllipticCurvePrivateKey, key)
+        signature = wrapped_private.sign(sha512_first_half(message), _ECDSA_SIGN)
+        r, s = utils.decode_dss_signature(signature)
+        if s > _GROUP_ORDER // 2:
+            # canonical (low S) form, as required by the XRP Ledger
+            return utils.encode_dss_signature(r, _GROUP_ORDER - s)
+        return signature
+
+    @classmethod
+    def is_valid_message(
+        cls: Type[Self], message: bytes, signature: bytes, public_key: str
+    ) -> bool:
+        """
+        Verifies the signature on a given message.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            public_key: The public key to use to verify the message and
+                signature.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        try:
+            wrapped_public = cls.load_public_key(public_key)
+        except ValueError:
+            return False
+        return cls.is_valid_message_with_key(message, signature, wrapped_public)
+
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> ec.EllipticCurvePublicKey:
+        """
+        Parses a public key, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            The parsed public key.
+        """
+        return ec.EllipticCurvePublicKey.from_encoded_point(
+            _SECP256K1_CURVE, bytes.fromhex(public_key)
+        )
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        wrapped_public = cast(ec.EllipticCurvePublicKey, key)
+        try:
+            wrapped_public.verify(signature, sha512_first_half(message), _ECDSA_VERIFY)
+        except (InvalidSignature, ValueError):
+            return False
+        return True
+
+    @classmethod
+    def _public_key_bytes(cls: Type[Self], private_key: int) -> bytes:
+        return (
+            ec.derive_private_key(private_key, _SECP256K1_CURVE)
+            .public_key()
+            .public_bytes(Encoding.X962, PublicFormat.CompressedPoint)
+        )
+
+    @classmethod
+    def _format_private_and_public(
+        cls: Type[Self], private_key: int, public_key: bytes
+    ) -> Tuple[str, str]:
+        return (
+            cls._format_key(public_key.hex()),
+            cls._format_key(format(private_key, "x")),
+        )
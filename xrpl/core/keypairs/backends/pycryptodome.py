@@ -0,0 +1,147 @@
+"""Ed25519 implementation backed by the native code in ``pycryptodome``."""
+
+from __future__ import annotations
+
+from typing import Tuple, Type, cast
+
+from Crypto.PublicKey import ECC
+from Crypto.Signature import eddsa
+from typing_extensions import Self
+
+from xrpl.core.keypairs.ed25519 import ED25519, PREFIX
+from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+from xrpl.core.keypairs.helpers import sha512_first_half
+
+
+class PycryptodomeED25519(ED25519):
+    """Methods for using the Ed25519 cryptographic system, backed by pycryptodome."""
+
+    @classmethod
+    def derive_keypair(
+        cls: Type[Self], decoded_seed: bytes, is_validator: bool
+    ) -> Tuple[str, str]:
+        """
+        Derives a key pair in Ed25519 format for use with the XRP Ledger from a
+        seed value.
+
+        Args:
+            decoded_seed: The Ed25519 seed to derive a key pair from, as bytes.
+            is_validator: Whether to derive a validator keypair.
+                However, validator signing keys cannot use Ed25519.
+
+        Returns:
+            A (public key, private key) pair derived from the given seed.
+
+        Raises:
+            XRPLKeypairsException: If the keypair is a validator keypair.
+        """
+        if is_validator:
+            raise XRPLKeypairsException("Validator key pairs cannot use Ed25519")
+
+        raw_private = sha512_first_half(decoded_seed)
+        private = ECC.construct(curve="Ed25519", seed=raw_private)
+        raw_public = private.public_key().export_key(format="raw")
+        return cls._format_key(raw_public.hex()), cls._format_key(raw_private.hex())
+
+    @classmethod
+    def sign(cls: Type[Self], message: bytes, private_key: str) -> bytes:
+        """
+        Signs a message using a given Ed25519 private key.
+
+        Args:
+            message: The message to sign, as bytes.
+            private_key: The private key to use to sign the message.
+
+        Returns:
+            The signature of the message.
+        """
+        return cls.sign_with_key(message, cls.load_private_key(private_key))
+
+    @classmethod
+    def load_private_key(cls: Type[Self], private_key: str) -> eddsa.EdDSASigScheme:
+        """
+        Parses an Ed25519 private key, for signing many messages with
+        :meth:`sign_with_key`.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            A signature scheme holding the parsed private key.
+        """
+        raw_private = bytes.fromhex(private_key[len(PREFIX) :].zfill(64))
+        wrapped_private = ECC.construct(curve="Ed25519", seed=raw_private)
+        return eddsa.new(wrapped_private, "rfc8032")
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key parsed by :meth:`load_private_key`.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The parsed private key.
+
+        Returns:
+            The signature of the message.
+        """
+        return bytes(cast(eddsa.EdDSASigScheme, key).sign(message))
+
+    @classmethod
+    def is_valid_message(
+        cls: Type[Self], message: bytes, signature: bytes, public_key: str
+    ) -> bool:
+        """
+        Verifies the signature on a given message.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            public_key: The public key to use to verify the message and
+                signature.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        try:
+            verifier = cls.load_public_key(public_key)
+        except ValueError:
+            return False
+        return cls.is_valid_message_with_key(message, signature, verifier)
+
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> eddsa.EdDSASigScheme:
+        """
+        Parses a public key, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            A signature scheme holding the parsed public key.
+        """
+        raw_public = bytes.fromhex(public_key[len(PREFIX) :])
+        return eddsa.new(eddsa.import_public_key(raw_public), "rfc8032")
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        try:
+            cast(eddsa.EdDSASigScheme, key).verify(message, signature)
+        except ValueError:
+            return False
+        return True
@@ -0,0 +1,158 @@
+"""
+Opt-in caching of derived key pairs and classic addresses.
+
+Deriving a key pair from a seed, and a classic address from a public key, always
+gives the same result, so services that rebuild the same wallets over and over
+(for example with ``Wallet.from_seed`` on every request) can enable this cache to
+do that work only once per seed. It is disabled by default.
+
+Both caches are bounded and evict the least recently used entry. Seeds are not
+kept: key pairs are looked up by a SHA-256 digest of the seed. The cached private
+keys are never shown by ``repr``, and :func:`clear` or :func:`disable` drop them.
+
+Example::
+
+    from xrpl.core.keypairs import cache
+
+    cache.enable(maxsize=1024)
+    wallet = Wallet.from_seed(seed)  # derived once, then served from the cache
+    ...
+    cache.disable()  # drops every cached key
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Generic, Optional, Tuple, TypeVar
+
+from typing_extensions import Self
+
+from xrpl.constants import CryptoAlgorithm
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _LRUCache(Generic[K, V]):
+    """A thread-safe mapping holding at most ``maxsize`` recently used entries."""
+
+    def __init__(self: Self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self: Self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self: Self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self: Self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self: Self) -> int:
+        return len(self._entries)
+
+    def __repr__(self: Self) -> str:
+        # never show the entries, which include private keys
+        return f"_LRUCache(size={len(self)}, maxsize={self._maxsize})"
+
+
+# seed digest -> (public key, private key)
+_keypairs: Optional[_LRUCache[bytes, Tuple[str, str]]] = None
+# public key -> classic address
+_addresses: Optional[_LRUCache[str, str]] = None
+
+
+def is_enabled() -> bool:
+    """
+    Returns whether the cache is enabled.
+
+    Returns:
+        Whether derived key pairs and addresses are cached.
+    """
+    return _keypairs is not None
+
+
+def enable(maxsize: int = 1024) -> None:
+    """
+    Enables the cache, emptying it if it was already enabled.
+
+    Args:
+        maxsize: The maximum number of key pairs, and separately of addresses,
+            to keep. The default is 1024.
+
+    Raises:
+        ValueError: If ``maxsize`` is not positive.
+    """
+    global _keypairs, _addresses
+    if maxsize < 1:
+        raise ValueError("The cache size must be positive.")
+    disable()
+    _keypairs = _LRUCache(maxsize)
+    _addresses = _LRUCache(maxsize)
+
+
+def disable() -> None:
+    """Disables the cache, dropping everything in it."""
+    global _keypairs, _addresses
+    clear()
+    _keypairs = None
+    _addresses = None
+
+
+def clear() -> None:
+    """Drops every cached key pair and address, leaving the cache enabled."""
+    if _keypairs is not None:
+        _keypairs.clear()
+    if _addresses is not None:
+        _addresses.clear()
+
+
+def _keypair_key(
+    seed: str, validator: bool, algorithm: Optional[CryptoAlgorithm]
+) -> bytes:
+    algorithm_name = "" if algorithm is None else algorithm.value
+    return sha256(f"{seed}:{validator}:{algorithm_name}".encode()).digest()
+
+
+def _get_keypair(
+    seed: str, validator: bool, algorithm: Optional[CryptoAlgorithm]
+) -> Optional[Tuple[str, str]]:
+    keypairs = _keypairs
+    if keypairs is None:
+        return None
+    return keypairs.get(_keypair_key(seed, validator, algorithm))
+
+
+def _put_keypair(
+    seed: str,
+    validator: bool,
+    algorithm: Optional[CryptoAlgorithm],
+    keypair: Tuple[str, str],
+) -> None:
+    keypairs = _keypairs
+    if keypairs is not None:
+        keypairs.put(_keypair_key(seed, validator, algorithm), keypair)
+
+
+def _get_address(public_key: str) -> Optional[str]:
+    addresses = _addresses
+    return None if addresses is None else addresses.get(public_key)
+
+
+def _put_address(public_key: str, address: str) -> None:
+    addresses = _addresses
+    if addresses is not None:
+        addresses.put(public_key, address)
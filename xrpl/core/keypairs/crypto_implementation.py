@@ -6,7 +6,7 @@ for all cryptographic algorithms are derived from this interface.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Type
+from typing import Tuple, Type, cast
 
 from ecpy.keys import ECPrivateKey  # type: ignore
 from typing_extensions import Self
@@ -46,6 +46,73 @@ class CryptoImplementation(ABC):
     ) -> bool:
         pass
 
+    @classmethod
+    def load_private_key(cls: Type[Self], private_key: str) -> object:
+        """
+        Parses a private key once, for signing many messages with
+        :meth:`sign_with_key`.
+
+        The default implementation does no parsing; implementations override it to
+        keep their expanded key material.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            The parsed private key.
+        """
+        return private_key
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key parsed by :meth:`load_private_key`.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The parsed private key.
+
+        Returns:
+            The signature of the message, identical to the one returned by
+            :meth:`sign`.
+        """
+        return cls.sign(message, cast(str, key))
+
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> object:
+        """
+        Parses a public key once, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        The default implementation does no parsing; implementations override it to
+        keep their decoded public key.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            The parsed public key.
+        """
+        return public_key
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        return cls.is_valid_message(message, signature, cast(str, key))
+
     @classmethod
     def _private_key_to_str(cls: Type[Self], key: ECPrivateKey) -> str:
         return format(key.d, "x")
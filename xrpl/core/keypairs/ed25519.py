@@ -12,10 +12,12 @@ from typing_extensions import Final, Self
 
 from xrpl.core.keypairs.crypto_implementation import CryptoImplementation
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+from xrpl.core.keypairs.fixed_base import ed25519_mul_generator
 from xrpl.core.keypairs.helpers import sha512_first_half
 
 PREFIX: Final[str] = "ED"
 _CURVE: Final[Curve] = Curve.get_curve("Ed25519")
+_ORDER: Final[int] = _CURVE.order
 _SIGNER: Final[EDDSA] = EDDSA(sha512)
 
 
@@ -48,7 +50,8 @@ class ED25519(CryptoImplementation):
 
         raw_private = sha512_first_half(decoded_seed)
         private = ECPrivateKey(int.from_bytes(raw_private, "big"), _CURVE)
-        public = EDDSA.get_public_key(private, sha512)
+        scalar, _ = cls._expand_private_key(raw_private)
+        public = ECPublicKey(ed25519_mul_generator(scalar))
         return (
             cls._format_key(cls._public_key_to_str(public)),
             cls._format_key(cls._private_key_to_str(private)),
@@ -66,9 +69,49 @@ class ED25519(CryptoImplementation):
         Returns:
             The signature of the message.
         """
-        raw_private = private_key[len(PREFIX) :]
-        wrapped_private = ECPrivateKey(int(raw_private, 16), _CURVE)
-        return cast(bytes, _SIGNER.sign(message, wrapped_private))
+        return cls.sign_with_key(message, cls.load_private_key(private_key))
+
+    @classmethod
+    def load_private_key(cls: Type[Self], private_key: str) -> object:
+        """
+        Expands an Ed25519 private key into its secret scalar, encoded public key
+        and nonce prefix, for signing many messages with :meth:`sign_with_key`.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            The expanded private key.
+        """
+        raw_private = bytes.fromhex(private_key[len(PREFIX) :].zfill(64))
+        scalar, prefix = cls._expand_private_key(raw_private)
+        encoded_public = bytes(_CURVE.encode_point(ed25519_mul_generator(scalar)))
+        return scalar, encoded_public, prefix
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key expanded by :meth:`load_private_key`.
+
+        This is the signing algorithm of ``EDDSA.sign``, without deriving the
+        public key again for every message, and with fixed-base multiplication.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The expanded private key.
+
+        Returns:
+            The signature of the message.
+        """
+        scalar, encoded_public, prefix = cast(Tuple[int, bytes, bytes], key)
+        nonce = int.from_bytes(sha512(prefix + message).digest(), "little") % _ORDER
+        encoded_nonce = bytes(_CURVE.encode_point(ed25519_mul_generator(nonce)))
+        challenge = int.from_bytes(
+            sha512(encoded_nonce + encoded_public + message).digest(), "little"
+        )
+        return encoded_nonce + ((nonce + challenge * scalar) % _ORDER).to_bytes(
+            32, "little"
+        )
 
     @classmethod
     def is_valid_message(
@@ -86,10 +129,54 @@ class ED25519(CryptoImplementation):
         Returns:
             Whether the message is valid for the given signature and public key.
         """
+        return cls.is_valid_message_with_key(
+            message, signature, cls.load_public_key(public_key)
+        )
+
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> object:
+        """
+        Parses a public key, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            The parsed public key.
+        """
         raw_public = public_key[len(PREFIX) :]
-        public_key_point = _CURVE.decode_point(bytes.fromhex(raw_public))
-        wrapped_public = ECPublicKey(public_key_point)
-        return cast(bool, _SIGNER.verify(message, signature, wrapped_public))
+        return ECPublicKey(_CURVE.decode_point(bytes.fromhex(raw_public)))
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        return cast(bool, _SIGNER.verify(message, signature, key))
+
+    @classmethod
+    def _expand_private_key(cls: Type[Self], raw_private: bytes) -> Tuple[int, bytes]:
+        """
+        Hashes a private key into its clamped secret scalar and the prefix used to
+        derive signature nonces, as in RFC 8032 and ``EDDSA._get_materials``.
+        """
+        digest = sha512(raw_private).digest()
+        clamped = bytearray(digest[:32])
+        clamped[0] &= 0xF8
+        clamped[31] = (clamped[31] & 0x7F) | 0x40
+        return int.from_bytes(clamped, "little"), digest[32:]
 
     @classmethod
     def _public_key_to_str(cls: Type[Self], key: ECPublicKey) -> str:
@@ -0,0 +1,198 @@
+"""
+Fixed-base scalar multiplication of the secp256k1 and Ed25519 generators.
+
+ECPy multiplies points with a generic double-and-add ladder, which costs one
+doubling and one addition per bit of the scalar. Every scalar multiplication in
+key derivation and signing is by the curve's generator, so the ECPy
+implementations use precomputed tables of multiples of the generator instead:
+the scalar is split into ``_WINDOW_BITS``-bit digits, and the product is the sum
+of one table entry per non-zero digit, with no doublings.
+
+The tables are built on first use and shared by every call in the process.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Tuple
+
+from ecpy.curves import Curve, Point  # type: ignore
+from typing_extensions import Final
+
+_WINDOW_BITS: Final[int] = 8
+_WINDOW_MASK: Final[int] = (1 << _WINDOW_BITS) - 1
+
+_SECP256K1: Final[Curve] = Curve.get_curve("secp256k1")
+_SECP256K1_FIELD: Final[int] = _SECP256K1.field
+_SECP256K1_ORDER: Final[int] = _SECP256K1.order
+
+_ED25519: Final[Curve] = Curve.get_curve("Ed25519")
+_ED25519_FIELD: Final[int] = _ED25519.field
+_ED25519_ORDER: Final[int] = _ED25519.order
+_ED25519_D2: Final[int] = 2 * _ED25519.d % _ED25519_FIELD
+
+# A table holds, for each digit position i, the affine points
+# j * 2**(_WINDOW_BITS * i) * G for j = 1 .. _WINDOW_MASK.
+_Table = List[List[Tuple[int, ...]]]
+
+
+def _invert_all(values: List[int], modulus: int) -> List[int]:
+    # Montgomery's trick: n inversions for the price of one and 3n multiplications
+    prefix = [1] * (len(values) + 1)
+    for i, value in enumerate(values):
+        prefix[i + 1] = prefix[i] * value % modulus
+    inverse = pow(prefix[-1], -1, modulus)
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        inverses[i] = prefix[i] * inverse % modulus
+        inverse = inverse * values[i] % modulus
+    return inverses
+
+
+# secp256k1 uses Jacobian coordinates (X, Y, Z), for (x, y) = (X/Z², Y/Z³).
+
+
+def _secp256k1_double(x: int, y: int, z: int) -> Tuple[int, int, int]:
+    # dbl-2009-l, for a = 0
+    p = _SECP256K1_FIELD
+    a = x * x % p
+    b = y * y % p
+    c = b * b % p
+    d = 2 * ((x + b) * (x + b) - a - c) % p
+    e = 3 * a % p
+    x3 = (e * e - 2 * d) % p
+    return x3, (e * (d - x3) - 8 * c) % p, 2 * y * z % p
+
+
+def _secp256k1_add_affine(
+    x1: int, y1: int, z1: int, x2: int, y2: int
+) -> Tuple[int, int, int]:
+    # madd-2007-bl. The callers never add a point to itself or to its negation.
+    p = _SECP256K1_FIELD
+    z1z1 = z1 * z1 % p
+    h = (x2 * z1z1 - x1) % p
+    hh = h * h % p
+    i = 4 * hh % p
+    j = h * i % p
+    r = 2 * (y2 * z1 * z1z1 - y1) % p
+    v = x1 * i % p
+    x3 = (r * r - j - 2 * v) % p
+    y3 = (r * (v - x3) - 2 * y1 * j) % p
+    return x3, y3, ((z1 + h) * (z1 + h) - z1z1 - hh) % p
+
+
+@lru_cache(maxsize=None)
+def _secp256k1_table() -> _Table:
+    p = _SECP256K1_FIELD
+    table: _Table = []
+    base: Tuple[int, ...] = (_SECP256K1.generator.x, _SECP256K1.generator.y)
+    for _ in range(0, _SECP256K1_ORDER.bit_length(), _WINDOW_BITS):
+        multiples = [(base[0], base[1], 1), _secp256k1_double(base[0], base[1], 1)]
+        while len(multiples) <= _WINDOW_MASK:
+            # the last entry is the next window's base, 2**_WINDOW_BITS * base
+            multiples.append(_secp256k1_add_affine(*multiples[-1], *base))
+        inverses = _invert_all([z for _, _, z in multiples], p)
+        affine: List[Tuple[int, ...]] = []
+        for (x, y, _), inverse in zip(multiples, inverses):
+            inverse_squared = inverse * inverse % p
+            affine.append((x * inverse_squared % p, y * inverse_squared * inverse % p))
+        table.append(affine[:-1])
+        base = affine[-1]
+    return table
+
+
+def secp256k1_mul_generator(scalar: int) -> Point:
+    """
+    Multiplies the secp256k1 generator by a scalar.
+
+    Args:
+        scalar: The scalar, between 1 and the order of the curve (exclusive).
+
+    Returns:
+        The product, as an ECPy point.
+    """
+    p = _SECP256K1_FIELD
+    x, y, z = 0, 0, 0
+    for row in _secp256k1_table():
+        digit = scalar & _WINDOW_MASK
+        scalar >>= _WINDOW_BITS
+        if digit:
+            x2, y2 = row[digit - 1]
+            if z:
+                x, y, z = _secp256k1_add_affine(x, y, z, x2, y2)
+            else:
+                x, y, z = x2, y2, 1
+    inverse = pow(z, -1, p)
+    inverse_squared = inverse * inverse % p
+    return Point(
+        x * inverse_squared % p, y * inverse_squared * inverse % p, _SECP256K1, False
+    )
+
+
+# Ed25519 uses extended coordinates (X, Y, Z, T), for (x, y) = (X/Z, Y/Z) and
+# x * y = T/Z, and the table stores points as (y + x, y - x, 2 * d * x * y).
+
+
+def _ed25519_add_precomputed(
+    x1: int, y1: int, z1: int, t1: int, y_plus_x: int, y_minus_x: int, t2d: int
+) -> Tuple[int, int, int, int]:
+    # madd-2008-hwcd-3, for a = -1. These formulas are complete.
+    p = _ED25519_FIELD
+    a = (y1 - x1) * y_minus_x % p
+    b = (y1 + x1) * y_plus_x % p
+    c = t1 * t2d % p
+    d = 2 * z1 % p
+    e = b - a
+    f = d - c
+    g = d + c
+    h = b + a
+    return e * f % p, g * h % p, f * g % p, e * h % p
+
+
+def _ed25519_precompute(x: int, y: int) -> Tuple[int, int, int]:
+    p = _ED25519_FIELD
+    return (y + x) % p, (y - x) % p, _ED25519_D2 * x * y % p
+
+
+@lru_cache(maxsize=None)
+def _ed25519_table() -> _Table:
+    p = _ED25519_FIELD
+    table: _Table = []
+    base: Tuple[int, ...] = (_ED25519.generator.x, _ED25519.generator.y)
+    for _ in range(0, _ED25519_ORDER.bit_length(), _WINDOW_BITS):
+        precomputed = _ed25519_precompute(*base)
+        multiples = [(base[0], base[1], 1, base[0] * base[1] % p)]
+        while len(multiples) <= _WINDOW_MASK:
+            # the last entry is the next window's base, 2**_WINDOW_BITS * base
+            multiples.append(_ed25519_add_precomputed(*multiples[-1], *precomputed))
+        inverses = _invert_all([z for _, _, z, _ in multiples], p)
+        affine = [
+            (x * inverse % p, y * inverse % p)
+            for (x, y, _, _), inverse in zip(multiples, inverses)
+        ]
+        table.append([_ed25519_precompute(x, y) for x, y in affine[:-1]])
+        base = affine[-1]
+    return table
+
+
+def ed25519_mul_generator(scalar: int) -> Point:
+    """
+    Multiplies the Ed25519 base point by a scalar.
+
+    Args:
+        scalar: The scalar. It is reduced modulo the order of the base point.
+
+    Returns:
+        The product, as an ECPy point.
+    """
+    p = _ED25519_FIELD
+    scalar %= _ED25519_ORDER
+    # start from the neutral element (0, 1)
+    x, y, z, t = 0, 1, 1, 0
+    for row in _ed25519_table():
+        digit = scalar & _WINDOW_MASK
+        scalar >>= _WINDOW_BITS
+        if digit:
+            x, y, z, t = _ed25519_add_precomputed(x, y, z, t, *row[digit - 1])
+    inverse = pow(z, -1, p)
+    return Point(x * inverse % p, y * inverse % p, _ED25519, False)
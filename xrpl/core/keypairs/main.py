@@ -1,26 +1,22 @@
 """Interface for cryptographic key pairs for use with the XRP Ledger."""
 
+from concurrent.futures import ProcessPoolExecutor
 from secrets import token_bytes
-from typing import Dict, Optional, Tuple, Type, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from typing_extensions import Final
 
 from xrpl.constants import CryptoAlgorithm
 from xrpl.core import addresscodec
+from xrpl.core.keypairs import cache
+from xrpl.core.keypairs.backends import get_backend
 from xrpl.core.keypairs.crypto_implementation import CryptoImplementation
-from xrpl.core.keypairs.ed25519 import ED25519
 from xrpl.core.keypairs.ed25519 import PREFIX as ED_PREFIX
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
 from xrpl.core.keypairs.helpers import get_account_id
-from xrpl.core.keypairs.secp256k1 import SECP256K1
 
 _VERIFICATION_MESSAGE: Final[bytes] = b"This test message should verify."
 
-_ALGORITHM_TO_MODULE_MAP: Final[Dict[CryptoAlgorithm, Type[CryptoImplementation]]] = {
-    CryptoAlgorithm.ED25519: ED25519,
-    CryptoAlgorithm.SECP256K1: SECP256K1,
-}
-
 
 def generate_seed(
     entropy: Optional[str] = None,
@@ -70,14 +66,18 @@ def derive_keypair(
         XRPLKeypairsException: If the derived keypair did not generate a
             verifiable signature.
     """
-    decoded_seed, algorithm = addresscodec.decode_seed(seed, algorithm)
-    module = _ALGORITHM_TO_MODULE_MAP[algorithm]
+    cached = cache._get_keypair(seed, validator, algorithm)
+    if cached is not None:
+        return cached
+    decoded_seed, decoded_algorithm = addresscodec.decode_seed(seed, algorithm)
+    module = get_backend(decoded_algorithm)
     public_key, private_key = module.derive_keypair(decoded_seed, validator)
     signature = module.sign(_VERIFICATION_MESSAGE, private_key)
     if not module.is_valid_message(_VERIFICATION_MESSAGE, signature, public_key):
         raise XRPLKeypairsException(
             "Derived keypair did not generate verifiable signature",
         )
+    cache._put_keypair(seed, validator, algorithm, (public_key, private_key))
     return public_key, private_key
 
 
@@ -94,8 +94,12 @@ def derive_classic_address(public_key: str) -> str:
     Returns:
         The classic address corresponding to the given public key.
     """
-    account_id = get_account_id(bytes.fromhex(public_key))
-    return addresscodec.encode_classic_address(account_id)
+    address = cache._get_address(public_key)
+    if address is None:
+        account_id = get_account_id(bytes.fromhex(public_key))
+        address = addresscodec.encode_classic_address(account_id)
+        cache._put_address(public_key, address)
+    return address
 
 
 def sign(message: Union[str, bytes], private_key: str) -> str:
@@ -142,7 +146,79 @@ def is_valid_message(message: bytes, signature: bytes, public_key: str) -> bool:
     )
 
 
+def verify_many(
+    items: Iterable[Tuple[bytes, bytes, str]], workers: Optional[int] = None
+) -> List[bool]:
+    """
+    Verifies the signatures on many messages.
+
+    The items are grouped by algorithm and each distinct public key is decoded only
+    once, so this is faster than calling :func:`is_valid_message` for each item,
+    especially when many items share a public key.
+
+    Args:
+        items: The (message, signature, public key) triples to verify, with the
+            same types as the arguments of :func:`is_valid_message`.
+        workers: The number of processes to spread the work across. By default, or
+            if it is 1, everything is verified in this process.
+
+    Returns:
+        Whether each signature is valid, in the order of the items. A malformed
+        signature or public key makes its item invalid instead of raising.
+    """
+    items = list(items)
+    groups: Dict[Type[CryptoImplementation], List[int]] = {}
+    for index, (_, _, public_key) in enumerate(items):
+        groups.setdefault(_get_module_from_key(public_key), []).append(index)
+
+    chunk_count = max(workers or 1, 1)
+    chunks: List[Tuple[Type[CryptoImplementation], List[int]]] = []
+    for module, indices in groups.items():
+        chunk_size = -(-len(indices) // chunk_count)
+        for start in range(0, len(indices), chunk_size):
+            chunks.append((module, indices[start : start + chunk_size]))
+
+    modules = [module for module, _ in chunks]
+    chunk_items = [[items[index] for index in indices] for _, indices in chunks]
+    if chunk_count == 1:
+        verified = list(map(_verify_chunk, modules, chunk_items))
+    else:
+        # the module travels to the workers, so they use this process's backends
+        with ProcessPoolExecutor(chunk_count) as executor:
+            verified = list(executor.map(_verify_chunk, modules, chunk_items))
+
+    results = [False] * len(items)
+    for (_, indices), chunk_results in zip(chunks, verified):
+        for index, result in zip(indices, chunk_results):
+            results[index] = result
+    return results
+
+
+def _verify_chunk(
+    module: Type[CryptoImplementation], items: List[Tuple[bytes, bytes, str]]
+) -> List[bool]:
+    public_keys: Dict[str, Optional[object]] = {}
+    results = []
+    for message, signature, public_key in items:
+        if public_key not in public_keys:
+            try:
+                public_keys[public_key] = module.load_public_key(public_key)
+            except Exception:
+                # an undecodable public key verifies nothing
+                public_keys[public_key] = None
+        key = public_keys[public_key]
+        try:
+            valid = key is not None and module.is_valid_message_with_key(
+                message, signature, key
+            )
+        except Exception:
+            # ECPy raises on some malformed signatures instead of rejecting them
+            valid = False
+        results.append(valid)
+    return results
+
+
 def _get_module_from_key(key: str) -> Type[CryptoImplementation]:
     if key.startswith(ED_PREFIX):
-        return ED25519
-    return SECP256K1
+        return get_backend(CryptoAlgorithm.ED25519)
+    return get_backend(CryptoAlgorithm.SECP256K1)
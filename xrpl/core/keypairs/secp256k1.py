@@ -11,11 +11,14 @@ from typing import Callable, Tuple, Type, cast
 
 from ecpy.curves import Curve  # type: ignore
 from ecpy.ecdsa import ECDSA  # type: ignore
+from ecpy.ecrand import rnd_rfc6979  # type: ignore
+from ecpy.formatters import encode_sig  # type: ignore
 from ecpy.keys import ECPrivateKey, ECPublicKey  # type: ignore
 from typing_extensions import Final, Literal, Self
 
 from xrpl.core.keypairs.crypto_implementation import CryptoImplementation
 from xrpl.core.keypairs.exceptions import XRPLKeypairsException
+from xrpl.core.keypairs.fixed_base import secp256k1_mul_generator
 from xrpl.core.keypairs.helpers import sha512_first_half
 
 _CURVE: Final[Curve] = Curve.get_curve("secp256k1")
@@ -88,16 +91,52 @@ class SECP256K1(CryptoImplementation):
         Returns:
             The signature of the message, as bytes.
         """
-        wrapped_private = ECPrivateKey(int(private_key, 16), _CURVE)
-        return cast(
-            bytes,
-            _SIGNER.sign_rfc6979(
-                sha512_first_half(message),
-                wrapped_private,
-                sha256,
-                canonical=True,
-            ),
-        )
+        return cls.sign_with_key(message, cls.load_private_key(private_key))
+
+    @classmethod
+    def load_private_key(cls: Type[Self], private_key: str) -> object:
+        """
+        Parses a secp256k1 private key, for signing many messages with
+        :meth:`sign_with_key`.
+
+        Args:
+            private_key: The private key, as hexadecimal.
+
+        Returns:
+            The parsed private key.
+        """
+        return ECPrivateKey(int(private_key, 16), _CURVE)
+
+    @classmethod
+    def sign_with_key(cls: Type[Self], message: bytes, key: object) -> bytes:
+        """
+        Signs a message with a private key parsed by :meth:`load_private_key`.
+
+        Args:
+            message: The message to sign, as bytes.
+            key: The parsed private key.
+
+        Returns:
+            The signature of the message, as bytes.
+        """
+        # ECDSA.sign_rfc6979(..., canonical=True), with fixed-base multiplication
+        secret = cast(ECPrivateKey, key).d
+        message_hash = sha512_first_half(message)
+        message_int = int.from_bytes(message_hash, "big")
+        continuation = None
+        while True:
+            nonce, continuation = rnd_rfc6979(
+                message_hash, secret, _GROUP_ORDER, sha256, continuation
+            )
+            r = secp256k1_mul_generator(nonce).x % _GROUP_ORDER
+            if r == 0:
+                continue
+            s = pow(nonce, -1, _GROUP_ORDER) * (message_int + secret * r) % _GROUP_ORDER
+            if s == 0:
+                continue
+            if s > _GROUP_ORDER // 2:
+                s = _GROUP_ORDER - s
+            return bytes(encode_sig(r, s, "DER"))
 
     @classmethod
     def is_valid_message(
@@ -115,13 +154,42 @@ class SECP256K1(CryptoImplementation):
         Returns:
             Whether the message is valid for the given signature and public key.
         """
-        public_key_point = _CURVE.decode_point(bytes.fromhex(public_key))
-        wrapped_public = ECPublicKey(public_key_point)
-        return cast(
-            bool,
-            _SIGNER.verify(sha512_first_half(message), signature, wrapped_public),
+        return cls.is_valid_message_with_key(
+            message, signature, cls.load_public_key(public_key)
         )
 
+    @classmethod
+    def load_public_key(cls: Type[Self], public_key: str) -> object:
+        """
+        Parses a public key, for verifying many messages with
+        :meth:`is_valid_message_with_key`.
+
+        Args:
+            public_key: The public key, as hexadecimal.
+
+        Returns:
+            The parsed public key.
+        """
+        return ECPublicKey(_CURVE.decode_point(bytes.fromhex(public_key)))
+
+    @classmethod
+    def is_valid_message_with_key(
+        cls: Type[Self], message: bytes, signature: bytes, key: object
+    ) -> bool:
+        """
+        Verifies the signature on a given message with a public key parsed by
+        :meth:`load_public_key`.
+
+        Args:
+            message: The message to validate.
+            signature: The signature of the message.
+            key: The parsed public key.
+
+        Returns:
+            Whether the message is valid for the given signature and public key.
+        """
+        return cast(bool, _SIGNER.verify(sha512_first_half(message), signature, key))
+
     @classmethod
     def _format_keys(
         cls: Type[Self], public: ECPublicKey, private: ECPrivateKey
@@ -160,9 +228,9 @@ class SECP256K1(CryptoImplementation):
                 return bytes_input + candidate
             return bytes_input + _INTERMEDIATE_KEYPAIR_PADDING + candidate
 
-        raw_private = cls._get_secret(_candidate_merger)
-        wrapped_private = ECPrivateKey(int.from_bytes(raw_private, "big"), _CURVE)
-        return wrapped_private.get_public_key(), wrapped_private
+        raw_private = int.from_bytes(cls._get_secret(_candidate_merger), "big")
+        wrapped_private = ECPrivateKey(raw_private, _CURVE)
+        return ECPublicKey(secp256k1_mul_generator(raw_private)), wrapped_private
 
     @classmethod
     def _derive_final_pair(
@@ -0,0 +1,87 @@
+"""Signing many messages with one private key."""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Union
+
+from typing_extensions import Self
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.core.keypairs.backends import get_backend
+from xrpl.core.keypairs.ed25519 import PREFIX as ED_PREFIX
+
+
+class Signer:
+    """
+    Signs messages with a private key that is parsed only once.
+
+    :func:`xrpl.core.keypairs.sign` parses the private key (and, for Ed25519,
+    derives the public key from it) on every call. A ``Signer`` does that once when
+    it is created and reuses the parsed key for every message, which makes signing
+    many messages with the same key cheaper. Its signatures are identical to those
+    of :func:`xrpl.core.keypairs.sign`.
+
+    The cryptographic backend is chosen when the ``Signer`` is created, so
+    selecting another backend afterwards does not affect existing signers.
+    """
+
+    def __init__(self: Self, private_key: str) -> None:
+        """
+        Parses a private key for signing.
+
+        Args:
+            private_key: The private key to sign messages with, as hexadecimal.
+        """
+        self.algorithm = (
+            CryptoAlgorithm.ED25519
+            if private_key.startswith(ED_PREFIX)
+            else CryptoAlgorithm.SECP256K1
+        )
+        """The algorithm of the private key."""
+
+        self._private_key = private_key
+        self._backend = get_backend(self.algorithm)
+        self._key = self._backend.load_private_key(private_key)
+
+    @property
+    def private_key(self: Self) -> str:
+        """
+        The private key that this signer signs with, as hexadecimal.
+        MUST be kept secret!
+        """  # noqa: DAR201
+        return self._private_key
+
+    def sign(self: Self, message: Union[str, bytes]) -> str:
+        """
+        Signs a message.
+
+        Args:
+            message: The message to sign, as bytes or hexadecimal.
+
+        Returns:
+            The signature of the message, as hexadecimal.
+        """
+        if isinstance(message, str):
+            message = bytes.fromhex(message)
+        return self._backend.sign_with_key(message, self._key).hex().upper()
+
+    def sign_many(self: Self, messages: Iterable[Union[str, bytes]]) -> List[str]:
+        """
+        Signs several messages.
+
+        Args:
+            messages: The messages to sign, as bytes or hexadecimal.
+
+        Returns:
+            The signatures of the messages, as hexadecimal, in the same order.
+        """
+        return [self.sign(message) for message in messages]
+
+    def __repr__(self: Self) -> str:
+        """
+        Returns a string representation of the signer, without the private key.
+
+        Returns:
+            A string representation of the signer.
+        """
+        return f"Signer(algorithm={self.algorithm.value}, private_key=-HIDDEN-)"
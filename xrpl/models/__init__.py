@@ -1,18 +1,38 @@
 """Top-level exports for the models package."""
 
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
 from xrpl.models import amounts, currencies, requests, transactions
 from xrpl.models.amounts import *  # noqa: F401, F403
 from xrpl.models.auth_account import AuthAccount
+from xrpl.models.base_model import trusted_construction
 from xrpl.models.currencies import *  # noqa: F401, F403
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.mptoken_metadata import MPTokenMetadata, MPTokenMetadataUri
 from xrpl.models.path import Path, PathStep
-from xrpl.models.requests import *  # noqa: F401, F403
-from xrpl.models.response import Response
-from xrpl.models.transactions import *  # noqa: F401, F403
-from xrpl.models.transactions.pseudo_transactions import *  # noqa: F401, F403
+from xrpl.models.transactions import pseudo_transactions
 from xrpl.models.xchain_bridge import XChainBridge
 
+if TYPE_CHECKING:
+    from xrpl.models.requests import *  # noqa: F401, F403
+    from xrpl.models.response import Response
+    from xrpl.models.transactions import *  # noqa: F401, F403
+    from xrpl.models.transactions.pseudo_transactions import *  # noqa: F401, F403
+else:
+    # the request and transaction models, and Response, which uses them, are
+    # imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodules=["flags", "utils"],
+        submodule_attributes={
+            "requests": requests.__all__,
+            "response": ["Response"],
+            "transactions": transactions.__all__,
+            "transactions.pseudo_transactions": pseudo_transactions.__all__,
+        },
+    )
+
 __all__ = [
     "XRPLModelException",
     "amounts",
@@ -30,5 +50,6 @@ __all__ = [
     "Path",
     "PathStep",
     "Response",
+    "trusted_construction",
     "XChainBridge",
 ]
@@ -15,7 +15,7 @@ from xrpl.models.currencies import IssuedCurrency
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class IssuedCurrencyAmount(IssuedCurrency):
     """
     Specifies an amount in an issued currency.
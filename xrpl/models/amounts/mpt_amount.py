@@ -12,7 +12,7 @@ from xrpl.models.currencies.mpt_currency import MPTCurrency
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTAmount(BaseModel):
     """Specifies an MPT amount."""
 
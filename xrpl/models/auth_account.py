@@ -8,7 +8,7 @@ from xrpl.models.nested_model import NestedModel
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AuthAccount(NestedModel):
     """Represents one entry in a list of AuthAccounts used in AMMBid transaction."""
 
@@ -5,9 +5,27 @@ from __future__ import annotations
 import json
 import re
 from abc import ABC
-from dataclasses import dataclass, fields
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import MISSING, dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Pattern, Type, Union, cast, get_type_hints
+from functools import lru_cache
+from operator import attrgetter
+from types import MemberDescriptorType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    get_type_hints,
+)
 
 from typing_extensions import Final, Literal, Self, get_args, get_origin
 
@@ -57,6 +75,17 @@ ABBREVIATIONS: Final[Dict[str, str]] = {
 EXCLUDED_KEYS = {"mpt_issuance_id"}
 
 
+# The number of other keys, neither binary codec fields nor model fields, whose
+# conversions are kept
+_KEY_CACHE_SIZE: Final[int] = 1024
+
+# PascalCase or camelCase key -> snake_case key, and snake_case key -> PascalCase
+# key, for the fields of the binary codec definitions and of the models used so far
+_JSON_KEYS: Dict[str, str] = {}
+_TX_JSON_KEYS: Dict[str, str] = {}
+_definition_keys_added = False
+
+
 def _key_to_json(field: str) -> str:
     """
     Transforms camelCase or PascalCase to snake_case. For example:
@@ -69,6 +98,33 @@ def _key_to_json(field: str) -> str:
     Raises:
         XRPLModelException: If the input is invalid
     """
+    json_key = _JSON_KEYS.get(field)
+    if json_key is None:
+        if not _definition_keys_added:
+            _add_definition_keys()
+            return _key_to_json(field)
+        json_key = _cached_convert_key_to_json(field)
+    return json_key
+
+
+def _key_to_tx_json(key: str) -> str:
+    """
+    Transforms snake_case to PascalCase. For example:
+        1. 'transaction_type' becomes 'TransactionType'
+        2. 'URI' becomes 'uri'
+
+    Known abbreviations (example 2 above) need to be enumerated in ABBREVIATIONS.
+    """
+    tx_json_key = _TX_JSON_KEYS.get(key)
+    if tx_json_key is None:
+        if not _definition_keys_added:
+            _add_definition_keys()
+            return _key_to_tx_json(key)
+        tx_json_key = _cached_convert_key_to_tx_json(key)
+    return tx_json_key
+
+
+def _convert_key_to_json(field: str) -> str:
     if field in EXCLUDED_KEYS:
         return field
 
@@ -85,6 +141,50 @@ def _key_to_json(field: str) -> str:
     )
 
 
+def _convert_key_to_tx_json(key: str) -> str:
+    return "".join(
+        [
+            ABBREVIATIONS[word] if word in ABBREVIATIONS else word.capitalize()
+            for word in key.split("_")
+        ]
+    )
+
+
+_cached_convert_key_to_json = lru_cache(maxsize=_KEY_CACHE_SIZE)(_convert_key_to_json)
+_cached_convert_key_to_tx_json = lru_cache(maxsize=_KEY_CACHE_SIZE)(
+    _convert_key_to_tx_json
+)
+
+
+def _add_json_key(field: str) -> None:
+    """Adds a PascalCase key, and its snake_case form, to the key tables."""
+    try:
+        json_key = _convert_key_to_json(field)
+    except XRPLModelException:
+        return
+    _JSON_KEYS[field] = json_key
+    if json_key not in _TX_JSON_KEYS:
+        _TX_JSON_KEYS[json_key] = _convert_key_to_tx_json(json_key)
+
+
+def _add_tx_json_key(key: str) -> None:
+    """Adds a snake_case key, and its PascalCase form, to the key tables."""
+    tx_json_key = _convert_key_to_tx_json(key)
+    _TX_JSON_KEYS[key] = tx_json_key
+    if tx_json_key not in _JSON_KEYS:
+        _add_json_key(tx_json_key)
+
+
+def _add_definition_keys() -> None:
+    # imported here to avoid a circular import: the binary codec uses the models
+    from xrpl.core.binarycodec.definitions import definitions
+
+    global _definition_keys_added
+    for field in definitions._FIELD_INFO_MAP:
+        _add_json_key(field)
+    _definition_keys_added = True
+
+
 def _value_to_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     if isinstance(value, dict):
         return {_key_to_json(k): _value_to_json(v) for (k, v) in value.items()}
@@ -93,10 +193,384 @@ def _value_to_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     return value
 
 
+# Whether models are being built by trusted_construction, in this thread or task
+_TRUSTED: ContextVar[bool] = ContextVar("_TRUSTED", default=False)
+
+
+@contextmanager
+def trusted_construction() -> Iterator[None]:
+    """
+    Builds models without validating them, for data that is already known to be
+    valid, such as transactions read from a validated ledger.
+
+    Models created in the block, including the nested models built by
+    ``from_dict`` and ``from_xrpl``, skip ``validate`` when they are created, so
+    an invalid model can be built without error. Fields are still converted to
+    their model types, and ``validate`` can still be called explicitly. The mode
+    only applies to the current thread or asyncio task.
+
+    Example::
+
+        with trusted_construction():
+            transactions = [Transaction.from_xrpl(tx) for tx in ledger_transactions]
+
+    Yields:
+        Nothing.
+    """
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+# A compiled check of whether a value matches a type, with no error reporting.
+_TypeCheck = Callable[[Any], bool]
+# A compiled conversion of a from_dict value to a type: (param name, value) -> value
+_Converter = Callable[[str, Any], Any]
+# Types that to_dict copies as they are
+_PLAIN_TYPES: Final[FrozenSet[type]] = frozenset({str, int, bool, float})
+
+
+@dataclass(frozen=True)
+class _ModelMetadata:
+    """The type information of a model class, computed once per class."""
+
+    type_hints: Dict[str, Any]
+    """The resolved type of each field, as returned by ``get_type_hints``."""
+
+    init_fields: FrozenSet[str]
+    """The fields accepted by ``__init__``."""
+
+    type_checks: Dict[str, _TypeCheck]
+    """The compiled type check of each field, from :func:`_get_type_check`."""
+
+    converters: Dict[str, _Converter]
+    """The compiled ``from_dict`` conversion of each field, from
+    :func:`_get_converter`."""
+
+    dict_fields: Tuple[str, ...]
+    """The fields written by ``to_dict``, in order."""
+
+    field_values: Callable[[Any], Tuple[Any, ...]]
+    """Returns the values of ``dict_fields`` of an instance, as a tuple."""
+
+    container_fields: Tuple[int, ...]
+    """The positions in ``dict_fields`` of the fields whose type allows a list or a
+    dictionary, which ``__hash__`` converts to hashable values."""
+
+
+# Model class -> its metadata, filled in on first use because the dataclass fields
+# do not exist yet when __init_subclass__ runs
+_MODEL_METADATA: Dict[type, _ModelMetadata] = {}
+
+
+def _get_model_metadata(cls: type) -> _ModelMetadata:
+    metadata = _MODEL_METADATA.get(cls)
+    if metadata is None:
+        type_hints = get_type_hints(cls)
+        # mypy doesn't realize that a dataclass has __dataclass_fields__
+        dict_fields = tuple(cls.__dataclass_fields__)  # type: ignore
+        metadata = _ModelMetadata(
+            type_hints=type_hints,
+            init_fields=frozenset(
+                field.name for field in fields(cls) if field.init is True
+            ),
+            type_checks={
+                attr: _get_type_check(attr_type)
+                for attr, attr_type in type_hints.items()
+            },
+            converters={
+                attr: _get_converter(attr_type)
+                for attr, attr_type in type_hints.items()
+            },
+            dict_fields=dict_fields,
+            field_values=_compile_field_values(dict_fields),
+            container_fields=tuple(
+                index
+                for index, field in enumerate(dict_fields)
+                if _may_hold_container(type_hints[field])
+            ),
+        )
+        for field in metadata.dict_fields:
+            if field not in _TX_JSON_KEYS:
+                _add_tx_json_key(field)
+        _MODEL_METADATA[cls] = metadata
+    return metadata
+
+
+def _compile_field_values(names: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    if len(names) > 1:
+        # attrgetter reads several attributes at once, into a tuple
+        return attrgetter(*names)
+    if len(names) == 1:
+        name = names[0]
+        return lambda model: (getattr(model, name),)
+    return lambda model: ()
+
+
+def _may_hold_container(param_type: Any) -> bool:  # noqa: ANN401
+    param_type_origin, param_type_args = _get_origin_and_args(param_type)
+    if param_type_origin is Union:
+        return any(_may_hold_container(option) for option in param_type_args)
+    return param_type is Any or param_type_origin in (list, dict)
+
+
+# type -> (get_origin(type), get_args(type))
+_ORIGIN_AND_ARGS: Dict[Any, Tuple[Any, Tuple[Any, ...]]] = {}
+
+
+def _get_origin_and_args(
+    param_type: Any,  # noqa: ANN401
+) -> Tuple[Any, Tuple[Any, ...]]:
+    # returns (`list`, (item type,)) if a List, (`Union`, options) if a Union, ...
+    origin_and_args = _ORIGIN_AND_ARGS.get(param_type)
+    if origin_and_args is None:
+        origin_and_args = (get_origin(param_type), get_args(param_type))
+        _ORIGIN_AND_ARGS[param_type] = origin_and_args
+    return origin_and_args
+
+
+# type -> its compiled type check
+_TYPE_CHECKS: Dict[Any, _TypeCheck] = {}
+
+
+def _get_type_check(expected_type: Any) -> _TypeCheck:  # noqa: ANN401
+    """
+    Returns a function telling whether a value matches ``expected_type``, exactly
+    when ``BaseModel._check_type`` would find no errors. The annotation is
+    inspected once, and enum members and literal values are put in sets.
+    """
+    type_check = _TYPE_CHECKS.get(expected_type)
+    if type_check is None:
+        type_check = _compile_type_check(expected_type)
+        _TYPE_CHECKS[expected_type] = type_check
+    return type_check
+
+
+def _is_member(
+    value: Any, values: Tuple[Any, ...], value_set: FrozenSet[Any]  # noqa: ANN401
+) -> bool:
+    try:
+        if value in value_set:
+            return True
+    except TypeError:
+        # unhashable values can still compare equal to a member
+        pass
+    # a value can be equal to a member without hashing like it, e.g. a str enum
+    # member hashes like its name rather than its value
+    return value in values
+
+
+def _compile_type_check(expected_type: Any) -> _TypeCheck:  # noqa: ANN401
+    # mirrors the order of the checks in BaseModel._check_type
+    expected_type_origin, expected_type_args = _get_origin_and_args(expected_type)
+    if expected_type_origin is Union:
+        options = tuple(_get_type_check(option) for option in expected_type_args)
+        return lambda value: any(option(value) for option in options)
+
+    if expected_type is Any:
+        return lambda value: True
+
+    if expected_type_origin is list:
+        item_check = _get_type_check(expected_type_args[0])
+        return lambda value: isinstance(value, list) and all(
+            item_check(item) for item in value
+        )
+
+    if expected_type_origin is dict:
+        return lambda value: isinstance(value, dict)
+
+    if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+        members = tuple(expected_type)
+        # str and int enum members are equal to their values
+        member_set = frozenset(members).union(
+            member.value for member in members if member == member.value
+        )
+        return lambda value: _is_member(value, members, member_set)
+
+    if expected_type_origin is Literal:
+        literal_set = frozenset(expected_type_args)
+        return lambda value: _is_member(value, expected_type_args, literal_set)
+
+    if isinstance(expected_type, type):
+        if issubclass(expected_type, BaseModel):
+            return lambda value: isinstance(value, (dict, expected_type))
+        return lambda value: isinstance(value, expected_type)
+
+    # anything else is left to _check_type, which reports or raises as it always has
+    return lambda value: False
+
+
+# type -> its compiled from_dict conversion
+_CONVERTERS: Dict[Any, _Converter] = {}
+
+
+def _get_converter(param_type: Any) -> _Converter:  # noqa: ANN401
+    """
+    Returns a function converting a ``from_dict`` value to ``param_type``, with the
+    same result, or error, as ``BaseModel._from_dict_single_param``.
+    """
+    converter = _CONVERTERS.get(param_type)
+    if converter is None:
+        converter = _compile_converter(param_type)
+        _CONVERTERS[param_type] = converter
+    return converter
+
+
+def _cannot_take_dict(option: Any, value: Dict[str, Any]) -> bool:  # noqa: ANN401
+    """
+    Whether converting the dictionary ``value`` to the Union option ``option`` is
+    bound to fail because it has a key that is not a field of the model. Only
+    models using ``BaseModel.from_dict`` are known to reject such keys.
+    """
+    return (
+        isinstance(option, type)
+        and issubclass(option, BaseModel)
+        and getattr(option.from_dict, "__func__", None) is _BASE_FROM_DICT
+        and not _get_model_metadata(option).type_hints.keys() >= value.keys()
+    )
+
+
+def _compile_converter(param_type: Any) -> _Converter:  # noqa: ANN401
+    # mirrors the order of the steps in BaseModel._from_dict_single_param
+    param_type_origin, param_type_args = _get_origin_and_args(param_type)
+    item_converter = (
+        _get_converter(param_type_args[0]) if param_type_origin is list else None
+    )
+    options = (
+        tuple((option, _get_converter(option)) for option in param_type_args)
+        if param_type_origin is Union
+        else ()
+    )
+    is_any = param_type is Any
+    is_class = isinstance(param_type, type)
+    literal_set = (
+        frozenset(param_type_args) if param_type_origin == Literal else frozenset()
+    )
+    if is_class and issubclass(param_type, Enum):
+        members: Tuple[Any, ...] = tuple(param_type)
+        # str and int enum members are equal to their values
+        member_set = frozenset(members).union(
+            member.value for member in members if member == member.value
+        )
+    else:
+        members, member_set = (), frozenset()
+    is_model = is_class and issubclass(param_type, BaseModel)
+
+    def convert(param: str, param_value: Any) -> Any:  # noqa: ANN401
+        if item_converter is not None and isinstance(param_value, list):
+            # expected a List, received a List
+            return [item_converter(param, item) for item in param_value]
+
+        for option, option_converter in options:
+            if isinstance(param_value, dict) and _cannot_take_dict(option, param_value):
+                continue
+            try:
+                return option_converter(param, param_value)
+            except XRPLModelException:
+                # this Union-ed type did not work, move onto the next one
+                pass
+
+        if is_any or (is_class and isinstance(param_value, param_type)):
+            return param_value
+
+        if literal_set and _is_member(param_value, param_type_args, literal_set):
+            return param_value
+
+        if members and _is_member(param_value, members, member_set):
+            # for some reason required for string enums.
+            return param_value
+
+        if is_model and isinstance(param_value, dict):
+            # expected an XRPL Model, received a Dict
+            return param_type.from_dict(param_value)
+
+        # received something we didn't expect, raise an error
+        if is_model:
+            error_message = (
+                f"{param} expected a {param_type} or a Dict representing "
+                f"{param_type}, received a {type(param_value)}"
+            )
+        else:
+            error_message = (
+                f"{param} expected a {param_type}, received a {type(param_value)}"
+            )
+        raise XRPLModelException(error_message)
+
+    return convert
+
+
+# returns the lists and dictionaries in a model, which are not hashable, as tuples
+# and frozensets that are equal exactly when they are
+def _hashable(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    return value
+
+
+def _rebind_class_cells(cls: type) -> None:
+    """
+    Points the closure cells of the methods of ``cls`` that refer to the class they
+    were defined in at ``cls``.
+
+    ``@dataclass(slots=True)`` returns a copy of the class it decorates, but before
+    Python 3.14 the methods of the copy still refer to the original class: in the
+    ``__class__`` cell read by zero-argument ``super()``, which would fail on
+    instances of the copy, and in the frozen ``__setattr__`` and ``__delattr__``.
+    """
+    for attribute in cls.__dict__.values():
+        if isinstance(attribute, (classmethod, staticmethod)):
+            attribute = attribute.__func__
+        elif isinstance(attribute, property):
+            attribute = attribute.fget
+        for cell in getattr(attribute, "__closure__", None) or ():
+            try:
+                original = cell.cell_contents
+            except ValueError:  # an empty cell
+                continue
+            # methods taken from other classes, like the __repr__ installed by
+            # BaseModel.__init_subclass__, keep their own class
+            if (
+                isinstance(original, type)
+                and original is not cls
+                and original.__qualname__ == cls.__qualname__
+                and original.__module__ == cls.__module__
+            ):
+                cell.cell_contents = cls
+
+
+def _restore_field_defaults(cls: type) -> None:
+    """
+    Sets the defaults of the inherited ``init=False`` fields, such as
+    ``transaction_type``, as class attributes of ``cls``.
+
+    The ``__init__`` that ``@dataclass`` generates for a class without slots does
+    not set these fields, and leaves them to be read from the class attribute
+    holding the default. In a subclass of a slotted model, that attribute is the
+    empty slot of the parent class instead. ``@dataclass(slots=True)`` removes the
+    attributes again from the slotted copy of the class.
+    """
+    for field in getattr(cls, "__dataclass_fields__", {}).values():
+        if (
+            field.init is False
+            and field.default is not MISSING
+            and isinstance(getattr(cls, field.name, None), MemberDescriptorType)
+        ):
+            setattr(cls, field.name, field.default)
+
+
 @dataclass(frozen=True)
 class BaseModel(ABC):
     """The base class for all model types."""
 
+    # The models are slots=True dataclasses, which have no __weakref__ unless a base
+    # class declares it. weakref_slot=True would add it to every model, and needs
+    # Python 3.11.
+    __slots__ = ("__weakref__",)
+
     # Field names whose values must never appear in __repr__ output. Subclasses
     # may extend this via set-union. Applies to any model, so new request types
     # that re-use these names inherit the redaction automatically.
@@ -109,11 +583,18 @@ class BaseModel(ABC):
         ``@dataclass`` decorator runs. ``@dataclass`` only auto-generates a
         ``__repr__`` when one isn't already present in ``cls.__dict__``, so
         pre-populating it here makes every ``BaseModel`` subclass flow
-        through the redaction logic with no per-class opt-in.
+        through the redaction logic with no per-class opt-in. ``__hash__`` is
+        installed the same way, since the generated one fails on lists.
         """
         super().__init_subclass__(**kwargs)
         if "__repr__" not in cls.__dict__:
             setattr(cls, "__repr__", BaseModel.__repr__)
+        if "__hash__" not in cls.__dict__:
+            setattr(cls, "__hash__", BaseModel.__hash__)
+        # this also runs for the copy of the class made by @dataclass(slots=True)
+        _rebind_class_cells(cls)
+        if "__slots__" not in cls.__dict__:
+            _restore_field_defaults(cls)
 
     @classmethod
     def is_dict_of_model(cls: Type[Self], dictionary: Any) -> bool:  # noqa: ANN401
@@ -135,14 +616,7 @@ class BaseModel(ABC):
         """
         return (
             isinstance(dictionary, dict)
-            and set(get_type_hints(cls).keys()).issuperset(set(dictionary.keys()))
-            and all(
-                [
-                    attr in dictionary
-                    for attr, value in get_type_hints(cls).items()
-                    if value is REQUIRED
-                ]
-            )
+            and _get_model_metadata(cls).type_hints.keys() >= dictionary.keys()
         )
 
     @classmethod
@@ -159,19 +633,15 @@ class BaseModel(ABC):
         Raises:
             XRPLModelException: If the dictionary provided is invalid.
         """
-        # returns a dictionary mapping class params to their types
-        class_types = get_type_hints(cls)
-
+        converters = _get_model_metadata(cls).converters
         args = {}
-        for param in value:
-            if param not in class_types:
+        for param, param_value in value.items():
+            converter = converters.get(param)
+            if converter is None:
                 raise XRPLModelException(
                     f"{param} not a valid parameter for {cls.__name__}"
                 )
-
-            args[param] = cls._from_dict_single_param(
-                param, class_types[param], value[param]
-            )
+            args[param] = converter(param, param_value)
 
         init = cls._get_only_init_args(args)
         return cls(**init)
@@ -184,73 +654,7 @@ class BaseModel(ABC):
         param_value: Union[int, str, bool, BaseModel, Enum, List[Any], Dict[str, Any]],
     ) -> Any:  # noqa: ANN401
         """Recursively handles each individual param in `from_dict`."""
-        param_type_origin = get_origin(param_type)
-        # returns `list` if a List, `Union` if a Union, None otherwise
-
-        if param_type_origin is list and isinstance(param_value, list):
-            # expected a List, received a List
-            list_type = get_args(param_type)[0]
-            return [
-                cls._from_dict_single_param(param, list_type, item)
-                for item in param_value
-            ]
-
-        if param_type_origin is Union:
-            for param_type_option in get_args(param_type):
-                # iterate through the types Union-ed together
-                try:
-                    # try to use this Union-ed type to process param_value
-                    return cls._from_dict_single_param(
-                        param, param_type_option, param_value
-                    )
-                except XRPLModelException:
-                    # this Union-ed type did not work, move onto the next one
-                    pass
-
-        # no more collections (no params expect a Dict)
-
-        if param_type is Any:
-            # param_type is Any (e.g. will accept anything)
-            return param_value
-
-        if isinstance(param_type, type) and isinstance(param_value, param_type):
-            # expected an object, received the correct object
-            return param_value
-
-        if get_origin(param_type) == Literal:
-            # param_type is Literal (has very specific values it will accept)
-            if param_value in get_args(param_type):
-                # param_value is one of the accepted values
-                return param_value
-
-        if (
-            isinstance(param_type, type)
-            and issubclass(param_type, Enum)
-            and param_value in list(param_type)
-        ):
-            # expected an Enum and received a valid value for it.
-            # for some reason required for string enums.
-            return param_value
-
-        if (
-            isinstance(param_type, type)
-            and issubclass(param_type, BaseModel)
-            and isinstance(param_value, dict)
-        ):
-            # expected an XRPL Model, received a Dict
-            return cast(BaseModel, param_type).from_dict(param_value)
-
-        # received something we didn't expect, raise an error
-        if isinstance(param_type, type) and issubclass(param_type, BaseModel):
-            error_message = (
-                f"{param} expected a {param_type} or a Dict representing {param_type}, "
-                f"received a {type(param_value)}"
-            )
-        else:
-            error_message = (
-                f"{param} expected a {param_type}, received a {type(param_value)}"
-            )
-        raise XRPLModelException(error_message)
+        return _get_converter(param_type)(param, param_value)
 
     @classmethod
     def _process_xrpl_json(
@@ -278,7 +682,7 @@ class BaseModel(ABC):
 
     @classmethod
     def _get_only_init_args(cls: Type[Self], args: Dict[str, Any]) -> Dict[str, Any]:
-        init_keys = {field.name for field in fields(cls) if field.init is True}
+        init_keys = _get_model_metadata(cls).init_fields
         valid_args = {key: value for key, value in args.items() if key in init_keys}
         return valid_args
 
@@ -301,7 +705,8 @@ class BaseModel(ABC):
 
     def __post_init__(self: Self) -> None:
         """Called by dataclasses immediately after __init__."""
-        self.validate()
+        if not _TRUSTED.get():
+            self.validate()
 
     def validate(self: Self) -> None:
         """
@@ -330,11 +735,11 @@ class BaseModel(ABC):
         Returns error dictionary if the type of `value` does not match the
         `expected_type`.
         """
-        expected_type_origin = get_origin(expected_type)
+        expected_type_origin, expected_type_args = _get_origin_and_args(expected_type)
         if expected_type_origin is Union:
             if any(
                 len(self._check_type(attr, value, expected_type_option)) == 0
-                for expected_type_option in get_args(expected_type)
+                for expected_type_option in expected_type_args
             ):
                 return {}
             return {attr: f"{attr} is {type(value)}, expected {expected_type}"}
@@ -350,9 +755,7 @@ class BaseModel(ABC):
             result = {}
             for i in range(len(value)):
                 result.update(
-                    self._check_type(
-                        f"{attr}[{i}]", value[i], get_args(expected_type)[0]
-                    )
+                    self._check_type(f"{attr}[{i}]", value[i], expected_type_args[0])
                 )
             return result
 
@@ -373,7 +776,7 @@ class BaseModel(ABC):
             )
 
         if expected_type_origin is Literal:
-            arg = get_args(expected_type)
+            arg = expected_type_args
             return {} if value in arg else {attr: f"{attr} is {value}, expected {arg}"}
 
         if issubclass(expected_type, BaseModel) and isinstance(value, dict):
@@ -391,13 +794,17 @@ class BaseModel(ABC):
         Returns:
             Dictionary of any errors found on self.
         """
-        class_types = get_type_hints(self.__class__)
+        metadata = _get_model_metadata(self.__class__)
+        type_checks = metadata.type_checks
         result: Dict[str, str] = {}
-        for attr, value in self.__dict__.items():
+        for attr in metadata.dict_fields:
+            value = getattr(self, attr)
             if value is REQUIRED:
                 result[attr] = f"{attr} is not set"
-            else:
-                result.update(self._check_type(attr, value, class_types[attr]))
+            elif not type_checks[attr](value):
+                # the compiled check only says whether the value is valid, so build
+                # the error messages with the reflective check
+                result.update(self._check_type(attr, value, metadata.type_hints[attr]))
         return result
 
     def to_dict(self: Self) -> Dict[str, Any]:
@@ -409,13 +816,16 @@ class BaseModel(ABC):
         Returns:
             The dictionary representation of a BaseModel.
         """
-        # mypy doesn't realize that BaseModel has a field called __dataclass_fields__
-        dataclass_fields = self.__dataclass_fields__.keys()
-        return {
-            key: self._to_dict_elem(getattr(self, key))
-            for key in dataclass_fields
-            if getattr(self, key) is not None
-        }
+        result = {}
+        for key in _get_model_metadata(self.__class__).dict_fields:
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = (
+                    value
+                    if value.__class__ in _PLAIN_TYPES
+                    else self._to_dict_elem(value)
+                )
+        return result
 
     def _to_dict_elem(self: Self, elem: Any) -> Any:  # noqa: ANN401
         if isinstance(elem, BaseModel):
@@ -431,8 +841,31 @@ class BaseModel(ABC):
         return elem
 
     def __eq__(self: Self, other: object) -> bool:
-        """Compares a BaseModel to another object to determine if they are equal."""
-        return isinstance(other, BaseModel) and self.to_dict() == other.to_dict()
+        """
+        Compares a BaseModel to another object to determine if they are equal.
+
+        Models are equal if they are of the same class and each of their fields is
+        equal, like the ``__eq__`` that ``@dataclass`` generates for each model.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        field_values = _get_model_metadata(self.__class__).field_values
+        return field_values(self) == field_values(other)
+
+    def __hash__(self: Self) -> int:
+        """
+        Returns a hash of the class and fields of a BaseModel, so that models can be
+        used in sets and as dictionary keys. Fields holding lists and dictionaries
+        are hashed by their contents.
+        """
+        metadata = _get_model_metadata(self.__class__)
+        values = metadata.field_values(self)
+        if metadata.container_fields:
+            hashable_values = list(values)
+            for index in metadata.container_fields:
+                hashable_values[index] = _hashable(hashable_values[index])
+            values = tuple(hashable_values)
+        return hash((self.__class__, values))
 
     def __repr__(self: Self) -> str:
         """Returns a string representation of a BaseModel object.
@@ -451,3 +884,7 @@ class BaseModel(ABC):
             else:
                 parts.append(f"{f.name}={value!r}")
         return f"{type(self).__name__}({', '.join(parts)})"
+
+
+_rebind_class_cells(BaseModel)
+_BASE_FROM_DICT: Final[Any] = BaseModel.from_dict.__func__  # type: ignore
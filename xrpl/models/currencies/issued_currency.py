@@ -25,7 +25,7 @@ def _is_valid_currency(candidate: str) -> bool:
     )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class IssuedCurrency(BaseModel):
     """
     Specifies an amount in an issued currency, but without a value field.
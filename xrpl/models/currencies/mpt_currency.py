@@ -22,7 +22,7 @@ def _is_valid_mptid(candidate: str) -> bool:
     return bool(HEX_MPTID_REGEX.fullmatch(candidate))
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTCurrency(BaseModel):
     """
     Specifies an amount in an MPT, but without a value field.
@@ -20,7 +20,7 @@ from xrpl.models.base_model import BaseModel
 from xrpl.models.exceptions import XRPLModelException
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XRP(BaseModel):
     """
     Specifies XRP as a currency, without a value. Normally, you will not use this
@@ -20,6 +20,8 @@ def _get_nested_name(cls: Union[NestedModel, Type[NestedModel]]) -> str:
 class NestedModel(BaseModel):
     """The base class for models that involve a nested dictionary e.g. memos."""
 
+    __slots__ = ()
+
     @classmethod
     def is_dict_of_model(cls: Type[Self], dictionary: Any) -> bool:  # noqa: ANN401
         """
@@ -13,7 +13,7 @@ from typing_extensions import Self
 from xrpl.models.base_model import BaseModel
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PathStep(BaseModel):
     """A PathStep represents an individual step along a Path."""
 
@@ -1,57 +1,119 @@
 """Request models."""
 
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
 from xrpl.models.auth_account import AuthAccount
 from xrpl.models.path import PathStep
-from xrpl.models.requests.account_channels import AccountChannels
-from xrpl.models.requests.account_currencies import AccountCurrencies
-from xrpl.models.requests.account_info import AccountInfo
-from xrpl.models.requests.account_lines import AccountLines
-from xrpl.models.requests.account_nfts import AccountNFTs
-from xrpl.models.requests.account_objects import AccountObjects, AccountObjectType
-from xrpl.models.requests.account_offers import AccountOffers
-from xrpl.models.requests.account_tx import AccountTx
-from xrpl.models.requests.amm_info import AMMInfo
-from xrpl.models.requests.book_offers import BookOffers
-from xrpl.models.requests.channel_authorize import ChannelAuthorize
-from xrpl.models.requests.channel_verify import ChannelVerify
-from xrpl.models.requests.deposit_authorized import DepositAuthorized
-from xrpl.models.requests.feature import Feature
-from xrpl.models.requests.fee import Fee
-from xrpl.models.requests.gateway_balances import GatewayBalances
-from xrpl.models.requests.generic_request import GenericRequest
-from xrpl.models.requests.get_aggregate_price import GetAggregatePrice
-from xrpl.models.requests.ledger import Ledger
-from xrpl.models.requests.ledger_closed import LedgerClosed
-from xrpl.models.requests.ledger_current import LedgerCurrent
-from xrpl.models.requests.ledger_data import LedgerData
-from xrpl.models.requests.ledger_entry import LedgerEntry, LedgerEntryType
-from xrpl.models.requests.manifest import Manifest
-from xrpl.models.requests.nft_buy_offers import NFTBuyOffers
-from xrpl.models.requests.nft_history import NFTHistory
-from xrpl.models.requests.nft_info import NFTInfo
-from xrpl.models.requests.nft_sell_offers import NFTSellOffers
-from xrpl.models.requests.nfts_by_issuer import NFTsByIssuer
-from xrpl.models.requests.no_ripple_check import NoRippleCheck, NoRippleCheckRole
-from xrpl.models.requests.path_find import PathFind, PathFindSubcommand
-from xrpl.models.requests.ping import Ping
-from xrpl.models.requests.random import Random
-from xrpl.models.requests.request import Request
-from xrpl.models.requests.ripple_path_find import RipplePathFind
-from xrpl.models.requests.server_definitions import ServerDefinitions
-from xrpl.models.requests.server_info import ServerInfo
-from xrpl.models.requests.server_state import ServerState
-from xrpl.models.requests.sign import Sign
-from xrpl.models.requests.sign_and_submit import SignAndSubmit
-from xrpl.models.requests.sign_for import SignFor
-from xrpl.models.requests.simulate import Simulate
-from xrpl.models.requests.submit import Submit
-from xrpl.models.requests.submit_multisigned import SubmitMultisigned
-from xrpl.models.requests.submit_only import SubmitOnly
-from xrpl.models.requests.subscribe import StreamParameter, Subscribe, SubscribeBook
-from xrpl.models.requests.transaction_entry import TransactionEntry
-from xrpl.models.requests.tx import Tx
-from xrpl.models.requests.unsubscribe import Unsubscribe
-from xrpl.models.requests.vault_info import VaultInfo
+
+if TYPE_CHECKING:
+    from xrpl.models.requests.account_channels import AccountChannels
+    from xrpl.models.requests.account_currencies import AccountCurrencies
+    from xrpl.models.requests.account_info import AccountInfo
+    from xrpl.models.requests.account_lines import AccountLines
+    from xrpl.models.requests.account_nfts import AccountNFTs
+    from xrpl.models.requests.account_objects import AccountObjects, AccountObjectType
+    from xrpl.models.requests.account_offers import AccountOffers
+    from xrpl.models.requests.account_tx import AccountTx
+    from xrpl.models.requests.amm_info import AMMInfo
+    from xrpl.models.requests.book_offers import BookOffers
+    from xrpl.models.requests.channel_authorize import ChannelAuthorize
+    from xrpl.models.requests.channel_verify import ChannelVerify
+    from xrpl.models.requests.deposit_authorized import DepositAuthorized
+    from xrpl.models.requests.feature import Feature
+    from xrpl.models.requests.fee import Fee
+    from xrpl.models.requests.gateway_balances import GatewayBalances
+    from xrpl.models.requests.generic_request import GenericRequest
+    from xrpl.models.requests.get_aggregate_price import GetAggregatePrice
+    from xrpl.models.requests.ledger import Ledger
+    from xrpl.models.requests.ledger_closed import LedgerClosed
+    from xrpl.models.requests.ledger_current import LedgerCurrent
+    from xrpl.models.requests.ledger_data import LedgerData
+    from xrpl.models.requests.ledger_entry import LedgerEntry, LedgerEntryType
+    from xrpl.models.requests.manifest import Manifest
+    from xrpl.models.requests.nft_buy_offers import NFTBuyOffers
+    from xrpl.models.requests.nft_history import NFTHistory
+    from xrpl.models.requests.nft_info import NFTInfo
+    from xrpl.models.requests.nft_sell_offers import NFTSellOffers
+    from xrpl.models.requests.nfts_by_issuer import NFTsByIssuer
+    from xrpl.models.requests.no_ripple_check import NoRippleCheck, NoRippleCheckRole
+    from xrpl.models.requests.path_find import PathFind, PathFindSubcommand
+    from xrpl.models.requests.ping import Ping
+    from xrpl.models.requests.random import Random
+    from xrpl.models.requests.request import Request
+    from xrpl.models.requests.ripple_path_find import RipplePathFind
+    from xrpl.models.requests.server_definitions import ServerDefinitions
+    from xrpl.models.requests.server_info import ServerInfo
+    from xrpl.models.requests.server_state import ServerState
+    from xrpl.models.requests.sign import Sign
+    from xrpl.models.requests.sign_and_submit import SignAndSubmit
+    from xrpl.models.requests.sign_for import SignFor
+    from xrpl.models.requests.simulate import Simulate
+    from xrpl.models.requests.submit import Submit
+    from xrpl.models.requests.submit_multisigned import SubmitMultisigned
+    from xrpl.models.requests.submit_only import SubmitOnly
+    from xrpl.models.requests.subscribe import StreamParameter, Subscribe, SubscribeBook
+    from xrpl.models.requests.transaction_entry import TransactionEntry
+    from xrpl.models.requests.tx import Tx
+    from xrpl.models.requests.unsubscribe import Unsubscribe
+    from xrpl.models.requests.vault_info import VaultInfo
+else:
+    # the models are imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodule_attributes={
+            "account_channels": ["AccountChannels"],
+            "account_currencies": ["AccountCurrencies"],
+            "account_info": ["AccountInfo"],
+            "account_lines": ["AccountLines"],
+            "account_nfts": ["AccountNFTs"],
+            "account_objects": ["AccountObjects", "AccountObjectType"],
+            "account_offers": ["AccountOffers"],
+            "account_tx": ["AccountTx"],
+            "amm_info": ["AMMInfo"],
+            "book_offers": ["BookOffers"],
+            "channel_authorize": ["ChannelAuthorize"],
+            "channel_verify": ["ChannelVerify"],
+            "deposit_authorized": ["DepositAuthorized"],
+            "feature": ["Feature"],
+            "fee": ["Fee"],
+            "gateway_balances": ["GatewayBalances"],
+            "generic_request": ["GenericRequest"],
+            "get_aggregate_price": ["GetAggregatePrice"],
+            "ledger": ["Ledger"],
+            "ledger_closed": ["LedgerClosed"],
+            "ledger_current": ["LedgerCurrent"],
+            "ledger_data": ["LedgerData"],
+            "ledger_entry": ["LedgerEntry", "LedgerEntryType"],
+            "manifest": ["Manifest"],
+            "nft_buy_offers": ["NFTBuyOffers"],
+            "nft_history": ["NFTHistory"],
+            "nft_info": ["NFTInfo"],
+            "nft_sell_offers": ["NFTSellOffers"],
+            "nfts_by_issuer": ["NFTsByIssuer"],
+            "no_ripple_check": ["NoRippleCheck", "NoRippleCheckRole"],
+            "path_find": ["PathFind", "PathFindSubcommand"],
+            "ping": ["Ping"],
+            "random": ["Random"],
+            "request": ["Request"],
+            "ripple_path_find": ["RipplePathFind"],
+            "server_definitions": ["ServerDefinitions"],
+            "server_info": ["ServerInfo"],
+            "server_state": ["ServerState"],
+            "sign": ["Sign"],
+            "sign_and_submit": ["SignAndSubmit"],
+            "sign_for": ["SignFor"],
+            "simulate": ["Simulate"],
+            "submit": ["Submit"],
+            "submit_multisigned": ["SubmitMultisigned"],
+            "submit_only": ["SubmitOnly"],
+            "subscribe": ["StreamParameter", "Subscribe", "SubscribeBook"],
+            "transaction_entry": ["TransactionEntry"],
+            "tx": ["Tx"],
+            "unsubscribe": ["Unsubscribe"],
+            "vault_info": ["VaultInfo"],
+        },
+    )
 
 __all__ = [
     "AccountChannels",
@@ -15,7 +15,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountChannels(Request, LookupByLedgerRequest):
     """
     This request returns information about an account's Payment Channels. This includes
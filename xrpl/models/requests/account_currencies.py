@@ -14,7 +14,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountCurrencies(Request, LookupByLedgerRequest):
     """
     This request retrieves a list of currencies that an account can send or receive,
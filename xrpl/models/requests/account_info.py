@@ -13,7 +13,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountInfo(Request, LookupByLedgerRequest):
     """
     This request retrieves information about an account, its activity, and its XRP
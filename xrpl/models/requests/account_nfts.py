@@ -7,7 +7,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountNFTs(Request, LookupByLedgerRequest):
     """
     This method retrieves all of the NFTs currently owned
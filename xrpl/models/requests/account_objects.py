@@ -45,7 +45,7 @@ class AccountObjectType(str, Enum):
     XCHAIN_OWNED_CLAIM_ID = "xchain_owned_claim_id"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountObjects(Request, LookupByLedgerRequest):
     """
     This request returns the raw ledger format for all objects owned by an account.
@@ -11,7 +11,7 @@ from xrpl.models.currencies import Currency
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMInfo(Request):
     """
     The `amm_info` method gets information about an Automated Market Maker
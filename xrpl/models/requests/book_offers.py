@@ -11,7 +11,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BookOffers(Request, LookupByLedgerRequest):
     """
     The book_offers method retrieves a list of offers, also known
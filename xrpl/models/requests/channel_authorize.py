@@ -25,7 +25,7 @@ from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChannelAuthorize(Request):
     """
     The channel_authorize method creates a signature that can
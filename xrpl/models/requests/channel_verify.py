@@ -10,7 +10,7 @@ from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ChannelVerify(Request):
     """
     The channel_verify method checks the validity of a
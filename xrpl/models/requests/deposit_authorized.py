@@ -12,7 +12,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DepositAuthorized(Request, LookupByLedgerRequest):
     """
     The deposit_authorized command indicates whether one account
@@ -8,7 +8,7 @@ from typing import Optional
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Feature(Request):
     """The `feature` method gets information about a network's amendments."""
 
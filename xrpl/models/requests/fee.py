@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Fee(Request):
     """
     The fee command reports the current state of the open-ledger requirements
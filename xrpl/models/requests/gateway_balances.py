@@ -12,7 +12,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GatewayBalances(Request, LookupByLedgerRequest):
     """
     This request calculates the total balances issued by a given account, optionally
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, Type, Union, cast
 
 from typing_extensions import Self
 
+from xrpl.models.base_model import _hashable
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.requests.request import Request, RequestMethod
 
@@ -82,11 +83,11 @@ class GenericRequest(Request):
         Returns:
             The dictionary representation of a GenericRequest.
         """
-        # uses self.__dict__ instead of self.__dataclass_fields__.keys(), which is what
-        # the other models do, because this model doesn't have any dataclass fields
+        # also uses self.__dict__, unlike the other models, because the arguments
+        # that aren't dataclass fields are kept there (this model has no slots)
         dict = {
             key: self._to_dict_elem(getattr(self, key))
-            for key in self.__dict__
+            for key in (*(field.name for field in fields(self)), *self.__dict__)
             if getattr(self, key) is not None
         }
 
@@ -95,3 +96,16 @@ class GenericRequest(Request):
             del dict["command"]
 
         return dict
+
+    def __eq__(self: Self, other: object) -> bool:
+        """
+        Compares a GenericRequest to another object to determine if they are equal,
+        including the arguments that are not dataclass fields.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict() == cast(GenericRequest, other).to_dict()
+
+    def __hash__(self: Self) -> int:
+        """Returns a hash of a GenericRequest, including all of its arguments."""
+        return hash((self.__class__, _hashable(self.to_dict())))
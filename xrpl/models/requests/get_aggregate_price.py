@@ -15,7 +15,7 @@ from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GetAggregatePrice(Request):
     """
     The get_aggregate_price method retrieves the aggregate price of specified Oracle
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import LookupByLedgerRequest, Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Ledger(Request, LookupByLedgerRequest):
     """
     Retrieve information about the public ledger.
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LedgerClosed(Request):
     """
     The ledger_closed method returns the unique
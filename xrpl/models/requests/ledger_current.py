@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LedgerCurrent(Request):
     """
     The ledger_current method returns the unique
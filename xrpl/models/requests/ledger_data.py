@@ -13,7 +13,7 @@ from xrpl.models.requests.ledger_entry import LedgerEntryType
 from xrpl.models.requests.request import LookupByLedgerRequest, Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LedgerData(Request, LookupByLedgerRequest):
     """
     The ledger_data method retrieves contents of
@@ -50,7 +50,7 @@ class LedgerEntryType(str, Enum):
     NFT_OFFER = "nft_offer"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Credential(BaseModel):
     """Specify the Credential to retrieve. If a string, must be the ledger entry ID of
     the entry, as hexadecimal. If an object, requires subject, issuer, and
@@ -67,7 +67,7 @@ class Credential(BaseModel):
     """The type of the credential, as issued."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Delegate(BaseModel):
     """
     Required fields for requesting a Delegate ledger object if not querying by
@@ -89,7 +89,7 @@ class Delegate(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DepositPreauth(BaseModel):
     """
     Required fields for requesting a DepositPreauth if not querying by
@@ -111,7 +111,7 @@ class DepositPreauth(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Directory(BaseModel):
     """
     Required fields for requesting a DirectoryNode if not querying by
@@ -134,7 +134,7 @@ class Directory(BaseModel):
     sub_index: Optional[int] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Escrow(BaseModel):
     """
     Required fields for requesting a Escrow if not querying by
@@ -156,7 +156,7 @@ class Escrow(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPToken(BaseModel):
     """
     Required fields for requesting a MPToken Ledger Entry, if not querying by
@@ -178,7 +178,7 @@ class MPToken(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Offer(BaseModel):
     """
     Required fields for requesting a Offer if not querying by
@@ -200,7 +200,7 @@ class Offer(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Oracle(BaseModel):
     """
     Required fields for requesting a Price Oracle Ledger Entry, if not querying by
@@ -222,7 +222,7 @@ class Oracle(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PermissionedDomain(BaseModel):
     """
     Required fields for requesting a PermissionedDomain if not querying by
@@ -233,7 +233,7 @@ class PermissionedDomain(BaseModel):
     seq: int = REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RippleState(BaseModel):
     """Required fields for requesting a RippleState if not querying by object ID."""
 
@@ -252,7 +252,7 @@ class RippleState(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Ticket(BaseModel):
     """Required fields for requesting a Ticket if not querying by object ID."""
 
@@ -271,7 +271,7 @@ class Ticket(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Sponsorship(BaseModel):
     """Required fields for requesting a Sponsorship if not querying by object ID."""
 
@@ -290,7 +290,7 @@ class Sponsorship(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Vault(BaseModel):
     """Required fields for requesting a Vault ledger-object if not querying by
     object ID.
@@ -311,7 +311,7 @@ class Vault(BaseModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XChainClaimID(XChainBridge):
     """Required fields for requesting an XChainClaimID if not querying by object ID."""
 
@@ -324,7 +324,7 @@ class XChainClaimID(XChainBridge):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XChainCreateAccountClaimID(XChainBridge):
     """
     Required fields for requesting an XChainCreateAccountClaimID if not querying by
@@ -340,7 +340,7 @@ class XChainCreateAccountClaimID(XChainBridge):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LedgerEntry(Request, LookupByLedgerRequest):
     """
     The ledger_entry method returns a single ledger
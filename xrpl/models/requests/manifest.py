@@ -11,7 +11,7 @@ from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Manifest(Request):
     """
     The manifest method reports the current
@@ -9,7 +9,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTBuyOffers(Request, LookupByLedgerRequest):
     """
     The `nft_buy_offers` method retrieves all of buy offers
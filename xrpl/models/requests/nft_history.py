@@ -10,7 +10,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTHistory(Request, LookupByLedgerRequest):
     """
     The `nft_history` method retreives a list of transactions that involved the
@@ -9,7 +9,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTInfo(Request, LookupByLedgerRequest):
     """
     The `nft_info` method retrieves all the information about the
@@ -9,7 +9,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTSellOffers(Request, LookupByLedgerRequest):
     """
     The `nft_sell_offers` method retrieves all of sell offers
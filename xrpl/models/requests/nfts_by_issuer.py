@@ -10,7 +10,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTsByIssuer(Request, LookupByLedgerRequest):
     """
     The `nfts_by_issuer` method retrieves all of the NFTokens
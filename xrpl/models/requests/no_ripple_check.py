@@ -21,7 +21,7 @@ class NoRippleCheckRole(str, Enum):
     USER = "user"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NoRippleCheck(Request, LookupByLedgerRequest):
     """
     This request provides a quick way to check the status of the Default Ripple field
@@ -54,7 +54,7 @@ class PathFindSubcommand(str, Enum):
     STATUS = "status"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PathFind(Request):
     """
     WebSocket API only! The path_find method searches for a
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Ping(Request):
     """
     The ping command returns an acknowledgement, so that
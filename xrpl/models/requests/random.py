@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Random(Request):
     """
     The random command provides a random number to be
@@ -13,12 +13,15 @@ from typing import Any, Dict, Optional, Type, Union, cast
 from typing_extensions import Final, Self
 
 import xrpl.models.requests  # bare import to get around circular dependency
-from xrpl.models.base_model import ABBREVIATIONS, BaseModel
+from xrpl.models.base_model import BaseModel, _key_to_tx_json
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.required import REQUIRED
 
 _DEFAULT_API_VERSION: Final[int] = 2
 
+# request classes by method, added as each method is first used
+_REQUEST_METHODS: Final[Dict[str, Type[Request]]] = {}
+
 
 class RequestMethod(str, Enum):
     """Represents the different options for the ``method`` field in a request."""
@@ -98,7 +101,7 @@ class RequestMethod(str, Enum):
     GENERIC_REQUEST = "zzgeneric_request"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Request(BaseModel):
     """
     The base class for all network request types.
@@ -190,15 +193,16 @@ class Request(BaseModel):
             The request class with the given name. If the request doesn't exist, then
             it will return a `GenericRequest`.
         """
-        parsed_name = "".join(
-            [
-                ABBREVIATIONS[word] if word in ABBREVIATIONS else word.capitalize()
-                for word in method.split("_")
-            ]
-        )
-        if parsed_name in xrpl.models.requests.__all__:
-            return cast(Type[Request], getattr(xrpl.models.requests, parsed_name))
-        return xrpl.models.requests.GenericRequest
+        request_class = _REQUEST_METHODS.get(method)
+        if request_class is not None:
+            return request_class
+        parsed_name = _key_to_tx_json(method)
+        if parsed_name not in xrpl.models.requests.__all__:
+            # not cached, since any method can be sent as a `GenericRequest`
+            return xrpl.models.requests.GenericRequest
+        request_class = cast(Type[Request], getattr(xrpl.models.requests, parsed_name))
+        _REQUEST_METHODS[method] = request_class
+        return request_class
 
     def to_dict(self: Self) -> Dict[str, Any]:
         """
@@ -216,6 +220,10 @@ class Request(BaseModel):
 class LookupByLedgerRequest:
     """Represents requests that need specifying an instance of the ledger"""
 
+    # the requests using this mixin hold its fields in their own slots: two
+    # bases with slots of their own cannot be combined
+    __slots__ = ()
+
     ledger_hash: Optional[str] = None
     """
     A 20-byte hex string for the ledger version to use.
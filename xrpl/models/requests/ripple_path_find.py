@@ -21,7 +21,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class RipplePathFind(Request, LookupByLedgerRequest):
     """
     The ripple_path_find method is a simplified version of the
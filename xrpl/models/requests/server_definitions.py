@@ -10,7 +10,7 @@ from typing import Optional
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ServerDefinitions(Request):
     """
     The definitions command asks the server for a
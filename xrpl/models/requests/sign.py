@@ -28,7 +28,7 @@ from xrpl.models.required import REQUIRED
 from xrpl.models.transactions.transaction import Transaction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Sign(Request):
     """
     The sign method takes a transaction in JSON format and a seed value, and returns a
@@ -33,7 +33,7 @@ from xrpl.models.required import REQUIRED
 from xrpl.models.transactions.transaction import Transaction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SignAndSubmit(Submit):
     """
     The submit method applies a transaction and sends it to the network to be confirmed
@@ -22,7 +22,7 @@ from xrpl.models.required import REQUIRED
 from xrpl.models.transactions.transaction import Transaction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SignFor(Request):
     """
     The sign_for command provides one signature for a multi-signed transaction.
@@ -12,7 +12,7 @@ from xrpl.models.requests.request import Request, RequestMethod
 from xrpl.models.transactions.transaction import Transaction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Simulate(Request):
     """
     The `simulate` method simulates a transaction without submitting it to the
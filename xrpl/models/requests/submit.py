@@ -30,7 +30,7 @@ from typing_extensions import Self
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Submit(Request):
     """
     WARNING: This object should never be created. You should create an object of type
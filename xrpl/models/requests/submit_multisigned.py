@@ -20,7 +20,7 @@ from xrpl.models.required import REQUIRED
 from xrpl.models.transactions.transaction import Transaction
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SubmitMultisigned(Request):
     """
     The submit_multisigned command applies a multi-signed transaction and sends it to
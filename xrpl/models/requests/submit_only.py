@@ -26,7 +26,7 @@ from xrpl.models.requests.submit import Submit
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SubmitOnly(Submit):
     """
     The submit method applies a transaction and sends it to the network to be confirmed
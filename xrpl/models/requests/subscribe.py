@@ -30,7 +30,7 @@ class StreamParameter(str, Enum):
     VALIDATIONS = "validations"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SubscribeBook(BaseModel):
     """Format for elements in the ``books`` array for Subscribe only."""
 
@@ -60,7 +60,7 @@ class SubscribeBook(BaseModel):
     domain: Optional[str] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Subscribe(Request):
     """
     The subscribe method requests periodic notifications from the server
@@ -14,7 +14,7 @@ from xrpl.models.requests.request import LookupByLedgerRequest, Request, Request
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TransactionEntry(Request, LookupByLedgerRequest):
     """
     The transaction_entry method retrieves information on a single transaction from a
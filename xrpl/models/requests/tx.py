@@ -14,7 +14,7 @@ from typing_extensions import Self
 from xrpl.models.requests.request import Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Tx(Request):
     """
     The tx method retrieves information on a single transaction.
@@ -17,7 +17,7 @@ from xrpl.models.requests.subscribe import StreamParameter
 from xrpl.models.required import REQUIRED
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UnsubscribeBook(BaseModel):
     """Format for elements in the ``books`` array for Unsubscribe only."""
 
@@ -38,7 +38,7 @@ class UnsubscribeBook(BaseModel):
     both: bool = False
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Unsubscribe(Request):
     """
     The unsubscribe command tells the server to stop sending
@@ -12,7 +12,7 @@ from typing_extensions import Self
 from xrpl.models.requests.request import LookupByLedgerRequest, Request, RequestMethod
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultInfo(Request, LookupByLedgerRequest):
     """
     This request retrieves information about a Single Asset Vault.
@@ -34,7 +34,7 @@ class ResponseType(str, Enum):
     TRANSACTION = "transaction"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Response(BaseModel):
     """
     The base class for all network response types.
@@ -3,162 +3,333 @@ Model objects for specific `types of Transactions
 <https://xrpl.org/transaction-types.html>`_ in the XRP Ledger.
 """
 
-from xrpl.models.transactions.account_delete import AccountDelete
-from xrpl.models.transactions.account_set import (
-    AccountSet,
-    AccountSetAsfFlag,
-    AccountSetFlag,
-    AccountSetFlagInterface,
-)
-from xrpl.models.transactions.amm_bid import AMMBid, AuthAccount
-from xrpl.models.transactions.amm_clawback import AMMClawback
-from xrpl.models.transactions.amm_create import AMMCreate
-from xrpl.models.transactions.amm_delete import AMMDelete
-from xrpl.models.transactions.amm_deposit import (
-    AMMDeposit,
-    AMMDepositFlag,
-    AMMDepositFlagInterface,
-)
-from xrpl.models.transactions.amm_vote import AMMVote
-from xrpl.models.transactions.amm_withdraw import (
-    AMMWithdraw,
-    AMMWithdrawFlag,
-    AMMWithdrawFlagInterface,
-)
-from xrpl.models.transactions.batch import Batch, BatchFlag, BatchFlagInterface
-from xrpl.models.transactions.check_cancel import CheckCancel
-from xrpl.models.transactions.check_cash import CheckCash
-from xrpl.models.transactions.check_create import CheckCreate
-from xrpl.models.transactions.clawback import Clawback
-from xrpl.models.transactions.confidential_mpt_clawback import ConfidentialMPTClawback
-from xrpl.models.transactions.confidential_mpt_convert import ConfidentialMPTConvert
-from xrpl.models.transactions.confidential_mpt_convert_back import (
-    ConfidentialMPTConvertBack,
-)
-from xrpl.models.transactions.confidential_mpt_merge_inbox import (
-    ConfidentialMPTMergeInbox,
-)
-from xrpl.models.transactions.confidential_mpt_send import ConfidentialMPTSend
-from xrpl.models.transactions.credential_accept import CredentialAccept
-from xrpl.models.transactions.credential_create import CredentialCreate
-from xrpl.models.transactions.credential_delete import CredentialDelete
-from xrpl.models.transactions.delegate_set import DelegateSet, GranularPermission
-from xrpl.models.transactions.deposit_preauth import DepositPreauth
-from xrpl.models.transactions.did_delete import DIDDelete
-from xrpl.models.transactions.did_set import DIDSet
-from xrpl.models.transactions.escrow_cancel import EscrowCancel
-from xrpl.models.transactions.escrow_create import EscrowCreate
-from xrpl.models.transactions.escrow_finish import EscrowFinish
-from xrpl.models.transactions.loan_broker_cover_clawback import LoanBrokerCoverClawback
-from xrpl.models.transactions.loan_broker_cover_deposit import LoanBrokerCoverDeposit
-from xrpl.models.transactions.loan_broker_cover_withdraw import LoanBrokerCoverWithdraw
-from xrpl.models.transactions.loan_broker_delete import LoanBrokerDelete
-from xrpl.models.transactions.loan_broker_set import LoanBrokerSet
-from xrpl.models.transactions.loan_delete import LoanDelete
-from xrpl.models.transactions.loan_manage import LoanManage
-from xrpl.models.transactions.loan_pay import LoanPay, LoanPayFlag, LoanPayFlagInterface
-from xrpl.models.transactions.loan_set import LoanSet
-from xrpl.models.transactions.metadata import TransactionMetadata
-from xrpl.models.transactions.mptoken_authorize import (
-    MPTokenAuthorize,
-    MPTokenAuthorizeFlag,
-    MPTokenAuthorizeFlagInterface,
-)
-from xrpl.models.transactions.mptoken_issuance_create import (
-    MPTokenIssuanceCreate,
-    MPTokenIssuanceCreateFlag,
-    MPTokenIssuanceCreateFlagInterface,
-    MPTokenIssuanceImmutableFlag,
-)
-from xrpl.models.transactions.mptoken_issuance_destroy import MPTokenIssuanceDestroy
-from xrpl.models.transactions.mptoken_issuance_set import (
-    MPTokenIssuanceSet,
-    MPTokenIssuanceSetFlag,
-    MPTokenIssuanceSetFlagInterface,
-)
-from xrpl.models.transactions.nftoken_accept_offer import NFTokenAcceptOffer
-from xrpl.models.transactions.nftoken_burn import NFTokenBurn
-from xrpl.models.transactions.nftoken_cancel_offer import NFTokenCancelOffer
-from xrpl.models.transactions.nftoken_create_offer import (
-    NFTokenCreateOffer,
-    NFTokenCreateOfferFlag,
-    NFTokenCreateOfferFlagInterface,
-)
-from xrpl.models.transactions.nftoken_mint import (
-    NFTokenMint,
-    NFTokenMintFlag,
-    NFTokenMintFlagInterface,
-)
-from xrpl.models.transactions.nftoken_modify import NFTokenModify
-from xrpl.models.transactions.offer_cancel import OfferCancel
-from xrpl.models.transactions.offer_create import (
-    OfferCreate,
-    OfferCreateFlag,
-    OfferCreateFlagInterface,
-)
-from xrpl.models.transactions.oracle_delete import OracleDelete
-from xrpl.models.transactions.oracle_set import OracleSet
-from xrpl.models.transactions.payment import Payment, PaymentFlag, PaymentFlagInterface
-from xrpl.models.transactions.payment_channel_claim import (
-    PaymentChannelClaim,
-    PaymentChannelClaimFlag,
-    PaymentChannelClaimFlagInterface,
-)
-from xrpl.models.transactions.payment_channel_create import PaymentChannelCreate
-from xrpl.models.transactions.payment_channel_fund import PaymentChannelFund
-from xrpl.models.transactions.permissioned_domain_delete import PermissionedDomainDelete
-from xrpl.models.transactions.permissioned_domain_set import PermissionedDomainSet
-from xrpl.models.transactions.set_regular_key import SetRegularKey
-from xrpl.models.transactions.signer_list_set import SignerEntry, SignerListSet
-from xrpl.models.transactions.sponsorship_set import (
-    SponsorshipSet,
-    SponsorshipSetFlag,
-    SponsorshipSetFlagInterface,
-)
-from xrpl.models.transactions.sponsorship_transfer import (
-    SponsorshipTransfer,
-    SponsorshipTransferFlag,
-    SponsorshipTransferFlagInterface,
-)
-from xrpl.models.transactions.ticket_create import TicketCreate
-from xrpl.models.transactions.transaction import (
-    Memo,
-    Signer,
-    SponsorFlag,
-    SponsorSignature,
-    Transaction,
-    TransactionFlag,
-    TransactionFlagInterface,
-)
-from xrpl.models.transactions.trust_set import (
-    TrustSet,
-    TrustSetFlag,
-    TrustSetFlagInterface,
-)
-from xrpl.models.transactions.vault_clawback import VaultClawback
-from xrpl.models.transactions.vault_create import VaultCreate
-from xrpl.models.transactions.vault_delete import VaultDelete
-from xrpl.models.transactions.vault_deposit import VaultDeposit
-from xrpl.models.transactions.vault_set import VaultSet
-from xrpl.models.transactions.vault_withdraw import VaultWithdraw
-from xrpl.models.transactions.xchain_account_create_commit import (
-    XChainAccountCreateCommit,
-)
-from xrpl.models.transactions.xchain_add_account_create_attestation import (
-    XChainAddAccountCreateAttestation,
-)
-from xrpl.models.transactions.xchain_add_claim_attestation import (
-    XChainAddClaimAttestation,
-)
-from xrpl.models.transactions.xchain_claim import XChainClaim
-from xrpl.models.transactions.xchain_commit import XChainCommit
-from xrpl.models.transactions.xchain_create_bridge import XChainCreateBridge
-from xrpl.models.transactions.xchain_create_claim_id import XChainCreateClaimID
-from xrpl.models.transactions.xchain_modify_bridge import (
-    XChainModifyBridge,
-    XChainModifyBridgeFlag,
-    XChainModifyBridgeFlagInterface,
-)
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
+
+if TYPE_CHECKING:
+    from xrpl.models.transactions.account_delete import AccountDelete
+    from xrpl.models.transactions.account_set import (
+        AccountSet,
+        AccountSetAsfFlag,
+        AccountSetFlag,
+        AccountSetFlagInterface,
+    )
+    from xrpl.models.transactions.amm_bid import AMMBid, AuthAccount
+    from xrpl.models.transactions.amm_clawback import AMMClawback
+    from xrpl.models.transactions.amm_create import AMMCreate
+    from xrpl.models.transactions.amm_delete import AMMDelete
+    from xrpl.models.transactions.amm_deposit import (
+        AMMDeposit,
+        AMMDepositFlag,
+        AMMDepositFlagInterface,
+    )
+    from xrpl.models.transactions.amm_vote import AMMVote
+    from xrpl.models.transactions.amm_withdraw import (
+        AMMWithdraw,
+        AMMWithdrawFlag,
+        AMMWithdrawFlagInterface,
+    )
+    from xrpl.models.transactions.batch import Batch, BatchFlag, BatchFlagInterface
+    from xrpl.models.transactions.check_cancel import CheckCancel
+    from xrpl.models.transactions.check_cash import CheckCash
+    from xrpl.models.transactions.check_create import CheckCreate
+    from xrpl.models.transactions.clawback import Clawback
+    from xrpl.models.transactions.confidential_mpt_clawback import (
+        ConfidentialMPTClawback,
+    )
+    from xrpl.models.transactions.confidential_mpt_convert import ConfidentialMPTConvert
+    from xrpl.models.transactions.confidential_mpt_convert_back import (
+        ConfidentialMPTConvertBack,
+    )
+    from xrpl.models.transactions.confidential_mpt_merge_inbox import (
+        ConfidentialMPTMergeInbox,
+    )
+    from xrpl.models.transactions.confidential_mpt_send import ConfidentialMPTSend
+    from xrpl.models.transactions.credential_accept import CredentialAccept
+    from xrpl.models.transactions.credential_create import CredentialCreate
+    from xrpl.models.transactions.credential_delete import CredentialDelete
+    from xrpl.models.transactions.delegate_set import DelegateSet, GranularPermission
+    from xrpl.models.transactions.deposit_preauth import DepositPreauth
+    from xrpl.models.transactions.did_delete import DIDDelete
+    from xrpl.models.transactions.did_set import DIDSet
+    from xrpl.models.transactions.escrow_cancel import EscrowCancel
+    from xrpl.models.transactions.escrow_create import EscrowCreate
+    from xrpl.models.transactions.escrow_finish import EscrowFinish
+    from xrpl.models.transactions.loan_broker_cover_clawback import (
+        LoanBrokerCoverClawback,
+    )
+    from xrpl.models.transactions.loan_broker_cover_deposit import (
+        LoanBrokerCoverDeposit,
+    )
+    from xrpl.models.transactions.loan_broker_cover_withdraw import (
+        LoanBrokerCoverWithdraw,
+    )
+    from xrpl.models.transactions.loan_broker_delete import LoanBrokerDelete
+    from xrpl.models.transactions.loan_broker_set import LoanBrokerSet
+    from xrpl.models.transactions.loan_delete import LoanDelete
+    from xrpl.models.transactions.loan_manage import LoanManage
+    from xrpl.models.transactions.loan_pay import (
+        LoanPay,
+        LoanPayFlag,
+        LoanPayFlagInterface,
+    )
+    from xrpl.models.transactions.loan_set import LoanSet
+    from xrpl.models.transactions.metadata import TransactionMetadata
+    from xrpl.models.transactions.mptoken_authorize import (
+        MPTokenAuthorize,
+        MPTokenAuthorizeFlag,
+        MPTokenAuthorizeFlagInterface,
+    )
+    from xrpl.models.transactions.mptoken_issuance_create import (
+        MPTokenIssuanceCreate,
+        MPTokenIssuanceCreateFlag,
+        MPTokenIssuanceCreateFlagInterface,
+        MPTokenIssuanceImmutableFlag,
+    )
+    from xrpl.models.transactions.mptoken_issuance_destroy import MPTokenIssuanceDestroy
+    from xrpl.models.transactions.mptoken_issuance_set import (
+        MPTokenIssuanceSet,
+        MPTokenIssuanceSetFlag,
+        MPTokenIssuanceSetFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_accept_offer import NFTokenAcceptOffer
+    from xrpl.models.transactions.nftoken_burn import NFTokenBurn
+    from xrpl.models.transactions.nftoken_cancel_offer import NFTokenCancelOffer
+    from xrpl.models.transactions.nftoken_create_offer import (
+        NFTokenCreateOffer,
+        NFTokenCreateOfferFlag,
+        NFTokenCreateOfferFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_mint import (
+        NFTokenMint,
+        NFTokenMintFlag,
+        NFTokenMintFlagInterface,
+    )
+    from xrpl.models.transactions.nftoken_modify import NFTokenModify
+    from xrpl.models.transactions.offer_cancel import OfferCancel
+    from xrpl.models.transactions.offer_create import (
+        OfferCreate,
+        OfferCreateFlag,
+        OfferCreateFlagInterface,
+    )
+    from xrpl.models.transactions.oracle_delete import OracleDelete
+    from xrpl.models.transactions.oracle_set import OracleSet
+    from xrpl.models.transactions.payment import (
+        Payment,
+        PaymentFlag,
+        PaymentFlagInterface,
+    )
+    from xrpl.models.transactions.payment_channel_claim import (
+        PaymentChannelClaim,
+        PaymentChannelClaimFlag,
+        PaymentChannelClaimFlagInterface,
+    )
+    from xrpl.models.transactions.payment_channel_create import PaymentChannelCreate
+    from xrpl.models.transactions.payment_channel_fund import PaymentChannelFund
+    from xrpl.models.transactions.permissioned_domain_delete import (
+        PermissionedDomainDelete,
+    )
+    from xrpl.models.transactions.permissioned_domain_set import PermissionedDomainSet
+    from xrpl.models.transactions.set_regular_key import SetRegularKey
+    from xrpl.models.transactions.signer_list_set import SignerEntry, SignerListSet
+    from xrpl.models.transactions.sponsorship_set import (
+        SponsorshipSet,
+        SponsorshipSetFlag,
+        SponsorshipSetFlagInterface,
+    )
+    from xrpl.models.transactions.sponsorship_transfer import (
+        SponsorshipTransfer,
+        SponsorshipTransferFlag,
+        SponsorshipTransferFlagInterface,
+    )
+    from xrpl.models.transactions.ticket_create import TicketCreate
+    from xrpl.models.transactions.transaction import (
+        Memo,
+        Signer,
+        SponsorFlag,
+        SponsorSignature,
+        Transaction,
+        TransactionFlag,
+        TransactionFlagInterface,
+    )
+    from xrpl.models.transactions.trust_set import (
+        TrustSet,
+        TrustSetFlag,
+        TrustSetFlagInterface,
+    )
+    from xrpl.models.transactions.vault_clawback import VaultClawback
+    from xrpl.models.transactions.vault_create import VaultCreate
+    from xrpl.models.transactions.vault_delete import VaultDelete
+    from xrpl.models.transactions.vault_deposit import VaultDeposit
+    from xrpl.models.transactions.vault_set import VaultSet
+    from xrpl.models.transactions.vault_withdraw import VaultWithdraw
+    from xrpl.models.transactions.xchain_account_create_commit import (
+        XChainAccountCreateCommit,
+    )
+    from xrpl.models.transactions.xchain_add_account_create_attestation import (
+        XChainAddAccountCreateAttestation,
+    )
+    from xrpl.models.transactions.xchain_add_claim_attestation import (
+        XChainAddClaimAttestation,
+    )
+    from xrpl.models.transactions.xchain_claim import XChainClaim
+    from xrpl.models.transactions.xchain_commit import XChainCommit
+    from xrpl.models.transactions.xchain_create_bridge import XChainCreateBridge
+    from xrpl.models.transactions.xchain_create_claim_id import XChainCreateClaimID
+    from xrpl.models.transactions.xchain_modify_bridge import (
+        XChainModifyBridge,
+        XChainModifyBridgeFlag,
+        XChainModifyBridgeFlagInterface,
+    )
+else:
+    # the models are imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodules=["confidential_mpt_constants", "types"],
+        submodule_attributes={
+            "account_delete": ["AccountDelete"],
+            "account_set": [
+                "AccountSet",
+                "AccountSetAsfFlag",
+                "AccountSetFlag",
+                "AccountSetFlagInterface",
+            ],
+            "amm_bid": ["AMMBid", "AuthAccount"],
+            "amm_clawback": ["AMMClawback"],
+            "amm_create": ["AMMCreate"],
+            "amm_delete": ["AMMDelete"],
+            "amm_deposit": ["AMMDeposit", "AMMDepositFlag", "AMMDepositFlagInterface"],
+            "amm_vote": ["AMMVote"],
+            "amm_withdraw": [
+                "AMMWithdraw",
+                "AMMWithdrawFlag",
+                "AMMWithdrawFlagInterface",
+            ],
+            "batch": ["Batch", "BatchFlag", "BatchFlagInterface"],
+            "check_cancel": ["CheckCancel"],
+            "check_cash": ["CheckCash"],
+            "check_create": ["CheckCreate"],
+            "clawback": ["Clawback"],
+            "confidential_mpt_clawback": ["ConfidentialMPTClawback"],
+            "confidential_mpt_convert": ["ConfidentialMPTConvert"],
+            "confidential_mpt_convert_back": ["ConfidentialMPTConvertBack"],
+            "confidential_mpt_merge_inbox": ["ConfidentialMPTMergeInbox"],
+            "confidential_mpt_send": ["ConfidentialMPTSend"],
+            "credential_accept": ["CredentialAccept"],
+            "credential_create": ["CredentialCreate"],
+            "credential_delete": ["CredentialDelete"],
+            "delegate_set": ["DelegateSet", "GranularPermission"],
+            "deposit_preauth": ["DepositPreauth"],
+            "did_delete": ["DIDDelete"],
+            "did_set": ["DIDSet"],
+            "escrow_cancel": ["EscrowCancel"],
+            "escrow_create": ["EscrowCreate"],
+            "escrow_finish": ["EscrowFinish"],
+            "loan_broker_cover_clawback": ["LoanBrokerCoverClawback"],
+            "loan_broker_cover_deposit": ["LoanBrokerCoverDeposit"],
+            "loan_broker_cover_withdraw": ["LoanBrokerCoverWithdraw"],
+            "loan_broker_delete": ["LoanBrokerDelete"],
+            "loan_broker_set": ["LoanBrokerSet"],
+            "loan_delete": ["LoanDelete"],
+            "loan_manage": ["LoanManage"],
+            "loan_pay": ["LoanPay", "LoanPayFlag", "LoanPayFlagInterface"],
+            "loan_set": ["LoanSet"],
+            "metadata": ["TransactionMetadata"],
+            "mptoken_authorize": [
+                "MPTokenAuthorize",
+                "MPTokenAuthorizeFlag",
+                "MPTokenAuthorizeFlagInterface",
+            ],
+            "mptoken_issuance_create": [
+                "MPTokenIssuanceCreate",
+                "MPTokenIssuanceCreateFlag",
+                "MPTokenIssuanceCreateFlagInterface",
+                "MPTokenIssuanceImmutableFlag",
+            ],
+            "mptoken_issuance_destroy": ["MPTokenIssuanceDestroy"],
+            "mptoken_issuance_set": [
+                "MPTokenIssuanceSet",
+                "MPTokenIssuanceSetFlag",
+                "MPTokenIssuanceSetFlagInterface",
+            ],
+            "nftoken_accept_offer": ["NFTokenAcceptOffer"],
+            "nftoken_burn": ["NFTokenBurn"],
+            "nftoken_cancel_offer": ["NFTokenCancelOffer"],
+            "nftoken_create_offer": [
+                "NFTokenCreateOffer",
+                "NFTokenCreateOfferFlag",
+                "NFTokenCreateOfferFlagInterface",
+            ],
+            "nftoken_mint": [
+                "NFTokenMint",
+                "NFTokenMintFlag",
+                "NFTokenMintFlagInterface",
+            ],
+            "nftoken_modify": ["NFTokenModify"],
+            "offer_cancel": ["OfferCancel"],
+            "offer_create": [
+                "OfferCreate",
+                "OfferCreateFlag",
+                "OfferCreateFlagInterface",
+            ],
+            "oracle_delete": ["OracleDelete"],
+            "oracle_set": ["OracleSet"],
+            "payment": ["Payment", "PaymentFlag", "PaymentFlagInterface"],
+            "payment_channel_claim": [
+                "PaymentChannelClaim",
+                "PaymentChannelClaimFlag",
+                "PaymentChannelClaimFlagInterface",
+            ],
+            "payment_channel_create": ["PaymentChannelCreate"],
+            "payment_channel_fund": ["PaymentChannelFund"],
+            "permissioned_domain_delete": ["PermissionedDomainDelete"],
+            "permissioned_domain_set": ["PermissionedDomainSet"],
+            "set_regular_key": ["SetRegularKey"],
+            "signer_list_set": ["SignerEntry", "SignerListSet"],
+            "sponsorship_set": [
+                "SponsorshipSet",
+                "SponsorshipSetFlag",
+                "SponsorshipSetFlagInterface",
+            ],
+            "sponsorship_transfer": [
+                "SponsorshipTransfer",
+                "SponsorshipTransferFlag",
+                "SponsorshipTransferFlagInterface",
+            ],
+            "ticket_create": ["TicketCreate"],
+            "transaction": [
+                "Memo",
+                "Signer",
+                "SponsorFlag",
+                "SponsorSignature",
+                "Transaction",
+                "TransactionFlag",
+                "TransactionFlagInterface",
+            ],
+            "trust_set": ["TrustSet", "TrustSetFlag", "TrustSetFlagInterface"],
+            "vault_clawback": ["VaultClawback"],
+            "vault_create": ["VaultCreate"],
+            "vault_delete": ["VaultDelete"],
+            "vault_deposit": ["VaultDeposit"],
+            "vault_set": ["VaultSet"],
+            "vault_withdraw": ["VaultWithdraw"],
+            "xchain_account_create_commit": ["XChainAccountCreateCommit"],
+            "xchain_add_account_create_attestation": [
+                "XChainAddAccountCreateAttestation"
+            ],
+            "xchain_add_claim_attestation": ["XChainAddClaimAttestation"],
+            "xchain_claim": ["XChainClaim"],
+            "xchain_commit": ["XChainCommit"],
+            "xchain_create_bridge": ["XChainCreateBridge"],
+            "xchain_create_claim_id": ["XChainCreateClaimID"],
+            "xchain_modify_bridge": [
+                "XChainModifyBridge",
+                "XChainModifyBridgeFlag",
+                "XChainModifyBridgeFlagInterface",
+            ],
+        },
+    )
 
 __all__ = [
     "AccountDelete",
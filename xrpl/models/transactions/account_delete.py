@@ -11,7 +11,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import validate_credential_ids
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountDelete(Transaction):
     """
     Represents an `AccountDelete transaction
@@ -169,7 +169,7 @@ class AccountSetFlagInterface(TransactionFlagInterface):
     TF_ALLOW_XRP: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AccountSet(Transaction):
     """
     Represents an `AccountSet transaction <https://xrpl.org/accountset.html>`_,
@@ -17,7 +17,7 @@ from xrpl.models.transactions.types import TransactionType
 _MAX_AUTH_ACCOUNTS: Final[int] = 4
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMBid(Transaction):
     """
     Bid on an Automated Market Maker's (AMM's) auction slot.
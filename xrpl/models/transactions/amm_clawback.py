@@ -38,7 +38,7 @@ class AMMClawbackFlagInterface(TransactionFlagInterface):
     TF_CLAW_TWO_ASSETS: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMClawback(Transaction):
     """
     Claw back tokens from a holder who has deposited your issued tokens into an AMM
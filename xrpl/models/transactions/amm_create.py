@@ -15,7 +15,7 @@ from xrpl.models.transactions.types import TransactionType
 AMM_MAX_TRADING_FEE: Final[int] = 1000
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMCreate(Transaction):
     """
     Create a new Automated Market Maker (AMM) instance for trading a pair of
@@ -10,7 +10,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMDelete(Transaction):
     """
     Delete an empty Automated Market Maker (AMM) instance that could not be fully
@@ -43,7 +43,7 @@ class AMMDepositFlagInterface(TransactionFlagInterface):
     TF_TWO_ASSET_IF_EMPTY: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMDeposit(Transaction):
     """
     Deposit funds into an Automated Market Maker (AMM) instance
@@ -14,7 +14,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMVote(Transaction):
     """
     Vote on the trading fee for an Automated Market Maker (AMM) instance.
@@ -45,7 +45,7 @@ class AMMWithdrawFlagInterface(TransactionFlagInterface):
     TF_LIMIT_LP_TOKEN: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AMMWithdraw(Transaction):
     """
     Withdraw assets from an Automated Market Maker (AMM) instance by returning the
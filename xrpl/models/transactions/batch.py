@@ -48,7 +48,7 @@ class BatchFlagInterface(TransactionFlagInterface):
     TF_INDEPENDENT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class BatchSigner(NestedModel):
     """Represents a Batch signer."""
 
@@ -61,7 +61,7 @@ class BatchSigner(NestedModel):
     signers: Optional[List[Signer]] = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Batch(Transaction):
     """Represents a Batch transaction."""
 
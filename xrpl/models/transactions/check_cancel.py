@@ -7,7 +7,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CheckCancel(Transaction):
     """
     Represents a `CheckCancel <https://xrpl.org/checkcancel.html>`_ transaction,
@@ -13,7 +13,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CheckCash(Transaction):
     """
     Represents a `CheckCash transaction <https://xrpl.org/checkcash.html>`_,
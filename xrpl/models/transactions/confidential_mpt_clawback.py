@@ -18,7 +18,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ConfidentialMPTClawback(Transaction):
     """
     Represents a ConfidentialMPTClawback transaction.
@@ -40,7 +40,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 # pylint: disable=too-many-instance-attributes
 class ConfidentialMPTConvert(Transaction):
     """
@@ -21,7 +21,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 # pylint: disable=too-many-instance-attributes
 class ConfidentialMPTConvertBack(Transaction):
     """
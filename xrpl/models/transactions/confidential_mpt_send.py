@@ -20,7 +20,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import validate_credential_ids
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 # pylint: disable=too-many-instance-attributes
 class ConfidentialMPTSend(Transaction):
     """
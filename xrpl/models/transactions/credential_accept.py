@@ -11,7 +11,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import get_credential_type_error
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CredentialAccept(Transaction):
     """This transaction accepts a credential issued to the Account (i.e. the Account is
     the Subject of the Credential object). The credential is not considered valid until
@@ -13,7 +13,7 @@ from xrpl.models.utils import HEX_REGEX, get_credential_type_error
 _MAX_URI_LENGTH = 256
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CredentialCreate(Transaction):
     """This transaction creates a Credential object. It must be sent by the issuer."""
 
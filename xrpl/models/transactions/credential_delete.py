@@ -11,7 +11,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import get_credential_type_error
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CredentialDelete(Transaction):
     """This transaction deletes a Credential object."""
 
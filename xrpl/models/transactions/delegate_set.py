@@ -69,7 +69,7 @@ class GranularPermission(str, Enum):
     """Use the MPTIssuanceSet transaction to unlock (unfreeze) a holder."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Permission(NestedModel):
     """Represents one entry in a Permissions list used in DelegateSet
     transaction.
@@ -83,7 +83,7 @@ class Permission(NestedModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DelegateSet(Transaction):
     """DelegateSet allows an account to delegate a set of permissions to another
     account.
@@ -14,7 +14,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import MAX_CREDENTIAL_ARRAY_LENGTH
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DepositPreauth(Transaction):
     """
     Represents a `DepositPreauth <https://xrpl.org/depositpreauth.html>`_
@@ -114,7 +114,7 @@ class DepositPreauth(Transaction):
         return errors
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Credential(NestedModel):
     """
     An inner object representing individual element inside AuthorizeCredentials and
@@ -12,7 +12,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import HEX_REGEX
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DIDSet(Transaction):
     """Represents a DIDSet transaction."""
 
@@ -13,7 +13,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EscrowCreate(Transaction):
     """
     Represents an `EscrowCreate <https://xrpl.org/escrowcreate.html>`_
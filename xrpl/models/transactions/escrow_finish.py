@@ -13,7 +13,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.utils import validate_credential_ids
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EscrowFinish(Transaction):
     """
     Represents an `EscrowFinish <https://xrpl.org/escrowfinish.html>`_
@@ -17,7 +17,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanBrokerCoverClawback(Transaction):
     """This transaction claws back First-Loss Capital from a Loan Broker"""
 
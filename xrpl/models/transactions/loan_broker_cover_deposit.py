@@ -10,7 +10,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanBrokerCoverDeposit(Transaction):
     """This transaction deposits First-Loss Capital into a Loan Broker"""
 
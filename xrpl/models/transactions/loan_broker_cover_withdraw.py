@@ -11,7 +11,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanBrokerCoverWithdraw(Transaction):
     """This transaction withdraws First-Loss Capital from a Loan Broker"""
 
@@ -9,7 +9,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanBrokerDelete(Transaction):
     """This transaction deletes a Loan Broker"""
 
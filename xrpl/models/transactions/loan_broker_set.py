@@ -13,7 +13,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanBrokerSet(Transaction):
     """This transaction creates and updates a Loan Broker"""
 
@@ -45,7 +45,7 @@ class LoanManageFlagInterface(TransactionFlagInterface):
     TF_LOAN_UNIMPAIR: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanManage(Transaction):
     """The transaction updates an existing Loan object."""
 
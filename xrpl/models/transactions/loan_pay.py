@@ -48,7 +48,7 @@ class LoanPayFlagInterface(TransactionFlagInterface):
     TF_LOAN_LATE_PAYMENT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanPay(Transaction):
     """The Borrower submits a LoanPay transaction to make a Payment on the Loan."""
 
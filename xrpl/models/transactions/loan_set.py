@@ -19,7 +19,7 @@ from xrpl.models.transactions.transaction import (
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CounterpartySignature(BaseModel):
     """
     Signature payload supplied by the counterparty.
@@ -59,7 +59,7 @@ class LoanSetFlagInterface(TransactionFlagInterface):
     TF_LOAN_OVER_PAYMENT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LoanSet(Transaction):
     """This transaction creates a Loan"""
 
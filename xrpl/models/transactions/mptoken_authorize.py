@@ -39,7 +39,7 @@ class MPTokenAuthorizeFlagInterface(TransactionFlagInterface):
     TF_MPT_UNAUTHORIZE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTokenAuthorize(Transaction):
     """
     The MPTokenAuthorize transaction is used to globally lock/unlock a MPTokenIssuance,
@@ -98,7 +98,7 @@ class MPTokenIssuanceCreateFlagInterface(TransactionFlagInterface):
     TF_MPT_CAN_HOLD_CONFIDENTIAL_BALANCE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTokenIssuanceCreate(Transaction):
     """
     The MPTokenIssuanceCreate transaction creates a MPTokenIssuance object
@@ -9,7 +9,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTokenIssuanceDestroy(Transaction):
     """
     The MPTokenIssuanceDestroy transaction is used to remove an MPTokenIssuance object
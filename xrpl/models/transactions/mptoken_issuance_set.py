@@ -119,7 +119,7 @@ class MPTokenIssuanceSetFlagInterface(TransactionFlagInterface):
     TF_MPT_SET_CAN_HOLD_CONFIDENTIAL_BALANCE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MPTokenIssuanceSet(Transaction):
     """
     The MPTokenIssuanceSet transaction is used to globally lock/unlock a
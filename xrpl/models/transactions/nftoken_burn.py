@@ -8,7 +8,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTokenBurn(Transaction):
     """
     The NFTokenBurn transaction is used to remove an NFToken object from the
@@ -12,7 +12,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTokenCancelOffer(Transaction):
     """
     The NFTokenCancelOffer transaction deletes existing NFTokenOffer objects.
@@ -30,7 +30,7 @@ class NFTokenCreateOfferFlagInterface(TransactionFlagInterface):
     TF_SELL_NFTOKEN: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTokenCreateOffer(Transaction):
     """
     The NFTokenCreateOffer transaction creates either an offer to buy an
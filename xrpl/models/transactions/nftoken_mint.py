@@ -62,7 +62,7 @@ class NFTokenMintFlagInterface(TransactionFlagInterface):
     TF_MUTABLE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTokenMint(Transaction):
     """
     The NFTokenMint transaction creates an NFToken object and adds it to the
@@ -15,7 +15,7 @@ from xrpl.models.utils import HEX_REGEX
 _MAX_URI_LENGTH: Final[int] = 512
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NFTokenModify(Transaction):
     """
     The NFTokenModify transaction modifies an NFToken's URI
@@ -7,7 +7,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OfferCancel(Transaction):
     """
     Represents an `OfferCancel <https://xrpl.org/offercancel.html>`_ transaction,
@@ -77,7 +77,7 @@ class OfferCreateFlagInterface(TransactionFlagInterface):
     TF_HYBRID: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OfferCreate(Transaction):
     """
     Represents an `OfferCreate <https://xrpl.org/offercreate.html>`_ transaction,
@@ -25,7 +25,7 @@ EPOCH_OFFSET = int(
 )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OracleSet(Transaction):
     """Creates a new Oracle ledger entry or updates the fields of an existing one,
     using the Oracle ID.
@@ -150,7 +150,7 @@ class OracleSet(Transaction):
         return errors
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PriceData(NestedModel):
     """Represents one PriceData element. It is used in OracleSet transaction"""
 
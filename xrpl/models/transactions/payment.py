@@ -66,7 +66,7 @@ class PaymentFlagInterface(TransactionFlagInterface):
     TF_SPONSOR_CREATED_ACCOUNT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Payment(Transaction):
     """
     Represents a Payment <https://xrpl.org/payment.html>`_ transaction, which
@@ -56,7 +56,7 @@ class PaymentChannelClaimFlagInterface(TransactionFlagInterface):
     TF_CLOSE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PaymentChannelClaim(Transaction):
     """
     Represents a `PaymentChannelClaim <https://xrpl.org/paymentchannelclaim.html>`_
@@ -8,7 +8,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PaymentChannelFund(Transaction):
     """
     Represents a `PaymentChannelFund <https://xrpl.org/paymentchannelfund.html>`_
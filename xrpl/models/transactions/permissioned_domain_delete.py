@@ -14,7 +14,7 @@ _DOMAIN_ID_REGEX: Final[Pattern[str]] = re.compile("[A-F0-9]{64}")
 DOMAIN_ID_LENGTH: Final[int] = 64
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PermissionedDomainDelete(Transaction):
     """This transaction deletes a PermissionedDomain object."""
 
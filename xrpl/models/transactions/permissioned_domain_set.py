@@ -13,7 +13,7 @@ from xrpl.models.transactions.types import TransactionType
 _MAX_ACCEPTED_CREDENTIALS_LENGTH = 10
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PermissionedDomainSet(Transaction):
     """This transaction creates or modifies a PermissionedDomain object."""
 
@@ -3,13 +3,33 @@ Model objects for specific `types of Pseudo-Transactions
 <https://xrpl.org/pseudo-transaction-types.html>`_ in the XRP Ledger.
 """
 
-from xrpl.models.transactions.pseudo_transactions.enable_amendment import (
-    EnableAmendment,
-    EnableAmendmentFlag,
-    EnableAmendmentFlagInterface,
-)
-from xrpl.models.transactions.pseudo_transactions.set_fee import SetFee
-from xrpl.models.transactions.pseudo_transactions.unl_modify import UNLModify
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
+
+if TYPE_CHECKING:
+    from xrpl.models.transactions.pseudo_transactions.enable_amendment import (
+        EnableAmendment,
+        EnableAmendmentFlag,
+        EnableAmendmentFlagInterface,
+    )
+    from xrpl.models.transactions.pseudo_transactions.set_fee import SetFee
+    from xrpl.models.transactions.pseudo_transactions.unl_modify import UNLModify
+else:
+    # the models are imported when they are first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodules=["pseudo_transaction"],
+        submodule_attributes={
+            "enable_amendment": [
+                "EnableAmendment",
+                "EnableAmendmentFlag",
+                "EnableAmendmentFlagInterface",
+            ],
+            "set_fee": ["SetFee"],
+            "unl_modify": ["UNLModify"],
+        },
+    )
 
 __all__ = [
     "EnableAmendment",
@@ -53,7 +53,7 @@ class EnableAmendmentFlagInterface(TransactionFlagInterface):
     TF_LOST_MAJORITY: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnableAmendment(PseudoTransaction):
     """
     An EnableAmendment pseudo-transaction marks a change in status of an amendment to
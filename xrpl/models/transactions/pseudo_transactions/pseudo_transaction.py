@@ -9,7 +9,7 @@ from xrpl.models.transactions.types import PseudoTransactionType
 _ACCOUNT_ZERO = "rrrrrrrrrrrrrrrrrrrrrhoLvTp"  # base58 encoding of the value `0`
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PseudoTransaction(Transaction):
     """
     Pseudo-transactions are never submitted by users, nor propagated through the
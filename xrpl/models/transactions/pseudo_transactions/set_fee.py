@@ -11,7 +11,7 @@ from xrpl.models.transactions.pseudo_transactions.pseudo_transaction import (
 from xrpl.models.transactions.types import PseudoTransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SetFee(PseudoTransaction):
     """
     A SetFee pseudo-transaction marks a change in `transaction cost
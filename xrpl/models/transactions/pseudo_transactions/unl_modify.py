@@ -14,7 +14,7 @@ from xrpl.models.transactions.pseudo_transactions.pseudo_transaction import (
 from xrpl.models.transactions.types import PseudoTransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UNLModify(PseudoTransaction):
     """
     A UNLModify pseudo-transaction marks a change to the `Negative UNL
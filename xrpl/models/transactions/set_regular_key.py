@@ -7,7 +7,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SetRegularKey(Transaction):
     """
     Represents a `SetRegularKey <https://xrpl.org/setregularkey.html>`_
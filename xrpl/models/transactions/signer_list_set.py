@@ -28,7 +28,7 @@ Matches hex-encoded WalletLocator in the format allowed by XRPL.
 """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SignerEntry(NestedModel):
     """Represents one entry in a list of multi-signers authorized to an account."""
 
@@ -54,7 +54,7 @@ class SignerEntry(NestedModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SignerListSet(Transaction):
     """
     Represents a `SignerListSet <https://xrpl.org/signerlistset.html>`_
@@ -50,7 +50,7 @@ class SponsorshipSetFlagInterface(TransactionFlagInterface):
     TF_DELETE_OBJECT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SponsorshipSet(Transaction):
     """
     Represents a SponsorshipSet transaction, which creates or modifies
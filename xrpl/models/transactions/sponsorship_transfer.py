@@ -45,7 +45,7 @@ class SponsorshipTransferFlagInterface(TransactionFlagInterface):
     TF_SPONSORSHIP_REASSIGN: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SponsorshipTransfer(Transaction):
     """
     Represents a SponsorshipTransfer transaction, which transfers
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from hashlib import sha512
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Final, Self
 
 from xrpl.core.binarycodec import decode, encode
+from xrpl.core.binarycodec.definitions import FieldInstance, get_field_instance
 from xrpl.models.amounts import IssuedCurrencyAmount
 from xrpl.models.amounts.mpt_amount import MPTAmount
-from xrpl.models.base_model import ABBREVIATIONS, BaseModel
+from xrpl.models.base_model import (
+    BaseModel,
+    _compile_field_values,
+    _get_model_metadata,
+    _get_origin_and_args,
+    _key_to_tx_json,
+    _may_hold_container,
+)
 from xrpl.models.exceptions import XRPLModelException
 from xrpl.models.flags import (
     FlagInterface,
@@ -31,6 +51,16 @@ _SPF_SPONSOR_FEE: Final[int] = 0x00000001
 _SPF_SPONSOR_RESERVE: Final[int] = 0x00000002
 _SPF_SPONSOR_FLAG_MASK: Final[int] = ~(_SPF_SPONSOR_FEE | _SPF_SPONSOR_RESERVE)
 
+# transaction classes by transaction type, added as each type is first used so that
+# only the models that are needed get imported
+_TRANSACTION_TYPES: Final[Dict[str, Type[Transaction]]] = {}
+_TRANSACTION_TYPE_VALUES: Final[FrozenSet[str]] = frozenset(
+    transaction_type.value for transaction_type in TransactionType
+)
+_PSEUDO_TRANSACTION_TYPE_VALUES: Final[FrozenSet[str]] = frozenset(
+    transaction_type.value for transaction_type in PseudoTransactionType
+)
+
 
 def transaction_json_to_binary_codec_form(
     dictionary: Dict[str, XRPL_VALUE_TYPE],
@@ -52,20 +82,36 @@ def transaction_json_to_binary_codec_form(
     }
 
 
-def _key_to_tx_json(key: str) -> str:
-    """
-    Transforms snake_case to PascalCase. For example:
-        1. 'transaction_type' becomes 'TransactionType'
-        2. 'URI' becomes 'uri'
+# Transaction class -> (snake_case key, PascalCase key, FieldInstance) for each of its
+# fields, in canonical field order
+_CODEC_FIELDS: Dict[type, Tuple[Tuple[str, str, Optional[FieldInstance]], ...]] = {}
 
-    Known abbreviations (example 2 above) need to be enumerated in ABBREVIATIONS.
-    """
-    return "".join(
-        [
-            ABBREVIATIONS[word] if word in ABBREVIATIONS else word.capitalize()
-            for word in key.split("_")
-        ]
-    )
+
+def _get_codec_fields(
+    cls: type,
+) -> Tuple[Tuple[str, str, Optional[FieldInstance]], ...]:
+    codec_fields = _CODEC_FIELDS.get(cls)
+    if codec_fields is None:
+        entries = []
+        for model_field in fields(cls):
+            tx_json_key = _key_to_tx_json(model_field.name)
+            try:
+                field_instance: Optional[FieldInstance] = get_field_instance(
+                    tx_json_key
+                )
+            except KeyError:
+                # left for the binary codec to reject, after all known fields
+                field_instance = None
+            entries.append((model_field.name, tx_json_key, field_instance))
+        entries.sort(
+            key=lambda entry: (
+                entry[2] is None,
+                entry[2].ordinal if entry[2] is not None else 0,
+            )
+        )
+        codec_fields = tuple(entries)
+        _CODEC_FIELDS[cls] = codec_fields
+    return codec_fields
 
 
 def _value_to_tx_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
@@ -84,7 +130,98 @@ def _value_to_tx_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
     return value
 
 
-@dataclass(frozen=True, kw_only=True)
+def _copy_tx_json(value: XRPL_VALUE_TYPE) -> XRPL_VALUE_TYPE:
+    # copies the dictionaries and lists of a JSON-like value, leaving the callers of
+    # to_xrpl free to change the result
+    if isinstance(value, dict):
+        return {key: _copy_tx_json(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, list):
+        return [_copy_tx_json(sub_value) for sub_value in value]
+    return value
+
+
+_T = TypeVar("_T")
+
+
+# Class -> a function returning the values of the fields of its instances that may
+# hold a list or a dictionary, directly or in a nested model, or None if there are
+# none. Models are frozen, so only the contents of these fields can change.
+_MUTABLE_FIELDS: Dict[type, Optional[Callable[[Any], Tuple[Any, ...]]]] = {}
+
+
+def _get_mutable_fields(cls: type) -> Optional[Callable[[Any], Tuple[Any, ...]]]:
+    try:
+        return _MUTABLE_FIELDS[cls]
+    except KeyError:
+        pass
+    _MUTABLE_FIELDS[cls] = None  # in case a field's type refers back to cls
+    if issubclass(cls, BaseModel):
+        metadata = _get_model_metadata(cls)
+        mutable_fields = tuple(
+            field
+            for field in metadata.dict_fields
+            if _may_hold_mutable(metadata.type_hints[field])
+        )
+        if mutable_fields:
+            _MUTABLE_FIELDS[cls] = _compile_field_values(mutable_fields)
+    return _MUTABLE_FIELDS[cls]
+
+
+def _may_hold_mutable(param_type: Any) -> bool:  # noqa: ANN401
+    if _may_hold_container(param_type):
+        return True
+    param_type_origin, param_type_args = _get_origin_and_args(param_type)
+    options = param_type_args if param_type_origin is Union else (param_type,)
+    return any(
+        isinstance(option, type) and _get_mutable_fields(option) is not None
+        for option in options
+    )
+
+
+# returns a copy of the contents of the lists and dictionaries in a value, which is
+# equal to a later copy exactly when they have not been changed in the meantime
+def _mutable_state(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, list):
+        return tuple([_mutable_state(item) for item in value])
+    if isinstance(value, dict):
+        return tuple([(key, _mutable_state(item)) for key, item in value.items()])
+    mutable_fields = _get_mutable_fields(value.__class__)
+    if mutable_fields is None:
+        return value
+    return value, tuple([_mutable_state(item) for item in mutable_fields(value)])
+
+
+class _CachedModel(BaseModel):
+    """
+    A model that keeps the values derived from its fields once they are computed.
+
+    The model is frozen, but the lists and dictionaries in its fields are not, so
+    the kept values are only used while those still hold what they held when the
+    values were computed. Otherwise they are computed again.
+    """
+
+    # not a dataclass field, so it is left out of to_dict, ==, hash, repr and pickling
+    __slots__ = ("_cache",)
+    _cache: Dict[str, Any]
+
+    def _cached(self: Self, name: str, compute: Callable[[], _T]) -> _T:
+        state = _mutable_state(self)
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = None
+        if cache is None or cache["state"] != state:
+            # the state of the lists and dictionaries the values are computed from
+            cache = {"state": state}
+            object.__setattr__(self, "_cache", cache)
+        try:
+            return cast(_T, cache[name])
+        except KeyError:
+            value = cache[name] = compute()
+            return value
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Memo(NestedModel):
     """
     An arbitrary piece of data attached to a transaction. A transaction can
@@ -128,7 +265,7 @@ class Memo(NestedModel):
         return errors
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Signer(NestedModel):
     """
     One Signer in a multi-signature. A multi-signed transaction can have an
@@ -162,7 +299,7 @@ class Signer(NestedModel):
     """
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class SponsorSignature(BaseModel):
     """
     The sponsor's signing information for a fee-/reserve-sponsored transaction.
@@ -261,8 +398,8 @@ class SponsorFlag(int, Enum):
     """The sponsor covers the reserve of any object the transaction creates."""
 
 
-@dataclass(frozen=True, kw_only=True)
-class Transaction(BaseModel):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Transaction(_CachedModel):
     """
     The base class for all `transaction types
     <https://xrpl.org/transaction-types.html>`_. Represents `fields common to all
@@ -485,39 +622,72 @@ class Transaction(BaseModel):
         return accumulator
 
     def _flags_to_int(self: Self) -> int | None:
-        if self.flags is None:
-            return None
-        if isinstance(self.flags, int):
-            return self.flags
-        check_false_flag_definition(tx_type=self.transaction_type, tx_flags=self.flags)
-        if isinstance(self.flags, dict):
+        flags = self.flags
+        if flags is None or isinstance(flags, int):
+            return flags
+        return self._cached("flags", lambda: self._flag_list_to_int(flags))
+
+    def _flag_list_to_int(self: Self, flags: Union[Dict[str, bool], List[int]]) -> int:
+        check_false_flag_definition(tx_type=self.transaction_type, tx_flags=flags)
+        if isinstance(flags, dict):
             return self._iter_to_int(
                 lst=interface_to_flag_list(
                     tx_type=self.transaction_type,
-                    tx_flags=self.flags,
+                    tx_flags=flags,
                 )
             )
 
-        return self._iter_to_int(lst=self.flags)
+        return self._iter_to_int(lst=flags)
 
     def to_xrpl(self: Self) -> Dict[str, Any]:
         """
         Creates a JSON-like dictionary in the JSON format used by the binary codec
         based on the Transaction object.
 
+        The dictionary is built once per transaction, and again only if the lists
+        or dictionaries in its fields are changed in place; each call returns a new
+        copy of it.
+
         Returns:
-            A JSON-like dictionary in the JSON format used by the binary codec.
+            A JSON-like dictionary in the JSON format used by the binary codec,
+            with its fields in canonical order.
         """
-        return transaction_json_to_binary_codec_form(self.to_dict())
+        tx_json = self._cached("tx_json", self._build_tx_json)
+        return cast(Dict[str, Any], _copy_tx_json(tx_json))
+
+    def _build_tx_json(self: Self) -> Dict[str, Any]:
+        if type(self).to_dict is not Transaction.to_dict:
+            # a subclass reshapes its dictionary, so the field map does not apply
+            return transaction_json_to_binary_codec_form(self.to_dict())
+
+        tx_json: Dict[str, Any] = {}
+        for key, tx_json_key, _ in _get_codec_fields(type(self)):
+            if key == "flags":
+                value = self._flags_to_int()
+            elif key == "transaction_type":
+                value = self.transaction_type.value
+            else:
+                value = getattr(self, key)
+            if value is None:
+                continue
+            if isinstance(value, (IssuedCurrencyAmount, MPTAmount)):
+                # already known to be an amount, so its dict needs no inspection
+                tx_json[tx_json_key] = value.to_dict()
+            else:
+                tx_json[tx_json_key] = _value_to_tx_json(self._to_dict_elem(value))
+        return tx_json
 
     def blob(self: Self) -> str:
         """
         Creates the canonical binary format of the Transaction object.
 
+        The encoding is computed once per transaction, and again only if the lists
+        or dictionaries in its fields are changed in place.
+
         Returns:
             The binary-encoded object, as a hexadecimal string.
         """
-        return encode(self.to_xrpl())
+        return self._cached("blob", lambda: encode(self.to_xrpl()))
 
     @classmethod
     def from_dict(cls: Type[Self], value: Dict[str, Any]) -> Self:
@@ -602,7 +772,8 @@ class Transaction(BaseModel):
     def get_hash(self: Self) -> str:
         """
         Hashes the Transaction object as the ledger does. Only valid for signed
-        Transaction objects.
+        Transaction objects. The hash is computed once per transaction, and again
+        only if the lists or dictionaries in its fields are changed in place.
 
         Returns:
             The hash of the Transaction object.
@@ -618,8 +789,11 @@ class Transaction(BaseModel):
             raise XRPLModelException(
                 "Cannot get the hash from an unsigned Transaction."
             )
+        return self._cached("hash", self._compute_hash)
+
+    def _compute_hash(self: Self) -> str:
         prefix = hex(_TRANSACTION_HASH_PREFIX)[2:].upper()
-        encoded_str = bytes.fromhex(prefix + encode(self.to_xrpl()))
+        encoded_str = bytes.fromhex(prefix + self.blob())
         return sha512(encoded_str).digest().hex().upper()[:64]
 
     @classmethod
@@ -638,24 +812,11 @@ class Transaction(BaseModel):
         Raises:
             XRPLModelException: If `transaction_type` is not a valid Transaction type.
         """
-        import xrpl.models.transactions as transaction_models
-        import xrpl.models.transactions.pseudo_transactions as pseudo_transaction_models
-
-        transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(transaction_models, t)
-            for t in transaction_models.types.TransactionType
-        }
-        if transaction_type in transaction_types:
-            return transaction_types[transaction_type]
-
-        pseudo_transaction_types: Dict[str, Type[Transaction]] = {
-            t.value: getattr(pseudo_transaction_models, t)
-            for t in transaction_models.types.PseudoTransactionType
-        }
-        if transaction_type in pseudo_transaction_types:
-            return pseudo_transaction_types[transaction_type]
-
-        raise XRPLModelException(f"{transaction_type} is not a valid Transaction type")
+        transaction_class = _TRANSACTION_TYPES.get(transaction_type)
+        if transaction_class is None:
+            transaction_class = _load_transaction_type(transaction_type)
+            _TRANSACTION_TYPES[transaction_type] = transaction_class
+        return transaction_class
 
     @staticmethod
     def from_blob(tx_blob: str) -> Transaction:
@@ -710,3 +871,16 @@ class Transaction(BaseModel):
             del processed_value["deliver_max"]
 
         return cls.from_dict(processed_value)
+
+
+def _load_transaction_type(transaction_type: str) -> Type[Transaction]:
+    import xrpl.models.transactions as transaction_models
+    import xrpl.models.transactions.pseudo_transactions as pseudo_transaction_models
+
+    if transaction_type in _TRANSACTION_TYPE_VALUES:
+        return cast(Type[Transaction], getattr(transaction_models, transaction_type))
+    if transaction_type in _PSEUDO_TRANSACTION_TYPE_VALUES:
+        return cast(
+            Type[Transaction], getattr(pseudo_transaction_models, transaction_type)
+        )
+    raise XRPLModelException(f"{transaction_type} is not a valid Transaction type")
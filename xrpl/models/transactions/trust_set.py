@@ -71,7 +71,7 @@ class TrustSetFlagInterface(TransactionFlagInterface):
     TF_CLEAR_DEEP_FREEZE: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TrustSet(Transaction):
     """
     Represents a TrustSet transaction on the XRP Ledger.
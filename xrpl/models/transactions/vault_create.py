@@ -57,7 +57,7 @@ class WithdrawalPolicy(int, Enum):
     """Requests are processed on a first-come-first-serve basis."""
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultCreate(Transaction):
     """The VaultCreate transaction creates a new Vault object."""
 
@@ -12,7 +12,7 @@ from xrpl.models.transactions.types import TransactionType
 _MAX_VAULT_ID_LENGTH = 64
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultDelete(Transaction):
     """The VaultDelete transaction deletes an existing vault object."""
 
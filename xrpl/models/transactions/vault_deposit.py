@@ -8,7 +8,7 @@ from xrpl.models.transactions.transaction import Transaction
 from xrpl.models.transactions.types import TransactionType
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultDeposit(Transaction):
     """The VaultDeposit transaction adds Liqudity in exchange for vault shares."""
 
@@ -15,7 +15,7 @@ from xrpl.models.transactions.vault_create import (
 from xrpl.models.transactions.vault_delete import _MAX_VAULT_ID_LENGTH
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultSet(Transaction):
     """The VaultSet updates an existing Vault ledger object."""
 
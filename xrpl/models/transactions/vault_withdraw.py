@@ -12,7 +12,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.transactions.vault_delete import _MAX_VAULT_ID_LENGTH
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VaultWithdraw(Transaction):
     """The VaultWithdraw transaction withdraws assets in exchange for the vault's
     shares.
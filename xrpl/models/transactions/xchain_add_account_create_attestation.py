@@ -14,7 +14,7 @@ from xrpl.models.transactions.types import TransactionType
 from xrpl.models.xchain_bridge import XChainBridge
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XChainAddAccountCreateAttestation(Transaction):
     """
     Represents a XChainAddAccountCreateAttestation transaction.
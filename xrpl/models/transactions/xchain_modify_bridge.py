@@ -33,7 +33,7 @@ class XChainModifyBridgeFlagInterface(TransactionFlagInterface):
     TF_CLEAR_ACCOUNT_CREATE_AMOUNT: bool
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XChainModifyBridge(Transaction):
     """
     Represents a XChainModifyBridge transaction.
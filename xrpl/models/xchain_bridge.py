@@ -8,7 +8,7 @@ from xrpl.models.base_model import BaseModel
 from xrpl.models.currencies import Currency
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class XChainBridge(BaseModel):
     """A XChainBridge represents a cross-chain bridge."""
 
@@ -18,12 +18,14 @@ from xrpl.transaction.main import (
     autofill_and_sign,
     sign,
     sign_and_submit,
+    sign_many,
     simulate,
     submit,
 )
 from xrpl.transaction.multisign import multisign
 from xrpl.transaction.reliable_submission import submit_and_wait
 from xrpl.transaction.sponsor_signer import combine_sponsor_signers, sign_as_sponsor
+from xrpl.transaction.verify_signatures import verify_transaction_signatures
 
 __all__ = [
     "autofill",
@@ -37,10 +39,12 @@ __all__ = [
     "sign_and_submit",
     "sign_as_sponsor",
     "sign_loan_set_by_counterparty",
+    "sign_many",
     "sign_multiaccount_batch",
     "simulate",
     "submit",
     "submit_and_wait",
     "transaction_json_to_binary_codec_form",
+    "verify_transaction_signatures",
     "XRPLReliableSubmissionException",
 ]
@@ -84,6 +84,7 @@ def submit(
 
 
 sign = main.sign
+sign_many = main.sign_many
 
 
 def autofill_and_sign(
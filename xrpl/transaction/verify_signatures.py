@@ -0,0 +1,184 @@
+"""Helper function for verifying the signatures on a signed transaction blob."""
+
+from hashlib import sha512
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from typing_extensions import Final
+
+from xrpl.core.binarycodec import encode_for_signing_batch, read_field, scan_fields
+from xrpl.core.binarycodec.definitions import definitions
+from xrpl.core.binarycodec.field_scanner import get_field_ordinal
+from xrpl.core.binarycodec.main import (
+    _TRANSACTION_MULTISIG_PREFIX,
+    _TRANSACTION_SIGNATURE_PREFIX,
+    BatchSigningDict,
+)
+from xrpl.core.binarycodec.types import AccountID
+from xrpl.core.keypairs import verify_many
+from xrpl.models.transactions.transaction import _TRANSACTION_HASH_PREFIX
+
+_HASH_PREFIX: Final[bytes] = _TRANSACTION_HASH_PREFIX.to_bytes(4, "big")
+
+# Ordinals of the fields left out of signing payloads (TxnSignature, Signers, ...).
+_NON_SIGNING_ORDINALS: Final[FrozenSet[int]] = frozenset(
+    definitions._TYPE_ORDINAL_MAP[info.type] << 16 | info.nth
+    for info in definitions._FIELD_INFO_MAP.values()
+    if not info.is_signing_field
+    and info.type in definitions._TYPE_ORDINAL_MAP
+    and info.nth > 0
+)
+
+_Fields = List[Tuple[int, int, int]]
+_Reader = Callable[[str], Any]
+# (signing payload, signature, public key), as taken by keypairs.verify_many
+_Item = Tuple[bytes, bytes, str]
+
+
+def verify_transaction_signatures(tx_blob: str) -> bool:
+    """
+    Verifies every signature on a signed transaction: the single signature, each
+    multi-signature in ``Signers``, and each signature in ``BatchSigners``.
+
+    The blob is scanned once, the signing fields are serialized once for all of the
+    signatures over them, and all of the signatures are verified together with
+    :func:`xrpl.core.keypairs.verify_many`.
+
+    This only checks the cryptography: it does not check that the keys are allowed
+    to sign for their accounts, which depends on the state of the ledger (regular
+    keys and signer lists).
+
+    Args:
+        tx_blob: The signed transaction, as hexadecimal.
+
+    Returns:
+        Whether the transaction has at least one signature, and all of its
+        signatures are valid.
+    """
+    blob = bytes.fromhex(tx_blob)
+    fields = scan_fields(blob)
+    read = _make_reader(blob, fields)
+    signing_body = _get_signing_body(blob, fields)
+
+    items: List[_Item] = []
+    signature = read("TxnSignature")
+    if signature is not None:
+        items.append(
+            (
+                _TRANSACTION_SIGNATURE_PREFIX + signing_body,
+                bytes.fromhex(signature),
+                read("SigningPubKey") or "",
+            )
+        )
+    signers = read("Signers")
+    if signers:
+        multisig_payload = _TRANSACTION_MULTISIG_PREFIX + signing_body
+        for signer in signers:
+            items.append(_get_multisigner_item(multisig_payload, signer["Signer"]))
+    batch_signers = read("BatchSigners")
+    if batch_signers:
+        items.extend(_get_batch_signer_items(blob, fields, read, batch_signers))
+
+    return len(items) > 0 and all(verify_many(items))
+
+
+def _make_reader(blob: bytes, fields: _Fields) -> _Reader:
+    """Return a function decoding one top-level field by name, or None if absent."""
+    positions = {ordinal: (offset, length) for ordinal, offset, length in fields}
+
+    def read(field_name: str) -> Any:  # noqa: ANN401
+        position = positions.get(get_field_ordinal(field_name))
+        if position is None:
+            return None
+        return read_field(blob, *position, field_name)
+
+    return read
+
+
+def _get_signing_body(blob: bytes, fields: _Fields) -> bytes:
+    """
+    Return the serialized signing fields of a transaction, without decoding and
+    re-encoding them. Each field spans from the end of the previous field to the
+    end of its value, header and length prefix included.
+    """
+    parts = []
+    start = 0
+    for ordinal, offset, length in fields:
+        end = offset + length
+        if ordinal not in _NON_SIGNING_ORDINALS:
+            parts.append(blob[start:end])
+        start = end
+    return b"".join(parts)
+
+
+def _get_multisigner_item(payload: bytes, signer: Dict[str, Any]) -> _Item:
+    """Return the item for a signer whose account is appended to ``payload``."""
+    return (
+        payload + bytes(AccountID.from_value(signer["Account"])),
+        bytes.fromhex(signer["TxnSignature"]),
+        signer["SigningPubKey"],
+    )
+
+
+def _get_inner_transaction_ids(blob: bytes, fields: _Fields) -> List[str]:
+    """Hash the inner transactions of a Batch straight from their serialized form."""
+    raw_transactions = get_field_ordinal("RawTransactions")
+    position = next(
+        (
+            (offset, length)
+            for ordinal, offset, length in fields
+            if ordinal == raw_transactions
+        ),
+        None,
+    )
+    if position is None:
+        return []
+    offset, length = position
+    # the array value ends with the array end marker, and each RawTransaction
+    # value with the object end marker
+    array = blob[offset : offset + length - 1]
+    return [
+        sha512(_HASH_PREFIX + array[inner : inner + inner_length - 1])
+        .digest()[:32]
+        .hex()
+        .upper()
+        for _, inner, inner_length in scan_fields(array)
+    ]
+
+
+def _get_batch_signer_items(
+    blob: bytes,
+    fields: _Fields,
+    read: _Reader,
+    batch_signers: List[Dict[str, Any]],
+) -> List[_Item]:
+    # the sequence value is the Sequence when non-zero, otherwise the
+    # TicketSequence (see xrpl.transaction.batch_signers._get_batch_seq_value)
+    sequence: Optional[int] = read("Sequence")
+    batch_fields: BatchSigningDict = {
+        "account": read("Account"),
+        "sequence": sequence or read("TicketSequence") or 0,
+        "flags": read("Flags") or 0,
+        "transaction_ids": _get_inner_transaction_ids(blob, fields),
+        "batch_account": "",
+    }
+
+    items: List[_Item] = []
+    for entry in batch_signers:
+        batch_signer = entry["BatchSigner"]
+        batch_fields["batch_account"] = batch_signer["Account"]
+        payload = bytes.fromhex(encode_for_signing_batch(batch_fields))
+        signers = batch_signer.get("Signers")
+        if signers is None:
+            items.append(
+                (
+                    payload,
+                    bytes.fromhex(batch_signer.get("TxnSignature", "")),
+                    batch_signer.get("SigningPubKey", ""),
+                )
+            )
+        else:
+            # a multi-signed BatchSigner binds each signer's account after the
+            # batch account, like a multi-signature
+            for signer in signers:
+                items.append(_get_multisigner_item(payload, signer["Signer"]))
+    return items
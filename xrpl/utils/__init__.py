@@ -2,6 +2,11 @@
 
 from xrpl.utils.get_nftoken_id import get_nftoken_id
 from xrpl.utils.get_xchain_claim_id import get_xchain_claim_id
+from xrpl.utils.ledger_data_archive import (
+    LedgerDataArchive,
+    LedgerDataArchiveWriter,
+    XRPLLedgerDataArchiveException,
+)
 from xrpl.utils.mptoken_metadata import (
     decode_mptoken_metadata,
     encode_mptoken_metadata,
@@ -43,4 +48,7 @@ __all__ = [
     "decode_mptoken_metadata",
     "encode_mptoken_metadata",
     "validate_mptoken_metadata",
+    "LedgerDataArchive",
+    "LedgerDataArchiveWriter",
+    "XRPLLedgerDataArchiveException",
 ]
@@ -0,0 +1,352 @@
+"""
+Compact on-disk archives of binary ledger state, as returned by the ``ledger_data``
+method with ``binary=True``.
+
+An archive file consists of a fixed-size header, the raw binary ledger entries one
+after another, and an index of fixed-size records sorted by ledger entry ID (the
+``index`` of each entry)::
+
+    header: magic (8) | ledger index (4) | reserved (4) | count (8) | index offset (8)
+    data:   entry | entry | ...
+    index:  [ledger entry ID (32) | offset (8) | length (4) | entry type (2) | pad (2)]
+
+The reader memory-maps the file, so looking up an entry is a binary search over the
+index and memory use does not grow with the size of the snapshot. Entries are only
+decoded when they are accessed.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from types import TracebackType
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Type, Union
+
+from typing_extensions import Final, Self
+
+from xrpl.constants import XRPLException
+from xrpl.core.binarycodec import decode
+from xrpl.core.binarycodec.definitions import (
+    get_field_header_from_name,
+    get_ledger_entry_type_code,
+)
+from xrpl.models.response import Response
+
+_MAGIC: Final[bytes] = b"XRPLLDA1"
+_HEADER: Final[struct.Struct] = struct.Struct(">8sIIQQ")
+_RECORD: Final[struct.Struct] = struct.Struct(">32sQIH2x")
+_KEY_LENGTH: Final[int] = 32
+
+# LedgerEntryType has the lowest field ordinal, so it is always the first field of
+# a serialized ledger entry and can be read without decoding the rest of it.
+_ENTRY_TYPE_HEADER: Final[bytes] = bytes(get_field_header_from_name("LedgerEntryType"))
+
+
+class XRPLLedgerDataArchiveException(XRPLException):
+    """Exception for invalid ledger data archives or archive input."""
+
+    pass
+
+
+def _read_entry_type(blob: bytes) -> int:
+    if not blob.startswith(_ENTRY_TYPE_HEADER):
+        raise XRPLLedgerDataArchiveException(
+            "Ledger entry does not start with a LedgerEntryType field."
+        )
+    start = len(_ENTRY_TYPE_HEADER)
+    return int.from_bytes(blob[start : start + 2], byteorder="big")
+
+
+def _parse_key(ledger_index: str) -> bytes:
+    key = bytes.fromhex(ledger_index)
+    if len(key) != _KEY_LENGTH:
+        raise XRPLLedgerDataArchiveException(
+            f"Ledger entry ID must be {_KEY_LENGTH} bytes, received {ledger_index}."
+        )
+    return key
+
+
+class LedgerDataArchiveWriter:
+    """
+    Writes binary ``ledger_data`` results to a ledger data archive file.
+
+    Entries are appended to the file as they are added. ``ledger_data`` returns
+    entries ordered by ID, in which case the index is written as is; otherwise it is
+    sorted in memory when the archive is closed.
+    """
+
+    def __init__(self: Self, path: str, ledger_index: Optional[int] = None) -> None:
+        """
+        Create a new archive file, replacing any existing file at ``path``.
+
+        Args:
+            path: The path of the archive file.
+            ledger_index: The ledger index of the snapshot. If omitted, it is taken
+                from the first ``ledger_data`` result added.
+        """
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(bytes(_HEADER.size))
+        self._records: BinaryIO = tempfile.TemporaryFile()
+        self._ledger_index = ledger_index
+        self._offset = _HEADER.size
+        self._count = 0
+        self._last_key = b""
+        self._is_sorted = True
+
+    def add_response(
+        self: Self, response: Union[Response, Dict[str, Any]]
+    ) -> Optional[Any]:  # noqa: ANN401
+        """
+        Add all ledger entries from a ``ledger_data`` response made with
+        ``binary=True``.
+
+        Args:
+            response: The ``ledger_data`` response, or its ``result`` dictionary.
+
+        Returns:
+            The ``marker`` of the response, to request the next page with, or
+            ``None`` if this was the last page.
+
+        Raises:
+            XRPLLedgerDataArchiveException: If the response does not contain binary
+                ledger entries.
+        """
+        result = response.result if isinstance(response, Response) else response
+        if self._ledger_index is None and "ledger_index" in result:
+            self._ledger_index = int(result["ledger_index"])
+        for entry in result["state"]:
+            if "data" not in entry:
+                raise XRPLLedgerDataArchiveException(
+                    "Ledger entries must be requested with `binary=True`."
+                )
+            self.add_entry(entry["index"], entry["data"])
+        return result.get("marker")
+
+    def add_entry(self: Self, ledger_index: str, data: Union[str, bytes]) -> None:
+        """
+        Add a single binary ledger entry.
+
+        Args:
+            ledger_index: The ID of the ledger entry, as hex.
+            data: The serialized ledger entry, as hex or bytes.
+        """
+        key = _parse_key(ledger_index)
+        blob = bytes.fromhex(data) if isinstance(data, str) else data
+        entry_type = _read_entry_type(blob)
+
+        self._file.write(blob)
+        self._records.write(_RECORD.pack(key, self._offset, len(blob), entry_type))
+        self._offset += len(blob)
+        self._count += 1
+        if key <= self._last_key:
+            self._is_sorted = False
+        self._last_key = key
+
+    def close(self: Self) -> None:
+        """Write the index and header and close the archive file."""
+        if self._file.closed:
+            return
+        self._records.seek(0)
+        if self._is_sorted:
+            while True:
+                chunk = self._records.read(_RECORD.size * 4096)
+                if not chunk:
+                    break
+                self._file.write(chunk)
+        else:
+            records = self._records.read()
+            size = _RECORD.size
+            for record in sorted(
+                records[i : i + size] for i in range(0, len(records), size)
+            ):
+                self._file.write(record)
+        self._records.close()
+
+        self._file.seek(0)
+        self._file.write(
+            _HEADER.pack(_MAGIC, self._ledger_index or 0, 0, self._count, self._offset)
+        )
+        self._file.close()
+
+    def __enter__(self: Self) -> Self:
+        """
+        Enters a context that closes the archive on exit.
+
+        Returns:
+            The archive.
+        """
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: Type[BaseException],
+        _exc_val: BaseException,
+        _trace: TracebackType,
+    ) -> None:
+        """Exits a context after closing the archive."""
+        self.close()
+
+
+class LedgerDataArchive:
+    """
+    A read-only, memory-mapped view of a ledger data archive file.
+
+    Entries can be looked up by ledger entry ID or iterated in ID order, optionally
+    filtered by ``LedgerEntryType``. Filtering only reads the index, so entries of
+    other types are never read or decoded.
+    """
+
+    def __init__(self: Self, path: str) -> None:
+        """
+        Open an archive file.
+
+        Args:
+            path: The path of the archive file.
+
+        Raises:
+            XRPLLedgerDataArchiveException: If the file is not a ledger data archive.
+        """
+        self._file: BinaryIO = open(path, "rb")
+        try:
+            # checked before mapping it, as an empty file cannot be memory-mapped
+            if os.fstat(self._file.fileno()).st_size < _HEADER.size:
+                raise XRPLLedgerDataArchiveException(f"{path} is not a ledger archive.")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, ledger_index, _, count, index_offset = _HEADER.unpack_from(
+                self._mmap, 0
+            )
+            if magic != _MAGIC or index_offset + count * _RECORD.size != len(
+                self._mmap
+            ):
+                raise XRPLLedgerDataArchiveException(f"{path} is not a ledger archive.")
+        except Exception:
+            self.close()
+            raise
+        self._ledger_index: int = ledger_index
+        self._count: int = count
+        self._index_offset: int = index_offset
+
+    @property
+    def ledger_index(self: Self) -> int:
+        """The ledger index of the snapshot, or 0 if it is unknown."""  # noqa: DAR201
+        return self._ledger_index
+
+    def __len__(self: Self) -> int:
+        """Return the number of ledger entries in the archive."""
+        return self._count
+
+    def __contains__(self: Self, ledger_index: object) -> bool:
+        """Return whether the archive contains the given ledger entry ID."""
+        return isinstance(ledger_index, str) and self._find(ledger_index) is not None
+
+    def _record(self: Self, position: int) -> Tuple[bytes, int, int, int]:
+        return _RECORD.unpack_from(
+            self._mmap, self._index_offset + position * _RECORD.size
+        )
+
+    def _find(self: Self, ledger_index: str) -> Optional[Tuple[int, int]]:
+        key = _parse_key(ledger_index)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start = self._index_offset + middle * _RECORD.size
+            if self._mmap[start : start + _KEY_LENGTH] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._count:
+            return None
+        found_key, offset, length, _ = self._record(low)
+        return (offset, length) if found_key == key else None
+
+    def get_binary(self: Self, ledger_index: str) -> Optional[bytes]:
+        """
+        Return the serialized ledger entry with the given ID.
+
+        Args:
+            ledger_index: The ID of the ledger entry, as hex.
+
+        Returns:
+            The serialized ledger entry, or ``None`` if it is not in the archive.
+        """
+        location = self._find(ledger_index)
+        if location is None:
+            return None
+        offset, length = location
+        return self._mmap[offset : offset + length]
+
+    def get(self: Self, ledger_index: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the decoded ledger entry with the given ID.
+
+        Args:
+            ledger_index: The ID of the ledger entry, as hex.
+
+        Returns:
+            The decoded ledger entry, or ``None`` if it is not in the archive.
+        """
+        blob = self.get_binary(ledger_index)
+        return None if blob is None else decode(blob.hex())
+
+    def iter_binary(
+        self: Self, entry_type: Optional[str] = None
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over serialized ledger entries in ID order.
+
+        Args:
+            entry_type: Only yield entries with this ``LedgerEntryType``, for
+                example ``"AccountRoot"``.
+
+        Yields:
+            (ledger entry ID, serialized ledger entry) pairs.
+        """
+        type_code = (
+            None if entry_type is None else get_ledger_entry_type_code(entry_type)
+        )
+        for position in range(self._count):
+            key, offset, length, record_type = self._record(position)
+            if type_code is None or record_type == type_code:
+                yield key.hex().upper(), self._mmap[offset : offset + length]
+
+    def iter_entries(
+        self: Self, entry_type: Optional[str] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterate over decoded ledger entries in ID order.
+
+        Args:
+            entry_type: Only yield entries with this ``LedgerEntryType``, for
+                example ``"AccountRoot"``.
+
+        Yields:
+            (ledger entry ID, decoded ledger entry) pairs.
+        """
+        for ledger_index, blob in self.iter_binary(entry_type):
+            yield ledger_index, decode(blob.hex())
+
+    def close(self: Self) -> None:
+        """Release the memory map and close the archive file."""
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self: Self) -> Self:
+        """
+        Enters a context that closes the archive on exit.
+
+        Returns:
+            The archive.
+        """
+        return self
+
+    def __exit__(
+        self: Self,
+        _exc_type: Type[BaseException],
+        _exc_val: BaseException,
+        _trace: TracebackType,
+    ) -> None:
+        """Exits a context after closing the archive."""
+        self.close()
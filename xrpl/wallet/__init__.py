@@ -1,7 +1,21 @@
 """Methods for working with XRPL wallets."""
 
-from xrpl.asyncio.wallet import XRPLFaucetException
+from typing import TYPE_CHECKING
+
+from xrpl._lazy_import import attach
 from xrpl.wallet.main import Wallet
-from xrpl.wallet.wallet_generation import generate_faucet_wallet
+
+if TYPE_CHECKING:
+    from xrpl.asyncio.wallet import XRPLFaucetException
+    from xrpl.wallet.wallet_generation import generate_faucet_wallet
+else:
+    # the faucet, which needs the network clients, is imported when first used
+    __getattr__, __dir__ = attach(
+        __name__,
+        submodule_attributes={
+            "..asyncio.wallet": ["XRPLFaucetException"],
+            "wallet_generation": ["generate_faucet_wallet"],
+        },
+    )
 
 __all__ = ["Wallet", "generate_faucet_wallet", "XRPLFaucetException"]
@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Type
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, repeat
+from secrets import token_bytes
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Self
 
 from xrpl.constants import CryptoAlgorithm, XRPLException
 from xrpl.core import addresscodec
-from xrpl.core.addresscodec import classic_address_to_xaddress, ensure_classic_address
+from xrpl.core.addresscodec import (
+    SEED_LENGTH,
+    classic_address_to_xaddress,
+    ensure_classic_address,
+)
 from xrpl.core.addresscodec.exceptions import XRPLAddressCodecException
-from xrpl.core.keypairs import derive_classic_address, derive_keypair, generate_seed
+from xrpl.core.keypairs import (
+    Signer,
+    derive_classic_address,
+    derive_keypair,
+    generate_seed,
+)
 
 
 class Wallet:
@@ -115,6 +139,9 @@ class Wallet:
         )
         """Internal variable for classic_address. Use classic_address instead."""
 
+        self._signer: Optional[Signer] = None
+        """Internal cache for get_signer."""
+
     @classmethod
     def create(
         cls: Type[Self], algorithm: CryptoAlgorithm = CryptoAlgorithm.ED25519
@@ -132,6 +159,57 @@ class Wallet:
         seed = generate_seed(algorithm=algorithm)
         return cls.from_seed(seed, algorithm=algorithm)
 
+    @classmethod
+    def create_many(
+        cls: Type[Self],
+        count: int,
+        algorithm: CryptoAlgorithm = CryptoAlgorithm.ED25519,
+        *,
+        workers: Optional[int] = None,
+        batch_size: int = 256,
+    ) -> Iterator[Self]:
+        """
+        Generates many new seeds and Wallets.
+
+        The wallets are created in batches, each drawing the entropy for all of its
+        seeds from the operating system at once. With ``workers``, the batches are
+        created in a pool of that many processes. Wallets are yielded as their
+        batch completes, with at most two batches per worker in flight, so memory
+        use does not grow with ``count``.
+
+        Args:
+            count: The number of wallets to generate.
+            algorithm: The key-generation algorithm to use when generating the seeds.
+                The default is `ED25519`.
+            workers: The number of processes to generate the wallets in. By
+                default, or if it is 1, they are generated in this process.
+            batch_size: The number of wallets generated together. The default is
+                256.
+
+        Yields:
+            The generated wallets.
+        """
+        batch_sizes = (
+            min(batch_size, count - start) for start in range(0, count, batch_size)
+        )
+        if workers is None or workers <= 1:
+            for size in batch_sizes:
+                yield from _create_batch(cls, size, algorithm)
+            return
+
+        executor = ProcessPoolExecutor(workers)
+        try:
+            pending: Deque[Future[List[Self]]] = deque()
+            for size in batch_sizes:
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_create_batch, cls, size, algorithm))
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # also reached if the caller stops iterating early
+            executor.shutdown(cancel_futures=True)
+
     @classmethod
     def from_seed(
         cls: Type[Self],
@@ -226,34 +304,87 @@ class Wallet:
                 any secret number is not 6. If the checksum of any secret number is
                 invalid.
         """
-        # Logic adapted from xrpl-secret-numbers secretToEntropy function
-        # https://github.com/XRPLF/xrpl.js/blob/main/packages/secret-numbers/src/utils/index.ts
-
-        parsed_secret_numbers = (
-            secret_numbers.split()
-            if isinstance(secret_numbers, str)
-            else secret_numbers
+        entropy = _secret_numbers_to_entropy(secret_numbers)
+        return cls.from_entropy(
+            entropy, master_address=master_address, algorithm=algorithm
         )
 
-        if len(parsed_secret_numbers) != 8:
-            raise XRPLException("There must be 8 secret numbers.")
+    @classmethod
+    def from_seeds_many(
+        cls: Type[Self],
+        seeds: Iterable[str],
+        *,
+        algorithm: Optional[CryptoAlgorithm] = None,
+        workers: Optional[int] = None,
+    ) -> List[Union[Self, XRPLException]]:
+        """
+        Generates a Wallet from each of many seeds (secrets).
 
-        entropy = ""
-        for i, secret_number in enumerate(parsed_secret_numbers):
-            no = int(secret_number[:5])
-            checksum = int(secret_number[5:])
+        Every seed is decoded and its checksum checked before any key is derived,
+        and the keys of the valid seeds are then derived together, in a pool of
+        ``workers`` processes if given. A malformed seed does not stop the others:
+        its exception takes its place in the result.
 
-            if len(secret_number) != 6:
-                raise XRPLException("Each secret number must be 6 digits long.")
-            if no * (i * 2 + 1) % 9 != checksum:
-                raise XRPLException(f"Checksum of secret number {i} is invalid.")
+        Args:
+            seeds: The seeds (secrets) used to derive the account keys.
+            algorithm: The key-generation algorithm to use. When omitted, the algorithm
+                is inferred from each seed's prefix, as in :meth:`from_seed`.
+            workers: The number of processes to derive the keys in. By default, or
+                if it is 1, they are derived in this process.
 
-            hexed = hex(no)[2:].zfill(4)
-            entropy += hexed
+        Returns:
+            For each seed, in order, its wallet, or the exception explaining why the
+            seed is invalid.
+        """
+        entries: List[Union[str, XRPLException]] = []
+        for seed in seeds:
+            try:
+                addresscodec.decode_seed(seed, algorithm)
+                entries.append(seed)
+            except XRPLException as error:
+                entries.append(error)
+            except ValueError as error:
+                # the base58 decoder rejects characters outside its alphabet
+                entries.append(XRPLAddressCodecException(f"Invalid seed: {error}"))
+        return _from_seed_entries(cls, entries, algorithm, workers)
 
-        return cls.from_entropy(
-            entropy, master_address=master_address, algorithm=algorithm
-        )
+    @classmethod
+    def from_secret_numbers_many(
+        cls: Type[Self],
+        secret_numbers: Iterable[List[str] | str],
+        *,
+        algorithm: CryptoAlgorithm = CryptoAlgorithm.ED25519,
+        workers: Optional[int] = None,
+    ) -> List[Union[Self, XRPLException]]:
+        """
+        Generates a Wallet from each of many sets of secret numbers.
+
+        The checksums of every set are checked before any key is derived, and the
+        keys of the valid sets are then derived together, in a pool of ``workers``
+        processes if given. A malformed set does not stop the others: its
+        exception takes its place in the result.
+
+        Args:
+            secret_numbers: The sets of secret numbers, each a string (whitespace
+                delimited) or string array of 8 times 6 numbers.
+            algorithm: The digital signature algorithm to generate addresses for.
+                The default is `ED25519`.
+            workers: The number of processes to derive the keys in. By default, or
+                if it is 1, they are derived in this process.
+
+        Returns:
+            For each set of secret numbers, in order, its wallet, or the exception
+            explaining why the set is invalid.
+        """
+        entries: List[Union[str, XRPLException]] = []
+        for numbers in secret_numbers:
+            try:
+                entries.append(
+                    generate_seed(_secret_numbers_to_entropy(numbers), algorithm)
+                )
+            except XRPLException as error:
+                entries.append(error)
+        return _from_seed_entries(cls, entries, algorithm, workers)
 
     def get_xaddress(
         self: Self, *, tag: Optional[int] = None, is_test: bool = False
@@ -271,6 +402,31 @@ class Wallet:
         """
         return classic_address_to_xaddress(self.address, tag, is_test)
 
+    def get_signer(self: Self) -> Signer:
+        """
+        Returns a signer for this wallet's private key, which parses the key only
+        once to sign many messages.
+
+        The signer is created on first use and reused afterwards, until the
+        wallet's private key changes.
+
+        Returns:
+            A signer for this wallet's private key.
+        """
+        if self._signer is None or self._signer.private_key != self.private_key:
+            self._signer = Signer(self.private_key)
+        return self._signer
+
+    def __getstate__(self: Self) -> Dict[str, Any]:
+        """
+        Returns the state of a Wallet to pickle, without the cached signer, whose
+        backend key objects may not be picklable. It is created again on first use.
+
+        Returns:
+            The attributes of the Wallet, without the cached signer.
+        """
+        return {**self.__dict__, "_signer": None}
+
     def __str__(self: Self) -> str:
         """
         Returns a string representation of a Wallet.
@@ -285,3 +441,91 @@ class Wallet:
                 f"classic_address: {self.address}",
             ]
         )
+
+
+_WalletT = TypeVar("_WalletT", bound=Wallet)
+
+
+def _secret_numbers_to_entropy(secret_numbers: List[str] | str) -> str:
+    # Logic adapted from xrpl-secret-numbers secretToEntropy function
+    # https://github.com/XRPLF/xrpl.js/blob/main/packages/secret-numbers/src/utils/index.ts
+
+    parsed_secret_numbers = (
+        secret_numbers.split() if isinstance(secret_numbers, str) else secret_numbers
+    )
+
+    if len(parsed_secret_numbers) != 8:
+        raise XRPLException("There must be 8 secret numbers.")
+
+    entropy = ""
+    for i, secret_number in enumerate(parsed_secret_numbers):
+        if len(secret_number) != 6 or not secret_number.isdigit():
+            raise XRPLException("Each secret number must be 6 digits long.")
+
+        no = int(secret_number[:5])
+        checksum = int(secret_number[5:])
+        if no * (i * 2 + 1) % 9 != checksum:
+            raise XRPLException(f"Checksum of secret number {i} is invalid.")
+
+        hexed = hex(no)[2:].zfill(4)
+        entropy += hexed
+
+    return entropy
+
+
+def _from_seed_entries(
+    cls: Type[_WalletT],
+    entries: List[Union[str, XRPLException]],
+    algorithm: Optional[CryptoAlgorithm],
+    workers: Optional[int],
+) -> List[Union[_WalletT, XRPLException]]:
+    """Derive the wallets of the seeds in ``entries``, leaving the errors in place."""
+    seeds = [entry for entry in entries if isinstance(entry, str)]
+    chunk_count = max(workers or 1, 1)
+    chunk_size = max(-(-len(seeds) // chunk_count), 1)
+    chunks = [
+        seeds[start : start + chunk_size] for start in range(0, len(seeds), chunk_size)
+    ]
+    if chunk_count == 1:
+        derived = [_from_seed_batch(cls, chunk, algorithm) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(chunk_count) as executor:
+            derived = list(
+                executor.map(
+                    _from_seed_batch,
+                    repeat(cls),
+                    chunks,
+                    repeat(algorithm),
+                )
+            )
+
+    wallets = chain.from_iterable(derived)
+    return [
+        entry if isinstance(entry, XRPLException) else next(wallets)
+        for entry in entries
+    ]
+
+
+def _from_seed_batch(
+    cls: Type[_WalletT], seeds: List[str], algorithm: Optional[CryptoAlgorithm]
+) -> List[Union[_WalletT, XRPLException]]:
+    results: List[Union[_WalletT, XRPLException]] = []
+    for seed in seeds:
+        try:
+            results.append(cls.from_seed(seed, algorithm=algorithm))
+        except XRPLException as error:
+            results.append(error)
+    return results
+
+
+def _create_batch(
+    cls: Type[_WalletT], count: int, algorithm: CryptoAlgorithm
+) -> List[_WalletT]:
+    entropy = token_bytes(SEED_LENGTH * count)
+    return [
+        cls.from_seed(
+            generate_seed(entropy[start : start + SEED_LENGTH].hex(), algorithm),
+            algorithm=algorithm,
+        )
+        for start in range(0, len(entropy), SEED_LENGTH)
+    ]